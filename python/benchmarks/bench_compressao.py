@@ -0,0 +1,100 @@
+"""
+Benchmark da compressão de requisições e respostas do Client.
+
+Mede bytes na rede e decodificados (Client.get_transfer_stats) e o tempo
+por operação para listagens (GET), exportações lidas em stream e POSTs,
+sem compressão, com gzip e com br (se o brotli estiver instalado). Os
+itens simulados são repetitivos e comprimem melhor que dados reais: use
+as razões como limite superior.
+
+Uso:
+    python benchmarks/bench_compressao.py [--ops 200] [--latency-ms 0]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from mock_server import MockApiServer, MockConfig, itens
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+class TokenFixo:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def get_access_token(self, id: str) -> str:
+        return "token-benchmark"
+
+
+def medir(client: Any, operacao: Callable[[], Any], ops: int) -> Dict[str, Any]:
+    """Executa a operação ops vezes e junta tempo e bytes transferidos."""
+    inicio = time.perf_counter()
+    for _ in range(ops):
+        operacao()
+    duracao = time.perf_counter() - inicio
+    return {"ms_op": duracao / ops * 1000, **client.get_transfer_stats()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    from src.clients.client import Client
+    from src.utils.compression import brotli_available
+
+    codificacoes: List[Optional[str]] = [None, "gzip"] + (["br"] if brotli_available() else [])
+    config = MockConfig(latency_ms=args.latency_ms, check_tokens=False, compress_responses=True)
+    corpo = {"itens": itens(0, 200)}
+
+    print(
+        f"{'operação':<12}{'codificação':<13}{'ms/op':>8}{'KB rede':>10}"
+        f"{'KB dados':>10}{'razão':>7}"
+    )
+    with MockApiServer(config) as servidor:
+        for codificacao in codificacoes:
+            nome = codificacao or "identity"
+
+            def novo_client(codificacao: Optional[str] = codificacao) -> Any:
+                return Client(
+                    TokenFixo(),
+                    max_retries=1,
+                    retry_delay=0,
+                    request_compression=codificacao,
+                    compression_min_size=0,
+                    accept_encoding=codificacao or "identity",
+                )
+
+            cenarios = {
+                "listagem": lambda c: c.get(f"{servidor.url}/api/itens?limite=500", "loja"),
+                "stream": lambda c: sum(
+                    1 for _ in c.stream_items(f"{servidor.url}/api/exportacao?itens=20000", "loja")
+                ),
+                "post": lambda c: c.post(f"{servidor.url}/api/itens", corpo, "loja"),
+            }
+            for operacao, executar in cenarios.items():
+                with novo_client() as client:
+                    ops = args.ops // 20 if operacao == "stream" else args.ops
+                    r = medir(
+                        client,
+                        lambda executar=executar, client=client: executar(client),
+                        max(ops, 1),
+                    )
+                if operacao == "post":
+                    rede, dados = r["request_wire_bytes"], r["request_bytes"]
+                else:
+                    rede, dados = r["response_wire_bytes"], r["response_bytes"]
+                print(
+                    f"{operacao:<12}{nome:<13}{r['ms_op']:>8.2f}{rede / 1024:>10.1f}"
+                    f"{dados / 1024:>10.1f}{rede / dados if dados else 1.0:>7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark da fila de escrita do Client.
+
+Envia os mesmos itens de várias lojas ao servidor simulado com POSTs
+sequenciais e pela WriteQueue (sem ordem, com ordem por loja e em lotes),
+e mede itens por segundo, requisições enviadas e esperas por espaço na
+fila.
+
+Uso:
+    python benchmarks/bench_escrita.py [--lojas 20] [--itens 100] [--latency-ms 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from mock_server import MockApiServer, MockConfig
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+class TokenFixo:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def get_access_token(self, id: str) -> str:
+        return "token-benchmark"
+
+
+def sequencial(client: Any, url: str, lojas: int, itens: int) -> Dict[str, Any]:
+    """Um POST bloqueante por item, como os jobs de ingestão fazem hoje."""
+    for n in range(itens):
+        for loja in range(lojas):
+            client.post(url, {"item": n}, f"loja-{loja}")
+    return {"requests": lojas * itens, "blocked": 0}
+
+
+def fila(client: Any, url: str, lojas: int, itens: int, **opcoes: Any) -> Dict[str, Any]:
+    """Submete todos os itens à fila e aguarda o envio."""
+    with client.write_queue(**opcoes) as writes:
+        futures = [
+            writes.submit(url, {"item": n}, f"loja-{loja}")
+            for n in range(itens)
+            for loja in range(lojas)
+        ]
+        writes.flush()
+        stats = writes.get_stats()
+    erros = sum(1 for future in futures if future.exception() is not None)
+    if erros:
+        raise RuntimeError(f"{erros} itens com erro")
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lojas", type=int, default=20)
+    parser.add_argument("--itens", type=int, default=100, help="itens por loja")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--max-pending", type=int, default=500)
+    args = parser.parse_args()
+
+    from src.clients.client import Client
+
+    config = MockConfig(latency_ms=args.latency_ms, check_tokens=False)
+    total = args.lojas * args.itens
+    comum = {"max_in_flight": args.workers, "max_pending": args.max_pending}
+    cenarios: Dict[str, Optional[Dict[str, Any]]] = {
+        "sequencial": None,
+        "fila": comum,
+        "fila_ordenada": {**comum, "ordered": True},
+        "fila_lote": {**comum, "batch_size": args.batch_size},
+        "fila_lote_ordenada": {**comum, "batch_size": args.batch_size, "ordered": True},
+    }
+
+    print(f"{'cenário':<20}{'itens/s':>10}{'requisições':>13}{'esperas':>9}")
+    with MockApiServer(config) as servidor:
+        url = f"{servidor.url}/api/itens"
+        for nome, opcoes in cenarios.items():
+            with Client(
+                TokenFixo(), max_retries=1, retry_delay=0, pool_maxsize=args.workers
+            ) as client:
+                inicio = time.perf_counter()
+                if opcoes is None:
+                    stats = sequencial(client, url, args.lojas, args.itens)
+                else:
+                    stats = fila(client, url, args.lojas, args.itens, **opcoes)
+                duracao = time.perf_counter() - inicio
+            print(
+                f"{nome:<20}{total / duracao:>10.0f}{stats['requests']:>13}"
+                f"{stats['blocked']:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark dos transportes HTTP/1.1 e HTTP/2 do Client.
+
+Dispara GETs concorrentes contra o servidor simulado em HTTP/1.1
+(mock_server.py) e em HTTP/2 h2c (mock_h2_server.py), com a mesma
+latência, e compara vazão, latência p50/p99 e conexões abertas no
+servidor. Em produção o HTTP/2 é negociado por ALPN sobre TLS; aqui os
+servidores locais são em texto claro, e o transporte HTTP/2 usa
+conhecimento prévio.
+
+Uso:
+    python benchmarks/bench_http2.py [--requests 2000] [--concurrency 64]
+        [--pool-maxsize 10] [--latency-ms 20]
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from mock_h2_server import MockHttp2Server
+from mock_server import MockApiServer, MockConfig
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+class TokenFixo:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def get_access_token(self, id: str) -> str:
+        return "token-benchmark"
+
+
+def _percentil(ordenadas: List[float], fracao: float) -> float:
+    if not ordenadas:
+        return 0.0
+    return ordenadas[min(int(len(ordenadas) * fracao), len(ordenadas) - 1)]
+
+
+def medir(client: Any, url: str, total: int, concorrencia: int) -> Dict[str, Any]:
+    """Executa total GETs com concorrencia threads e mede cada chamada."""
+    latencias: List[float] = []
+    erros = 0
+
+    def chamada(i: int) -> None:
+        nonlocal erros
+        inicio = time.perf_counter()
+        resposta = client.get(f"{url}/api/itens?pagina={i % 10 + 1}&limite=20", f"loja-{i % 50}")
+        latencias.append(time.perf_counter() - inicio)
+        if not isinstance(resposta, dict) or "data" not in resposta:
+            erros += 1
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(chamada, range(total)))
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "ops": total,
+        "erros": erros,
+        "rps": total / duracao,
+        "p50_ms": _percentil(latencias, 0.5) * 1000,
+        "p99_ms": _percentil(latencias, 0.99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--pool-maxsize", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    from src.clients.client import Client
+    from src.clients.http2_transport import Http2Transport
+
+    config = MockConfig(latency_ms=args.latency_ms, check_tokens=False)
+    cenarios = [
+        ("HTTP/1.1", MockApiServer(config), lambda: None),
+        (
+            "HTTP/2",
+            MockHttp2Server(config),
+            lambda: Http2Transport(max_connections=args.pool_maxsize, prior_knowledge=True),
+        ),
+    ]
+
+    print(
+        f"{'transporte':<12}{'ops':>7}{'erros':>7}{'rps':>10}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'conexões':>10}"
+    )
+    for nome, servidor, transporte in cenarios:
+        with servidor:
+            client = Client(
+                TokenFixo(),
+                max_retries=1,
+                retry_delay=0,
+                pool_maxsize=args.pool_maxsize,
+                transport=transporte(),
+            )
+            with client:
+                # Aquecimento: abre as conexões antes da medição
+                medir(client, servidor.url, args.concurrency, args.concurrency)
+                resultado = medir(client, servidor.url, args.requests, args.concurrency)
+            conexoes = servidor.get_stats()["connections"]
+        print(
+            f"{nome:<12}{resultado['ops']:>7}{resultado['erros']:>7}{resultado['rps']:>10.1f}"
+            f"{resultado['p50_ms']:>9.2f}{resultado['p99_ms']:>9.2f}{conexoes:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Orçamento de tempo de importação do pacote.
+
+Cada módulo é importado em um interpretador novo; a mediana do tempo de
+importação deve ficar dentro do orçamento e as dependências pesadas
+listadas não podem ser carregadas. Termina com código 1 se algum limite
+for violado, para uso em CI.
+
+Uso:
+    python benchmarks/bench_import.py [--repeats 5] [--scale 1.0] [--top 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+PESADAS = ("requests", "httpx", "cryptography", "orjson", "pandas", "opentelemetry")
+# Os clientes só são carregados no primeiro acesso (src.client, create_client)
+LEVES = PESADAS + ("asyncio", "src.clients")
+
+# Módulo -> (orçamento em ms, módulos que não podem ser importados)
+ORCAMENTOS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "src": (15.0, LEVES),
+    "src.factories": (15.0, LEVES),
+    "src.factories.factory": (40.0, LEVES),
+    "src.services.token_manager": (40.0, LEVES),
+    "src.services.encryption_service": (80.0, ("requests", "httpx", "pandas")),
+    "src.clients.client": (
+        250.0,
+        ("httpx", "cryptography", "orjson", "pandas", "opentelemetry"),
+    ),
+}
+
+
+def medir(modulo: str) -> Dict[str, Any]:
+    """Importa o módulo em um interpretador novo e retorna tempo e módulos carregados."""
+    codigo = (
+        "import json, sys, time; sys.path.insert(0, sys.argv[1]); "
+        "t = time.perf_counter(); "
+        f"__import__({modulo!r}); "
+        "ms = (time.perf_counter() - t) * 1000; "
+        "print(json.dumps({'ms': ms, 'modulos': sorted(sys.modules)}))"
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo, str(RAIZ)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(saida.stdout)
+
+
+def proibidos_carregados(modulos: List[str], proibidos: Tuple[str, ...]) -> List[str]:
+    """Módulos proibidos (ou seus submódulos) presentes em modulos."""
+    return sorted(
+        {p for p in proibidos for m in modulos if m == p or m.startswith(f"{p}.")}
+    )
+
+
+def _importtime(codigo: str) -> List[Tuple[int, str]]:
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=RAIZ,
+    )
+    linhas = []
+    for linha in saida.stderr.splitlines():
+        partes = linha.split("|")
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue
+        linhas.append((int(partes[1]), partes[2].strip()))
+    return linhas
+
+
+def mais_lentos(modulo: str, top: int) -> List[Tuple[int, str]]:
+    """Módulos com maior tempo acumulado segundo python -X importtime."""
+    # Descarta o que o interpretador já importa na inicialização (site, .pth)
+    inicializacao = {nome for _, nome in _importtime("pass")}
+    linhas = [l for l in _importtime(f"import {modulo}") if l[1] not in inicializacao]
+    return sorted(linhas, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplicador dos orçamentos (máquinas lentas)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=0, help="mostra os N módulos mais lentos de cada importação"
+    )
+    args = parser.parse_args()
+
+    falhas = 0
+    for modulo, (orcamento, proibidas) in ORCAMENTOS.items():
+        medicoes = [medir(modulo) for _ in range(args.repeats)]
+        ms = statistics.median(m["ms"] for m in medicoes)
+        limite = orcamento * args.scale
+        carregadas = proibidos_carregados(medicoes[0]["modulos"], proibidas)
+        ok = ms <= limite and not carregadas
+        falhas += not ok
+        situacao = "ok" if ok else "FALHOU"
+        print(f"{modulo:34s} {ms:8.1f} ms (orçamento {limite:6.1f} ms)  {situacao}")
+        if carregadas:
+            print(f"    importou módulos proibidos: {', '.join(carregadas)}")
+        for acumulado, nome in mais_lentos(modulo, args.top) if args.top else []:
+            print(f"    {acumulado / 1000:8.1f} ms  {nome}")
+
+    if falhas:
+        print(f"{falhas} módulo(s) fora do orçamento")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark do TenantRunner: vazão com 1 e com vários processos worker.
+
+Cada loja busca uma página no servidor simulado e decodifica o corpo
+várias vezes (--decodificacoes), simulando o trabalho de CPU que prende um
+único processo no GIL. O ganho esperado acompanha o número de núcleos
+disponíveis; em máquina com um núcleo, a vazão não muda.
+
+Uso:
+    python benchmarks/bench_processos.py [--lojas 200] [--workers 1,2,4]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, List
+
+from mock_server import MockApiServer, MockConfig
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+class TokenFixo:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def get_access_token(self, id: str) -> str:
+        return "token-benchmark"
+
+
+class Contexto:
+    """Contexto do worker com cliente sem factory (sem credenciais reais)."""
+
+    def __init__(self, index: int):
+        from src.clients.client import Client
+
+        self.index = index
+        self.client = Client(TokenFixo(), max_retries=1, retry_delay=0)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def job(contexto: Contexto, id: str) -> int:
+    """Busca a página da loja e a decodifica repetidas vezes."""
+    url = os.environ["BENCH_URL"]
+    pagina = contexto.client.get(url, id)
+    corpo = json.dumps(pagina)
+    for _ in range(int(os.environ["BENCH_DECODIFICACOES"])):
+        json.loads(corpo)
+    return len(pagina["data"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lojas", type=int, default=200)
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}")
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--decodificacoes", type=int, default=20)
+    args = parser.parse_args()
+
+    from src.services.tenant_runner import TenantRunner
+
+    contagens: List[int] = sorted({int(n) for n in args.workers.split(",")})
+    lojas = [f"loja-{i}" for i in range(args.lojas)]
+    print(f"{'workers':>8}{'lojas/s':>10}{'itens/s':>10}{'s':>8}")
+    with MockApiServer(MockConfig(check_tokens=False)) as servidor:
+        # Os workers (spawn) herdam o ambiente: é como recebem a configuração
+        os.environ["BENCH_URL"] = f"{servidor.url}/api/itens?limite=500&total=500"
+        os.environ["BENCH_DECODIFICACOES"] = str(args.decodificacoes)
+        for workers in contagens:
+            with TenantRunner(
+                job, workers=workers, threads=args.threads, context_factory=Contexto
+            ) as runner:
+                # Rodada de aquecimento: inicia os processos e abre as conexões
+                runner.run(lojas[:workers])
+                r: Any = runner.run(lojas)
+            print(
+                f"{workers:>8}{r['tenants_per_second']:>10.1f}"
+                f"{r['items_per_second']:>10.0f}{r['seconds']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
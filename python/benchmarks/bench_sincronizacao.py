@@ -0,0 +1,98 @@
+"""
+Benchmark da sincronização incremental.
+
+Compara, no servidor simulado, a releitura completa da listagem a cada
+execução com a sincronização incremental (IncrementalSync) depois de
+alterar uma fração dos itens, e mede a retomada de uma execução
+interrompida no meio.
+
+Uso:
+    python benchmarks/bench_sincronizacao.py [--total 20000] [--alterados 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from mock_server import MockApiServer, MockConfig
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+class TokenFixo:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def get_access_token(self, id: str) -> str:
+        return "token-benchmark"
+
+
+def medir(servidor: MockApiServer, execucao: Callable[[], int]) -> Dict[str, Any]:
+    """Executa a sincronização e conta itens, requisições e tempo."""
+    servidor.reset_stats()
+    inicio = time.perf_counter()
+    itens = execucao()
+    duracao = time.perf_counter() - inicio
+    return {"itens": itens, "requisicoes": servidor.get_stats().get("200", 0), "s": duracao}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--total", type=int, default=20000)
+    parser.add_argument("--alterados", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    from src.clients.client import Client
+    from src.repositories.checkpoint_repository import CheckpointRepository
+    from src.services.incremental_sync import IncrementalSync, SyncResource
+
+    config = MockConfig(latency_ms=args.latency_ms, check_tokens=False)
+    with tempfile.TemporaryDirectory() as pasta, MockApiServer(config) as servidor:
+        url = f"{servidor.url}/api/alteracoes?total={args.total}"
+        recurso = SyncResource("itens", url, since_param="desde", updated_field="alterado_em")
+        with Client(TokenFixo(), max_retries=1, retry_delay=0) as client:
+            sync = IncrementalSync(
+                client, CheckpointRepository(os.path.join(pasta, "checkpoints.sqlite3"))
+            )
+
+            def completa() -> int:
+                return sum(1 for _ in client.iter_items(url, "loja"))
+
+            def incremental() -> int:
+                return sum(1 for _ in sync.iter_items("loja", recurso))
+
+            def interrompida() -> int:
+                # Processa metade das páginas alteradas e "cai"
+                paginas = sync.iter_pages("loja", recurso)
+                itens = 0
+                for _ in range(max(args.alterados // 200, 1)):
+                    itens += len(next(paginas))
+                next(paginas, None)
+                return itens
+
+            def alterar() -> None:
+                servidor.change(random.sample(range(args.total), args.alterados))
+
+            resultados = {"primeira (completa)": medir(servidor, incremental)}
+            alterar()
+            resultados["releitura completa"] = medir(servidor, completa)
+            resultados["incremental"] = medir(servidor, incremental)
+            resultados["sem alterações"] = medir(servidor, incremental)
+            alterar()
+            resultados["interrompida"] = medir(servidor, interrompida)
+            resultados["retomada"] = medir(servidor, incremental)
+
+    print(f"{'execução':<22}{'itens':>8}{'requisições':>13}{'ms':>9}")
+    for nome, r in resultados.items():
+        print(f"{nome:<22}{r['itens']:>8}{r['requisicoes']:>13}{r['s'] * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
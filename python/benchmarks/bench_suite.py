@@ -0,0 +1,470 @@
+"""
+Benchmarks de Client, AsyncClient, TokenManager e EncryptionService.
+
+Cada cenário roda em um processo próprio contra o servidor simulado
+(mock_server.py), executado no processo principal. São medidos latência
+p50/p99, requisições por segundo, erros e pico de memória (RSS máximo do
+processo do cenário). Os resultados podem ser salvos e comparados com uma
+execução anterior para detectar regressões.
+
+Uso:
+    python benchmarks/bench_suite.py [--scenarios client_get,encryption_decrypt]
+        [--requests 2000] [--concurrency 16] [--latency-ms 2]
+        [--save resultado.json] [--compare base.json] [--tolerance 0.15]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mock_server import MockApiServer, MockConfig
+
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+TENANTS = 50
+
+
+class Cenario:
+    """Cenário de benchmark: comportamento do servidor e operação medida."""
+
+    def __init__(
+        self,
+        nome: str,
+        descricao: str,
+        executar: Callable[[argparse.Namespace], Dict[str, Any]],
+        servidor: Optional[Dict[str, Any]] = None,
+        requests_fator: float = 1.0,
+    ):
+        """
+        Inicializa o cenário.
+
+        Args:
+            nome: Nome usado na linha de comando e nos resultados
+            descricao: Descrição curta exibida no relatório
+            executar: Função executada no processo do cenário
+            servidor: Parâmetros de MockConfig (além da latência da linha de comando)
+            requests_fator: Fração de --requests usada pelo cenário
+        """
+        self.nome = nome
+        self.descricao = descricao
+        self.executar = executar
+        self.servidor = servidor or {}
+        self.requests_fator = requests_fator
+
+
+# --- Execução dentro do processo do cenário -----------------------------------
+
+
+def _medir(
+    operacao: Callable[[int], Any], total: int, concorrencia: int
+) -> Dict[str, Any]:
+    """Executa a operação total vezes com N threads e resume as latências."""
+    latencias = [0.0] * total
+    erros: List[int] = []
+
+    def tarefa(i: int) -> None:
+        inicio = time.perf_counter()
+        try:
+            operacao(i)
+        except Exception:
+            erros.append(i)
+        latencias[i] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(tarefa, range(total)))
+    return _resumo(latencias, time.perf_counter() - inicio, len(erros))
+
+
+async def _medir_async(
+    operacao: Callable[[int], Any], total: int, concorrencia: int
+) -> Dict[str, Any]:
+    """Versão asyncio de _medir: N corrotinas consumindo as operações."""
+    latencias = [0.0] * total
+    erros: List[int] = []
+    proxima = iter(range(total))
+
+    async def trabalhador() -> None:
+        for i in proxima:
+            inicio = time.perf_counter()
+            try:
+                await operacao(i)
+            except Exception:
+                erros.append(i)
+            latencias[i] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabalhador() for _ in range(concorrencia)))
+    return _resumo(latencias, time.perf_counter() - inicio, len(erros))
+
+
+def _resumo(latencias: List[float], duracao: float, erros: int) -> Dict[str, Any]:
+    ordenadas = sorted(latencias)
+    return {
+        "ops": len(latencias),
+        "errors": erros,
+        "seconds": duracao,
+        "rps": len(latencias) / duracao if duracao else 0.0,
+        "p50_ms": _percentil(ordenadas, 0.50) * 1000,
+        "p99_ms": _percentil(ordenadas, 0.99) * 1000,
+    }
+
+
+def _percentil(ordenadas: List[float], fracao: float) -> float:
+    if not ordenadas:
+        return 0.0
+    return ordenadas[min(int(len(ordenadas) * fracao), len(ordenadas) - 1)]
+
+
+def _ambiente(url: str) -> Tuple[Any, Any]:
+    """Monta EncryptionService e TokenManager ligados ao OAuth simulado."""
+    os.environ.setdefault("CHAVE_CRIPTOGRAFIA", _chave_teste())
+
+    import requests
+
+    from src.interfaces.credentials_repository_interface import ICredentialsRepository
+    from src.services.encryption_service import EncryptionService
+    from src.services.token_manager import TokenManager
+
+    class RepositorioMemoria(ICredentialsRepository):
+        """Credenciais em memória, com o refresh token cifrado como no BigQuery."""
+
+        def __init__(self, encryption_service: EncryptionService):
+            self._encryption_service = encryption_service
+            self._linhas: Dict[str, Dict[str, Any]] = {}
+
+        def get_credentials(self, id: str) -> Dict[str, Any]:
+            linha = self._linhas.get(id)
+            if linha is None:
+                return {"access_token": "", "refresh_token": "", "validade": ""}
+            return {
+                **linha,
+                "refresh_token": self._encryption_service.decrypt(linha["refresh_token"]),
+            }
+
+        def save_token(self, id: str, token: Dict[str, Any]) -> None:
+            self._linhas[id] = {
+                **token,
+                "refresh_token": self._encryption_service.encrypt(token["refresh_token"]),
+            }
+
+    class TokenManagerSimulado(TokenManager):
+        """TokenManager cujo refresh chama o endpoint OAuth simulado."""
+
+        _sessao = requests.Session()
+
+        def refresh_token(self, id: str, cred: Dict[str, Any]) -> Dict[str, Any]:
+            resposta = self._sessao.post(
+                f"{url}/oauth/token",
+                data={"grant_type": "refresh_token", "refresh_token": cred["refresh_token"]},
+            ).json()
+            validade = datetime.now() + timedelta(seconds=resposta["expires_in"])
+            return {
+                "access_token": resposta["access_token"],
+                "refresh_token": resposta["refresh_token"],
+                "validade": validade.isoformat(),
+            }
+
+    encryption_service = EncryptionService(cache_size=1000)
+    repositorio = RepositorioMemoria(encryption_service)
+    for i in range(TENANTS):
+        repositorio.save_token(
+            f"loja-{i}", {"access_token": "", "refresh_token": f"r{i}", "validade": "2000-01-01"}
+        )
+    return encryption_service, TokenManagerSimulado(repositorio)
+
+
+def _chave_teste() -> str:
+    from cryptography.fernet import Fernet
+
+    return Fernet.generate_key().decode()
+
+
+def _client(url: str, **kwargs: Any) -> Any:
+    _, token_manager = _ambiente(url)
+    from src.clients.client import Client
+    from src.services.retry_policy import RetryPolicy
+
+    return Client(
+        token_manager,
+        max_retries=5,
+        retry_delay=0.01,
+        pool_maxsize=64,
+        retry_policy=RetryPolicy(max_attempts=5, base_delay=0.01, max_delay=0.1),
+        **kwargs,
+    )
+
+
+def cenario_client_get(args: argparse.Namespace) -> Dict[str, Any]:
+    client = _client(args.url)
+    url = f"{args.url}/api/itens?pagina=1&limite=20"
+    return _medir(lambda i: client.get(url, f"loja-{i % TENANTS}"), args.requests, args.concurrency)
+
+
+def cenario_client_large(args: argparse.Namespace) -> Dict[str, Any]:
+    client = _client(args.url)
+    url = f"{args.url}/api/exportacao?itens=50000"
+    return _medir(lambda i: len(client.get(url, "loja-0")["data"]), args.requests, 1)
+
+
+def cenario_client_stream(args: argparse.Namespace) -> Dict[str, Any]:
+    client = _client(args.url)
+    url = f"{args.url}/api/exportacao?itens=50000"
+    return _medir(lambda i: sum(1 for _ in client.stream_items(url, "loja-0")), args.requests, 1)
+
+
+def cenario_async_client_get(args: argparse.Namespace) -> Dict[str, Any]:
+    _, token_manager = _ambiente(args.url)
+    from src.clients.async_client import AsyncClient
+    from src.services.retry_policy import RetryPolicy
+
+    async def executar() -> Dict[str, Any]:
+        client = AsyncClient(
+            token_manager,
+            max_retries=5,
+            retry_delay=0.01,
+            max_concurrency=args.concurrency,
+            retry_policy=RetryPolicy(max_attempts=5, base_delay=0.01, max_delay=0.1),
+        )
+        url = f"{args.url}/api/itens?pagina=1&limite=20"
+        try:
+            return await _medir_async(
+                lambda i: client.get(url, f"loja-{i % TENANTS}"), args.requests, args.concurrency
+            )
+        finally:
+            await client.aclose()
+
+    return asyncio.run(executar())
+
+
+def cenario_token_manager_hit(args: argparse.Namespace) -> Dict[str, Any]:
+    _, token_manager = _ambiente(args.url)
+    for i in range(TENANTS):
+        token_manager.get_access_token(f"loja-{i}")
+    return _medir(
+        lambda i: token_manager.get_access_token(f"loja-{i % TENANTS}"),
+        args.requests * 10,
+        args.concurrency,
+    )
+
+
+def cenario_token_manager_refresh(args: argparse.Namespace) -> Dict[str, Any]:
+    _, token_manager = _ambiente(args.url)
+
+    def refresh(i: int) -> None:
+        id = f"loja-{i % TENANTS}"
+        token_manager.force_refreshing_token(id, stale_token=token_manager.get_access_token(id))
+
+    return _medir(refresh, args.requests, args.concurrency)
+
+
+def cenario_encryption_decrypt(args: argparse.Namespace) -> Dict[str, Any]:
+    os.environ.setdefault("CHAVE_CRIPTOGRAFIA", _chave_teste())
+    from src.services.encryption_service import EncryptionService
+
+    service = EncryptionService()
+    valores = [service.encrypt(f"refresh-token-{i}") for i in range(TENANTS)]
+    return _medir(
+        lambda i: service.decrypt(valores[i % TENANTS]), args.requests * 10, args.concurrency
+    )
+
+
+def cenario_encryption_decrypt_many(args: argparse.Namespace) -> Dict[str, Any]:
+    os.environ.setdefault("CHAVE_CRIPTOGRAFIA", _chave_teste())
+    from src.services.encryption_service import EncryptionService
+
+    service = EncryptionService(batch_threshold=64)
+    lote = [service.encrypt(f"refresh-token-{i}") for i in range(1000)]
+    resultado = _medir(lambda i: service.decrypt_many(lote), max(args.requests // 100, 5), 1)
+    service.close()
+    # Uma operação = um lote; rps em valores descriptografados por segundo
+    resultado["rps"] *= len(lote)
+    return resultado
+
+
+CENARIOS = {
+    c.nome: c
+    for c in (
+        Cenario("client_get", "Client.get, 50 lojas", cenario_client_get),
+        Cenario(
+            "client_errors",
+            "Client.get com 2% 401, 5% 429, 2% 503",
+            cenario_client_get,
+            servidor={"p401": 0.02, "p429": 0.05, "p503": 0.02},
+        ),
+        Cenario(
+            "client_large",
+            "Client.get de 50 mil itens",
+            cenario_client_large,
+            requests_fator=0.005,
+        ),
+        Cenario(
+            "client_stream",
+            "Client.stream_items de 50 mil itens",
+            cenario_client_stream,
+            requests_fator=0.005,
+        ),
+        Cenario("async_client_get", "AsyncClient.get, 50 lojas", cenario_async_client_get),
+        Cenario("token_manager_hit", "get_access_token em cache", cenario_token_manager_hit),
+        Cenario(
+            "token_manager_refresh",
+            "force_refreshing_token com OAuth simulado",
+            cenario_token_manager_refresh,
+            requests_fator=0.25,
+        ),
+        Cenario("encryption_decrypt", "EncryptionService.decrypt", cenario_encryption_decrypt),
+        Cenario(
+            "encryption_decrypt_many",
+            "EncryptionService.decrypt_many (valores/s)",
+            cenario_encryption_decrypt_many,
+        ),
+    )
+}
+
+
+def executar_filho(args: argparse.Namespace) -> None:
+    """Executa um cenário e imprime o resultado em JSON na última linha."""
+    logging.disable(logging.WARNING)
+    resultado = CENARIOS[args.child].executar(args)
+    # ru_maxrss é em KiB no Linux e em bytes no macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    resultado["max_rss_mb"] = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    print(json.dumps(resultado))
+
+
+# --- Processo principal ---------------------------------------------------------
+
+
+def executar_cenario(cenario: Cenario, args: argparse.Namespace) -> Dict[str, Any]:
+    """Sobe o servidor simulado e executa o cenário em um processo novo."""
+    config = MockConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, **cenario.servidor)
+    with MockApiServer(config) as servidor:
+        comando = [
+            sys.executable,
+            __file__,
+            "--child",
+            cenario.nome,
+            "--url",
+            servidor.url,
+            "--requests",
+            str(max(int(args.requests * cenario.requests_fator), 1)),
+            "--concurrency",
+            str(args.concurrency),
+        ]
+        saida = subprocess.run(comando, capture_output=True, text=True)
+        if saida.returncode != 0:
+            return {"failed": saida.stderr.strip().splitlines()[-1:]}
+        resultado = json.loads(saida.stdout.strip().splitlines()[-1])
+        resultado["server_statuses"] = servidor.get_stats()
+        return resultado
+
+
+def comparar(
+    atuais: Dict[str, Dict[str, Any]],
+    base: Dict[str, Dict[str, Any]],
+    tolerancia: float,
+) -> List[str]:
+    """
+    Compara os resultados com uma execução anterior.
+
+    Returns:
+        Descrição das regressões acima da tolerância
+    """
+    regressoes = []
+    print(f"\nComparação com a base (tolerância {tolerancia:.0%}):")
+    print(f"{'cenário':<26}{'rps':>10}{'p50':>10}{'p99':>10}{'rss':>10}")
+    for nome, atual in atuais.items():
+        anterior = base.get(nome)
+        if not anterior or "failed" in atual or "failed" in anterior:
+            continue
+        deltas = {
+            metrica: (atual[metrica] - anterior[metrica]) / anterior[metrica]
+            if anterior[metrica]
+            else 0.0
+            for metrica in ("rps", "p50_ms", "p99_ms", "max_rss_mb")
+        }
+        print(
+            f"{nome:<26}{deltas['rps']:>+10.1%}{deltas['p50_ms']:>+10.1%}"
+            f"{deltas['p99_ms']:>+10.1%}{deltas['max_rss_mb']:>+10.1%}"
+        )
+        if deltas["rps"] < -tolerancia:
+            regressoes.append(f"{nome}: rps {deltas['rps']:+.1%}")
+        for metrica in ("p99_ms", "max_rss_mb"):
+            if deltas[metrica] > tolerancia:
+                regressoes.append(f"{nome}: {metrica} {deltas[metrica]:+.1%}")
+    return regressoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", default=",".join(CENARIOS))
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--jitter-ms", type=float, default=1.0)
+    parser.add_argument("--save", help="Arquivo JSON para salvar os resultados")
+    parser.add_argument("--compare", help="Resultados anteriores (JSON) para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument("--list", action="store_true", help="Lista os cenários")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        executar_filho(args)
+        return
+    if args.list:
+        for cenario in CENARIOS.values():
+            print(f"{cenario.nome:<26}{cenario.descricao}")
+        return
+
+    resultados: Dict[str, Dict[str, Any]] = {}
+    print(f"{'cenário':<26}{'ops':>8}{'erros':>7}{'rps':>11}{'p50 ms':>9}{'p99 ms':>9}{'RSS MB':>8}")
+    for nome in args.scenarios.split(","):
+        cenario = CENARIOS[nome]
+        resultado = executar_cenario(cenario, args)
+        resultados[nome] = resultado
+        if "failed" in resultado:
+            print(f"{nome:<26} falhou: {' '.join(resultado['failed'])}")
+            continue
+        print(
+            f"{nome:<26}{resultado['ops']:>8}{resultado['errors']:>7}{resultado['rps']:>11.1f}"
+            f"{resultado['p50_ms']:>9.2f}{resultado['p99_ms']:>9.2f}{resultado['max_rss_mb']:>8.1f}"
+        )
+
+    if args.save:
+        meta = {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+        }
+        Path(args.save).write_text(json.dumps({"meta": meta, "results": resultados}, indent=2))
+        print(f"\nResultados salvos em {args.save}")
+
+    if args.compare:
+        base = json.loads(Path(args.compare).read_text())["results"]
+        regressoes = comparar(resultados, base, args.tolerance)
+        if regressoes:
+            print("\nRegressões:\n  " + "\n  ".join(regressoes))
+            sys.exit(1)
+        print("\nSem regressões.")
+
+
+if __name__ == "__main__":
+    main()
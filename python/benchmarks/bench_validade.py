@@ -0,0 +1,85 @@
+"""
+Benchmark da verificação de validade dos tokens.
+
+Compara a conversão antiga (pandas.to_datetime + datetime.now) com
+src.utils.validade, por chamada e no tempo de importação.
+
+Uso:
+    python benchmarks/bench_validade.py [--calls 100000]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+VALIDADES = [
+    "2030-01-01T12:30:00",
+    "2030-01-01 12:30:00",
+    "2030-01-01T12:30:00Z",
+    "2030-01-01T12:30:00.123456-03:00",
+]
+
+
+def medir_chamadas(funcao, calls: int) -> float:
+    """Tempo médio por chamada em microssegundos."""
+    inicio = time.perf_counter()
+    for i in range(calls):
+        funcao(VALIDADES[i % len(VALIDADES)])
+    return (time.perf_counter() - inicio) / calls * 1e6
+
+
+def medir_importacao(modulo: str, repeticoes: int = 5) -> float:
+    """Mediana do tempo de importação, em ms, em um interpretador novo."""
+    codigo = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); "
+        "t = time.perf_counter(); "
+        f"__import__({modulo!r}); "
+        "print(time.perf_counter() - t)"
+    )
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo, str(RAIZ)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        tempos.append(float(saida.stdout) * 1000)
+    return statistics.median(tempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(RAIZ))
+    from src.utils.validade import validade_to_epoch
+
+    def nova(v: str) -> bool:
+        expiracao = validade_to_epoch(v)
+        return expiracao is not None and time.time() > expiracao
+
+    print(f"validade_to_epoch: {medir_chamadas(nova, args.calls):8.3f} us/chamada")
+    print(f"import validade:   {medir_importacao('src.utils.validade'):8.1f} ms")
+
+    try:
+        import pandas as pd
+    except ImportError:
+        print("pandas não instalado: comparação com a versão antiga ignorada")
+        return
+
+    def antiga(v: str) -> bool:
+        return datetime.now() > pd.to_datetime(v).tz_localize(None)
+
+    print(f"pandas.to_datetime: {medir_chamadas(antiga, args.calls // 10):7.3f} us/chamada")
+    print(f"import pandas:     {medir_importacao('pandas'):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Servidor local HTTP/2 (h2c, sem TLS) que simula a API para os benchmarks.
+
+Atende GET /api/itens como mock_server.py, mas em HTTP/2 com conhecimento
+prévio: cada conexão aceita muitas requisições simultâneas (streams). Usa
+a mesma MockConfig; apenas latência e tamanho dos itens são aplicados.
+
+Endpoints:
+    GET  /api/itens         listagem paginada (pagina, limite) em {"data": [...]}
+    GET  /__stats           contadores de respostas por status e de conexões
+
+Uso:
+    python benchmarks/mock_h2_server.py [--port 8443] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+from mock_server import MockConfig, itens
+
+
+class MockHttp2Server:
+    """Servidor HTTP/2 simulado executado em uma thread com event loop próprio."""
+
+    def __init__(self, config: Optional[MockConfig] = None, port: int = 0):
+        """
+        Inicializa o servidor.
+
+        Args:
+            config: Comportamento simulado (padrão: sem latência)
+            port: Porta local (0 escolhe uma porta livre)
+        """
+        self.config = config or MockConfig()
+        self._port = port
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self._connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor."""
+        return f"http://127.0.0.1:{self._port}"
+
+    def start(self) -> "MockHttp2Server":
+        """Inicia o servidor em segundo plano."""
+        pronto = threading.Event()
+
+        def executar() -> None:
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(
+                self._loop.create_server(lambda: _Http2Protocol(self), "127.0.0.1", self._port)
+            )
+            self._port = self._server.sockets[0].getsockname()[1]
+            pronto.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=executar, name="mock-h2", daemon=True)
+        self._thread.start()
+        pronto.wait()
+        return self
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        if self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockHttp2Server":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def count_connection(self) -> None:
+        """Contabiliza uma conexão aceita."""
+        with self._lock:
+            self._connections += 1
+
+    def count(self, status: int) -> None:
+        """Contabiliza uma resposta enviada."""
+        with self._lock:
+            self._stats[str(status)] = self._stats.get(str(status), 0) + 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna o número de respostas por status e de conexões aceitas."""
+        with self._lock:
+            return {**self._stats, "connections": self._connections}
+
+    def reset_stats(self) -> None:
+        """Zera os contadores de respostas e de conexões."""
+        with self._lock:
+            self._stats.clear()
+            self._connections = 0
+
+    def respond(self, method: str, path: str) -> Tuple[int, Any]:
+        """Status e corpo da resposta a uma requisição."""
+        parts = urlsplit(path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if parts.path == "/__stats" and method == "GET":
+            return 200, self.get_stats()
+        if parts.path == "/api/itens" and method == "GET":
+            pagina = int(query.get("pagina", 1))
+            limite = int(query.get("limite", 100))
+            total = int(query.get("total", 1000))
+            inicio = (pagina - 1) * limite
+            fim = min(inicio + limite, total)
+            return 200, {"data": itens(inicio, fim, self.config.item_bytes)}
+        return 404, {"error": "not found"}
+
+
+class _Http2Protocol(asyncio.Protocol):
+    """Uma conexão HTTP/2: cada stream é respondido em uma tarefa própria."""
+
+    def __init__(self, server: MockHttp2Server):
+        self._server = server
+        self._conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self._transport: Optional[asyncio.Transport] = None
+        self._requests: Dict[int, Dict[str, str]] = {}
+        self._window_open: Dict[int, asyncio.Event] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+        self._server.count_connection()
+        self._conn.initiate_connection()
+        self._flush()
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            events = self._conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self._flush()
+            self._transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self._requests[event.stream_id] = dict(event.headers)
+            elif isinstance(event, h2.events.DataReceived):
+                self._conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+            elif isinstance(event, h2.events.StreamReset):
+                self._requests.pop(event.stream_id, None)
+                self._wake(event.stream_id)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._wake(event.stream_id)
+        self._flush()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        for event in self._window_open.values():
+            event.set()
+
+    async def _respond(self, stream_id: int) -> None:
+        headers = self._requests.pop(stream_id, None)
+        if headers is None:
+            return
+        config = self._server.config
+        atraso = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if atraso > 0:
+            await asyncio.sleep(atraso / 1000)
+
+        status, payload = self._server.respond(headers[":method"], headers[":path"])
+        body = json.dumps(payload).encode()
+        try:
+            self._conn.send_headers(
+                stream_id,
+                [
+                    (":status", str(status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(body))),
+                ],
+            )
+            await self._send_body(stream_id, body)
+        except h2.exceptions.StreamClosedError:
+            return
+        self._flush()
+        self._server.count(status)
+
+    async def _send_body(self, stream_id: int, body: bytes) -> None:
+        # Respeita o controle de fluxo: espera WINDOW_UPDATE quando a janela acaba
+        while True:
+            janela = min(
+                self._conn.local_flow_control_window(stream_id),
+                self._conn.max_outbound_frame_size,
+            )
+            if janela > 0 or not body:
+                pedaco, body = body[:janela], body[janela:]
+                self._conn.send_data(stream_id, pedaco, end_stream=not body)
+                self._flush()
+                if not body:
+                    self._window_open.pop(stream_id, None)
+                    return
+                continue
+            if self._transport.is_closing():
+                raise h2.exceptions.StreamClosedError(stream_id)
+            evento = self._window_open.setdefault(stream_id, asyncio.Event())
+            await evento.wait()
+            evento.clear()
+
+    def _wake(self, stream_id: int) -> None:
+        # stream_id 0 é a janela da conexão: afeta todos os streams
+        if stream_id == 0:
+            for event in self._window_open.values():
+                event.set()
+        elif stream_id in self._window_open:
+            self._window_open[stream_id].set()
+
+    def _flush(self) -> None:
+        data = self._conn.data_to_send()
+        if data and not self._transport.is_closing():
+            self._transport.write(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--item-bytes", type=int, default=100)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        item_bytes=args.item_bytes,
+        check_tokens=False,
+    )
+    server = MockHttp2Server(config, port=args.port).start()
+    print(f"Servidor HTTP/2 simulado em {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
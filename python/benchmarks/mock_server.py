@@ -0,0 +1,436 @@
+"""
+Servidor local que simula a API e o endpoint OAuth para os benchmarks.
+
+Endpoints:
+    POST /oauth/token       emite access/refresh token (grant_type=refresh_token)
+    GET  /api/itens         listagem paginada (pagina, limite) em {"data": [...]}
+    GET  /api/exportacao    listagem grande em uma única resposta (itens=N)
+    POST /api/itens         eco do corpo recebido
+    POST /api/itens/lote    lote de itens em {"data": [...]}, um resultado por item
+    GET  /api/alteracoes    itens alterados depois de "desde" (pagina, limite), com
+                            "alterado_em"; sem "desde", todos os itens
+    GET  /api/redirecionar  redireciona (302) para o caminho em "para"
+    GET  /__stats           contadores de respostas por status e de conexões
+
+Latência, tamanho dos itens e a fração de respostas 401, 429 e 503 são
+configuráveis. Tokens desconhecidos recebem 401, como na API real. Com
+compress_responses, as respostas saem em br ou gzip conforme o
+Accept-Encoding; corpos de POST com Content-Encoding são descomprimidos.
+
+Uso:
+    python benchmarks/mock_server.py [--port 8080] [--latency-ms 20] [--p429 0.05]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    brotli = None
+
+
+class MockConfig:
+    """Comportamento simulado do servidor."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        p401: float = 0.0,
+        p429: float = 0.0,
+        p503: float = 0.0,
+        retry_after: float = 0.0,
+        item_bytes: int = 100,
+        token_ttl: int = 3600,
+        check_tokens: bool = True,
+        compress_responses: bool = False,
+    ):
+        """
+        Inicializa a configuração.
+
+        Args:
+            latency_ms: Latência fixa de cada resposta em ms
+            jitter_ms: Variação aleatória máxima da latência em ms
+            p401: Fração das requisições da API respondidas com 401
+            p429: Fração das requisições da API respondidas com 429
+            p503: Fração das requisições da API respondidas com 503
+            retry_after: Valor do Retry-After enviado com 429 e 503, em segundos
+            item_bytes: Tamanho aproximado de cada item das listagens
+            token_ttl: Validade dos tokens emitidos em segundos
+            check_tokens: Se True, tokens não emitidos pelo servidor recebem 401
+            compress_responses: Se True, comprime as respostas aceitas pelo cliente
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.p401 = p401
+        self.p429 = p429
+        self.p503 = p503
+        self.retry_after = retry_after
+        self.item_bytes = item_bytes
+        self.token_ttl = token_ttl
+        self.check_tokens = check_tokens
+        self.compress_responses = compress_responses
+
+
+class MockApiServer:
+    """Servidor simulado executado em uma thread."""
+
+    def __init__(self, config: Optional[MockConfig] = None, port: int = 0):
+        """
+        Inicializa o servidor.
+
+        Args:
+            config: Comportamento simulado (padrão: sem latência nem erros)
+            port: Porta local (0 escolhe uma porta livre)
+        """
+        self.config = config or MockConfig()
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, float] = {}
+        self._issued = 0
+        self._stats: Dict[str, int] = {}
+        self._connections = 0
+        # Relógio lógico das alterações: itens nunca alterados têm alterado_em 1
+        self._clock = 1
+        self._changes: Dict[int, int] = {}
+        self._httpd = _ThreadingServer(("127.0.0.1", port), _handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockApiServer":
+        """Inicia o servidor em segundo plano."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="mock-api", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Atende requisições na thread atual até stop."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def issue_token(self) -> Dict[str, Any]:
+        """Emite um novo par de tokens."""
+        with self._lock:
+            self._issued += 1
+            access_token = f"access-{self._issued}-{random.getrandbits(64):x}"
+            self._tokens[access_token] = time.time() + self.config.token_ttl
+        return {
+            "access_token": access_token,
+            "refresh_token": f"refresh-{self._issued}",
+            "expires_in": self.config.token_ttl,
+            "token_type": "Bearer",
+        }
+
+    def token_valid(self, authorization: Optional[str]) -> bool:
+        """Indica se o header Authorization traz um token emitido e não vencido."""
+        if not self.config.check_tokens:
+            return True
+        token = (authorization or "").removeprefix("Bearer ")
+        with self._lock:
+            expires_at = self._tokens.get(token)
+        return expires_at is not None and expires_at > time.time()
+
+    def count_connection(self) -> None:
+        """Contabiliza uma conexão aceita."""
+        with self._lock:
+            self._connections += 1
+
+    def count(self, status: int) -> None:
+        """Contabiliza uma resposta enviada."""
+        with self._lock:
+            self._stats[str(status)] = self._stats.get(str(status), 0) + 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna o número de respostas por status e de conexões aceitas."""
+        with self._lock:
+            return {**self._stats, "connections": self._connections}
+
+    def change(self, ids: Iterable[int]) -> None:
+        """Marca os itens como alterados agora, para /api/alteracoes."""
+        with self._lock:
+            for i in ids:
+                self._clock += 1
+                self._changes[i] = self._clock
+
+    def changed(self, since: Optional[int], inicio: int, fim: int, total: int) -> list:
+        """Itens alterados depois de since, na ordem de alteração, de inicio a fim."""
+        with self._lock:
+            changes = dict(self._changes)
+        if since is None:
+            ids = list(range(inicio, min(fim, total)))
+        else:
+            alterados = sorted(
+                (t, i) for i, t in changes.items() if t > since and i < total
+            )
+            ids = [i for _, i in alterados[inicio:fim]]
+        return [
+            {**item, "alterado_em": changes.get(item["id"], 1)}
+            for i in ids
+            for item in itens(i, i + 1, self.config.item_bytes)
+        ]
+
+    def reset_stats(self) -> None:
+        """Zera os contadores de respostas e de conexões."""
+        with self._lock:
+            self._stats.clear()
+            self._connections = 0
+
+
+def _handler(server: MockApiServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Cabeçalho e corpo saem em escritas separadas: sem Nagle, evita atraso de ACK
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            server.count_connection()
+
+        def do_GET(self) -> None:
+            parts = urlsplit(self.path)
+            query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+            if parts.path == "/__stats":
+                self._send(200, server.get_stats(), count=False)
+            elif parts.path == "/api/itens":
+                if self._api_failure():
+                    return
+                pagina = int(query.get("pagina", 1))
+                limite = int(query.get("limite", 100))
+                total = int(query.get("total", 1000))
+                inicio = (pagina - 1) * limite
+                fim = min(inicio + limite, total)
+                self._send(200, {"data": itens(inicio, fim, server.config.item_bytes)})
+            elif parts.path == "/api/alteracoes":
+                if self._api_failure():
+                    return
+                pagina = int(query.get("pagina", 1))
+                limite = int(query.get("limite", 100))
+                desde = int(query["desde"]) if "desde" in query else None
+                inicio = (pagina - 1) * limite
+                total = int(query.get("total", 1000))
+                self._send(200, {"data": server.changed(desde, inicio, inicio + limite, total)})
+            elif parts.path == "/api/exportacao":
+                if self._api_failure():
+                    return
+                self._send_export(int(query.get("itens", 10000)))
+            elif parts.path == "/api/redirecionar":
+                self.send_response(302)
+                self.send_header("Location", query.get("para", "/api/itens"))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                server.count(302)
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            encoding = self.headers.get("Content-Encoding")
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "br":
+                body = brotli.decompress(body)
+            if self.path.startswith("/oauth/token"):
+                self._delay()
+                self._send(200, server.issue_token())
+            elif self.path.startswith("/api/itens/lote"):
+                if self._api_failure():
+                    return
+                lote = json.loads(body or b"{}").get("data", [])
+                self._send(201, {"data": [{"data": item} for item in lote]})
+            elif self.path.startswith("/api/itens"):
+                if self._api_failure():
+                    return
+                self._send(201, {"data": json.loads(body or b"{}")})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def _api_failure(self) -> bool:
+            """Aplica latência e, se sorteado, responde com erro simulado."""
+            self._delay()
+            config = server.config
+            if not server.token_valid(self.headers.get("Authorization")):
+                self._send(401, {"error": {"type": "invalid_token"}})
+                return True
+            sorteio = random.random()
+            if sorteio < config.p401:
+                self._send(401, {"error": {"type": "invalid_token"}})
+                return True
+            if sorteio < config.p401 + config.p429:
+                self._send(429, {"error": {"type": "TOO_MANY_REQUESTS"}}, retry_after=True)
+                return True
+            if sorteio < config.p401 + config.p429 + config.p503:
+                self._send(503, {"error": {"type": "unavailable"}}, retry_after=True)
+                return True
+            return False
+
+        def _delay(self) -> None:
+            config = server.config
+            atraso = config.latency_ms + random.uniform(0, config.jitter_ms)
+            if atraso > 0:
+                time.sleep(atraso / 1000)
+
+        def _send(
+            self,
+            status: int,
+            payload: Any,
+            retry_after: bool = False,
+            count: bool = True,
+        ) -> None:
+            body = json.dumps(payload).encode()
+            compressor = self._compressor()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            if compressor is not None:
+                body = compressor.compress(body) + compressor.flush()
+                self.send_header("Content-Encoding", compressor.encoding)
+            self.send_header("Content-Length", str(len(body)))
+            if retry_after:
+                self.send_header("Retry-After", str(server.config.retry_after))
+            self.end_headers()
+            self.wfile.write(body)
+            if count:
+                server.count(status)
+
+        def _send_export(self, total: int) -> None:
+            # Resposta em chunked encoding, gerada em blocos para não montar tudo em memória
+            compressor = self._compressor()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if compressor is not None:
+                self.send_header("Content-Encoding", compressor.encoding)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self._chunk(b'{"data":[', compressor)
+            for inicio in range(0, total, 1000):
+                bloco = json.dumps(
+                    itens(inicio, min(inicio + 1000, total), server.config.item_bytes)
+                )[1:-1]
+                self._chunk((("," if inicio else "") + bloco).encode(), compressor)
+            self._chunk(b"]}", compressor)
+            if compressor is not None:
+                self._chunk(compressor.flush())
+            self.wfile.write(b"0\r\n\r\n")
+            server.count(200)
+
+        def _chunk(self, data: bytes, compressor: Optional["_Compressor"] = None) -> None:
+            if compressor is not None:
+                data = compressor.compress(data)
+            # Pedaço vazio encerraria a resposta chunked
+            if data:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+        def _compressor(self) -> Optional["_Compressor"]:
+            if not server.config.compress_responses:
+                return None
+            aceitas = {
+                parte.split(";")[0].strip()
+                for parte in self.headers.get("Accept-Encoding", "").split(",")
+            }
+            if "br" in aceitas and brotli is not None:
+                return _Compressor("br")
+            if "gzip" in aceitas:
+                return _Compressor("gzip")
+            return None
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Com a fila padrão (5), conexões abertas juntas por muitas threads têm o
+    # SYN descartado e só conectam após o reenvio, um segundo depois
+    request_queue_size = 128
+
+
+class _Compressor:
+    """Compressão incremental em gzip ou br, para respostas inteiras ou chunked."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=5)
+        else:
+            self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data)
+        return self._gzip.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gzip.flush()
+
+
+def itens(inicio: int, fim: int, item_bytes: int = 100) -> list:
+    """Itens simulados de inicio a fim, com cerca de item_bytes cada."""
+    preenchimento = "x" * max(item_bytes - 60, 0)
+    return [
+        {"id": i, "descricao": f"item {i} {preenchimento}", "preco": i * 1.5}
+        for i in range(inicio, fim)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--p401", type=float, default=0.0)
+    parser.add_argument("--p429", type=float, default=0.0)
+    parser.add_argument("--p503", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.0)
+    parser.add_argument("--item-bytes", type=int, default=100)
+    parser.add_argument("--compress", action="store_true", help="comprime as respostas")
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        p401=args.p401,
+        p429=args.p429,
+        p503=args.p503,
+        retry_after=args.retry_after,
+        item_bytes=args.item_bytes,
+        check_tokens=False,
+        compress_responses=args.compress,
+    )
+    server = MockApiServer(config, port=args.port)
+    print(f"Servidor simulado em {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
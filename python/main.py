@@ -1,6 +1,126 @@
-def main():
-    print("Hello from pacote-api-oauth!")
+"""
+Executa um job para cada loja, distribuindo as lojas entre processos.
+
+A função do job recebe o WorkerContext do processo (factory e cliente
+próprios do worker) e o id da loja, e pode retornar a quantidade de itens
+processados. Cada loja vai sempre para o mesmo worker (hash consistente),
+que reaproveita os tokens dela entre as rodadas.
+
+Uso:
+    python main.py pacote.modulo:funcao --tenants lojas.txt [--workers 4]
+        [--threads 4] [--interval 300] [--job-timeout 600] [--http2]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from importlib import import_module
+from typing import Any, Callable, List, Optional
+
+from src.services.tenant_runner import TenantRunner
+from src.utils.log import configure_logging, log
+
+
+def load_job(spec: str) -> Callable[[Any, str], Any]:
+    """
+    Importa a função do job.
+
+    Args:
+        spec: "modulo:funcao"
+    Returns:
+        Função do job
+    """
+    module, _, name = spec.partition(":")
+    if not module or not name:
+        raise ValueError(f"Job inválido (use modulo:funcao): {spec}")
+    return getattr(import_module(module), name)
+
+
+def read_tenants(path: Optional[str], ids: List[str]) -> List[str]:
+    """
+    Lê os ids das lojas: um por linha no arquivo ("-" para stdin) e os
+    informados em --tenant.
+
+    Args:
+        path: Arquivo com os ids (opcional)
+        ids: Ids informados na linha de comando
+    Returns:
+        Lista de ids, sem linhas vazias nem comentários (#)
+    """
+    lines: List[str] = []
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    elif path:
+        with open(path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+    tenants = [line.strip() for line in lines]
+    return [id for id in tenants + ids if id and not id.startswith("#")]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("job", help="função do job, como modulo:funcao")
+    parser.add_argument("--tenants", help="arquivo com um id de loja por linha (- para stdin)")
+    parser.add_argument(
+        "--tenant", action="append", default=[], help="id de loja (pode repetir)"
+    )
+    parser.add_argument("--workers", type=int, help="processos (padrão: número de CPUs)")
+    parser.add_argument("--threads", type=int, default=1, help="lojas simultâneas por worker")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="segundos entre rodadas; sem ele, executa uma rodada e sai",
+    )
+    parser.add_argument("--max-restarts", type=int, default=3)
+    parser.add_argument(
+        "--job-timeout",
+        type=float,
+        help="segundos máximos do job por loja; depois disso o worker é reiniciado",
+    )
+    parser.add_argument("--report-interval", type=float, default=10.0)
+    parser.add_argument("--http2", action="store_true", help="cliente com HTTP/2")
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+    )
+    args = parser.parse_args(argv)
+
+    level = getattr(logging, args.log_level)
+    configure_logging(level)
+    job = load_job(args.job)
+
+    with TenantRunner(
+        job,
+        workers=args.workers,
+        threads=args.threads,
+        client_options={"http2": args.http2},
+        max_restarts=args.max_restarts,
+        job_timeout=args.job_timeout,
+        report_interval=args.report_interval,
+        log_level=level,
+    ) as runner:
+        while True:
+            # Relido a cada rodada: lojas novas entram sem reiniciar o runner
+            tenants = read_tenants(args.tenants, args.tenant)
+            stats = runner.run(tenants)
+            log.info(
+                "Rodada concluída: %d/%d lojas em %.1fs (%d com erro, %d reinícios), "
+                "%.1f lojas/s, %.1f itens/s",
+                stats["completed"],
+                stats["tenants"],
+                stats["seconds"],
+                stats["failed"],
+                stats["restarts"],
+                stats["tenants_per_second"],
+                stats["items_per_second"],
+            )
+            if args.interval is None:
+                return 1 if stats["failed"] else 0
+            time.sleep(args.interval)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,6 +1,35 @@
-from .factories.factory import Factory
+"""
+Pacote do cliente da API com OAuth.
 
-# Instancia a factory e expõe o cliente já criado
-client = Factory().create_client()
+Os atributos são carregados sob demanda: importar o pacote não cria
+conexões nem lê configuração. O cliente padrão é criado no primeiro
+acesso a src.client.
+"""
 
-__all__ = ["client"]
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .clients.client import Client
+    from .factories.factory import Factory
+
+    client: Client
+
+__all__ = ["client", "Factory"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Factory":
+        from .factories.factory import Factory
+
+        return Factory
+    if name == "client":
+        from .factories.factory import Factory
+
+        # Instancia a factory e guarda o cliente para os próximos acessos
+        globals()["client"] = Factory().create_client()
+        return globals()["client"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
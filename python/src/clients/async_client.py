@@ -0,0 +1,611 @@
+"""
+Cliente assíncrono da API.
+
+Contraparte asyncio do Client: permite que um único event loop conduza
+milhares de requisições simultâneas, limitadas por um semáforo global e
+por um limite de concorrência por loja.
+"""
+
+import asyncio
+import itertools
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.services.tratamento_de_resposta import tratamento_de_resposta
+
+from ..interfaces.token_manager_interface import ITokenManager
+from ..services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from ..services.rate_limiter import RateLimitedError, RateLimiter
+from ..services.response_cache import ResponseCache
+from ..services.retry_policy import IDEMPOTENT_METHODS, RetryBudget, RetryPolicy
+from ..utils import metrics
+from ..utils.json_backend import dumps
+from ..utils.json_stream import JsonArrayStream
+from ..utils.log import log
+from ..utils.pagination import Pagination
+from ..utils.single_flight import SingleFlight
+
+
+class AsyncClient:
+    """
+    Cliente assíncrono da API.
+
+    Mesmo contrato do Client, com get/post aguardáveis. Cada tentativa
+    ocupa uma vaga do semáforo global e uma vaga da loja; as vagas são
+    liberadas durante o intervalo entre tentativas.
+    """
+
+    def __init__(
+        self,
+        token_manager: ITokenManager,
+        max_retries: int,
+        retry_delay: float,
+        max_concurrency: int = 100,
+        max_concurrency_per_tenant: int = 10,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keep_alive_expiry: float = 5.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Inicializa o cliente assíncrono.
+
+        Args:
+            token_manager: Gerenciador de tokens
+            max_retries: Número máximo de tentativas para requisições
+            retry_delay: Delay entre tentativas em segundos
+            max_concurrency: Requisições simultâneas no total
+            max_concurrency_per_tenant: Requisições simultâneas por loja
+            max_connections: Conexões abertas no pool HTTP
+            max_keepalive_connections: Conexões ociosas mantidas no pool
+            keep_alive_expiry: Tempo em segundos que uma conexão ociosa é mantida
+            connect_timeout: Timeout de conexão em segundos
+            read_timeout: Timeout de leitura em segundos
+            rate_limiter: Limitador de taxa por loja (opcional)
+            retry_policy: Política de novas tentativas. Se None, usa backoff
+                exponencial com max_retries tentativas e retry_delay de base
+            retry_budget: Orçamento de novas tentativas do cliente (opcional)
+            circuit_breaker: Circuit breaker por loja (opcional)
+            response_cache: Cache de respostas de GET (opcional)
+        """
+        self._token_manager = token_manager
+        self._max_concurrency_per_tenant = max_concurrency_per_tenant
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retries, base_delay=retry_delay
+        )
+        self._retry_budget = retry_budget or RetryBudget()
+        self._circuit_breaker = circuit_breaker
+        self._response_cache = response_cache
+        self._get_flight = SingleFlight()
+
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keep_alive_expiry,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+        self._global_semaphore = asyncio.Semaphore(max_concurrency)
+        # Semáforos por loja são criados sob demanda e descartados quando ociosos
+        self._tenant_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tenant_usage: Dict[str, int] = {}
+        self._in_flight = 0
+
+    @asynccontextmanager
+    async def _slot(self, id: str) -> AsyncIterator[None]:
+        """Ocupa uma vaga da loja e uma vaga global durante a requisição."""
+        semaphore = self._tenant_semaphores.get(id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency_per_tenant)
+            self._tenant_semaphores[id] = semaphore
+        self._tenant_usage[id] = self._tenant_usage.get(id, 0) + 1
+        try:
+            # A vaga da loja vem primeiro para não segurar uma vaga global em espera
+            async with semaphore:
+                async with self._global_semaphore:
+                    self._in_flight += 1
+                    try:
+                        yield
+                    finally:
+                        self._in_flight -= 1
+        finally:
+            self._tenant_usage[id] -= 1
+            if self._tenant_usage[id] == 0:
+                del self._tenant_usage[id]
+                del self._tenant_semaphores[id]
+
+    async def get(
+        self, url: str, id: str, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa requisição GET na API .
+
+        Com cache de respostas, GETs repetidos dentro do TTL não vão à API e
+        GETs idênticos simultâneos compartilham uma única requisição. A
+        resposta em cache é compartilhada e não deve ser alterada.
+        """
+        headers = {**(headers or {}), "Accept": "application/json"}
+        if self._response_cache is None:
+            return await self._request("GET", url, id, headers=headers)
+
+        key = ResponseCache.key(id, url, headers)
+        body, etag = self._response_cache.get(key)
+        if body is not None:
+            metrics.increment("response_cache_hits_total")
+            return body
+        metrics.increment("response_cache_misses_total")
+        return await self._get_flight.do_async(
+            key, lambda: self._fetch_and_cache(key, url, id, headers, etag)
+        )
+
+    async def _fetch_and_cache(
+        self,
+        key: str,
+        url: str,
+        id: str,
+        headers: Dict[str, str],
+        etag: Optional[str],
+    ) -> Any:
+        """Executa o GET, revalidando por ETag, e guarda a resposta no cache."""
+        info: Dict[str, Any] = {}
+        request_headers = {**headers, "If-None-Match": etag} if etag else headers
+        body = await self._request(
+            "GET", url, id, headers=request_headers, response_info=info
+        )
+        status = info.get("status", 0)
+        if status == 304:
+            cached = self._response_cache.revalidate(key)
+            if cached is not None:
+                return cached
+            # Entrada descartada durante a revalidação: busca o corpo de novo
+            return await self._fetch_and_cache(key, url, id, headers, None)
+        if 200 <= status < 300:
+            self._response_cache.put(key, body, info["headers"])
+        return body
+
+    async def post(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        id: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executa requisição POST na API .
+        """
+        return await self._request(
+            "POST",
+            url,
+            id,
+            headers={
+                **(headers or {}),
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            content=dumps(data),
+        )
+
+    async def stream_items(
+        self,
+        url: str,
+        id: str,
+        key: Optional[str] = "data",
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Any]:
+        """
+        Percorre os itens de uma resposta grande enquanto o corpo é recebido.
+
+        Os elementos do array em key são decodificados um a um, sem carregar
+        a resposta inteira em memória.
+
+        Args:
+            url: URL da requisição
+            id: Identificador da loja
+            key: Chave do objeto raiz com o array (None se a resposta for o array)
+            headers: Headers adicionais (opcional)
+            chunk_size: Tamanho dos pedaços lidos do corpo, em bytes
+
+        Returns:
+            Iterador assíncrono dos itens
+        """
+        # A vaga de concorrência só é devolvida depois que o corpo foi lido
+        async with AsyncExitStack() as slot:
+            response = await self._request(
+                "GET",
+                url,
+                id,
+                headers={**(headers or {}), "Accept": "application/json"},
+                stream=True,
+                slot=slot,
+            )
+            if not isinstance(response, httpx.Response):
+                log.warning("Resposta de erro ao ler itens de %s", id)
+                return
+
+            parser = JsonArrayStream(key)
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+            except Exception:
+                # Corpo interrompido ou corrompido conta como falha da loja
+                self._record_outcome(id, 0)
+                raise
+            finally:
+                await response.aclose()
+            parser.close()
+
+    async def iter_pages(
+        self,
+        url: str,
+        id: str,
+        pagination: Optional[Pagination] = None,
+        prefetch: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Percorre as páginas de uma listagem sob demanda.
+
+        Só a página atual fica em memória; com prefetch, a próxima página é
+        buscada em uma task enquanto a atual é consumida.
+
+        Args:
+            url: URL da listagem, sem os parâmetros de paginação
+            id: Identificador da loja
+            pagination: Regras de paginação (padrão: pagina/limite com 100 itens)
+            prefetch: Se True, busca a próxima página antecipadamente
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador assíncrono das respostas de cada página
+        Raises:
+            PaginationError: Se uma página vier sem a lista de itens (resposta
+                de erro da API)
+        """
+        pagination = pagination or Pagination()
+        pending: Optional[asyncio.Task] = None
+        position = pagination.start
+        try:
+            page = await self.get(pagination.url(url, position), id, headers)
+            while True:
+                next_position = pagination.next(position, pagination.items(page))
+                if prefetch and next_position is not None:
+                    pending = asyncio.create_task(
+                        self.get(pagination.url(url, next_position), id, headers)
+                    )
+                yield page
+                if next_position is None:
+                    return
+                position = next_position
+                if pending is not None:
+                    page, pending = await pending, None
+                else:
+                    page = await self.get(pagination.url(url, position), id, headers)
+        finally:
+            # Iteração interrompida: descarta a página antecipada
+            if pending is not None:
+                pending.cancel()
+
+    async def iter_items(
+        self,
+        url: str,
+        id: str,
+        pagination: Optional[Pagination] = None,
+        prefetch: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Percorre os itens de uma listagem, página a página.
+
+        Args:
+            url: URL da listagem, sem os parâmetros de paginação
+            id: Identificador da loja
+            pagination: Regras de paginação (padrão: pagina/limite com 100 itens)
+            prefetch: Se True, busca a próxima página antecipadamente
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador assíncrono dos itens de todas as páginas
+        Raises:
+            PaginationError: Se uma página vier sem a lista de itens (resposta
+                de erro da API)
+        """
+        pagination = pagination or Pagination()
+        async for page in self.iter_pages(url, id, pagination, prefetch, headers):
+            for item in pagination.items(page):
+                yield item
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        id: str,
+        headers: Dict[str, str],
+        content: Optional[bytes] = None,
+        stream: bool = False,
+        response_info: Optional[Dict[str, Any]] = None,
+        slot: Optional[AsyncExitStack] = None,
+    ) -> Any:
+        """
+        Executa a requisição com novas tentativas e refresh de token.
+
+        Args:
+            method: Método HTTP
+            url: URL da requisição
+            id: Identificador da loja
+            headers: Headers da requisição, sem Authorization
+            content: Corpo já serializado (opcional)
+            stream: Se True, respostas 2xx são retornadas sem ler o corpo
+            response_info: Se informado, recebe status e headers da última resposta
+            slot: Com stream=True, recebe a vaga de concorrência da resposta
+                ainda não lida, que só é devolvida quando o stack for fechado.
+                Sem ele, a vaga é devolvida antes da leitura do corpo
+
+        Returns:
+            Conteúdo da resposta, ou a resposta ainda não lida com stream=True
+        """
+        with metrics.stage("request", id, method=method):
+            try:
+                access_token = await self._token_manager.get_access_token_async(id)
+                result: Dict[str, Any] = {}
+
+                started = time.monotonic()
+                self._retry_budget.record_request()
+                self._check_rate_limit_wait(id)
+
+                for attempt in itertools.count(1):
+                    if self._circuit_breaker is not None:
+                        self._circuit_breaker.before_request(id)
+                    try:
+                        if self._rate_limiter is not None:
+                            waited = await self._rate_limiter.acquire_async(id)
+                            if waited:
+                                metrics.observe("rate_limit_wait_seconds", waited)
+                        async with AsyncExitStack() as attempt_slot:
+                            await attempt_slot.enter_async_context(self._slot(id))
+                            with metrics.stage("http", id, method=method):
+                                request = self._http.build_request(
+                                    method,
+                                    url,
+                                    headers={**headers, "Authorization": f"Bearer {access_token}"},
+                                    content=content,
+                                )
+                                response = await self._http.send(request, stream=stream)
+                                if stream and not 200 <= response.status_code < 300:
+                                    # Respostas de erro são pequenas: lidas por inteiro
+                                    await response.aread()
+                            if stream and slot is not None and 200 <= response.status_code < 300:
+                                # O corpo ainda será lido: a vaga passa a quem lê o stream
+                                slot.push_async_exit(attempt_slot.pop_all())
+                        result = tratamento_de_resposta(response, stream)
+                        status = response.status_code
+                    except httpx.TransportError:
+                        self._record_outcome(id, 0)
+                        # Erros de conexão só são repetidos em métodos idempotentes
+                        if (
+                            method not in IDEMPOTENT_METHODS
+                            or not self._retry_policy.retry_connection_errors
+                        ):
+                            raise
+                        delay = self._next_retry_delay(id, attempt, 0, None, started)
+                        if delay is None:
+                            raise
+                        await asyncio.sleep(delay)
+                        continue
+                    except BaseException:
+                        # Qualquer outra falha da tentativa (corpo corrompido, URL
+                        # inválida, cancelamento) também devolve a vaga do circuito
+                        self._record_outcome(id, 0)
+                        raise
+
+                    self._record_outcome(id, status)
+                    if metrics.enabled:
+                        metrics.increment(
+                            "http_responses_total", method=method, status=str(status)
+                        )
+                    if response_info is not None:
+                        response_info["status"] = status
+                        response_info["headers"] = response.headers
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.observe(
+                            id, status, response.headers, result["retry_after"]
+                        )
+
+                    if not self._retry_policy.should_retry(status, result, method):
+                        return result["response"]
+                    delay = self._next_retry_delay(
+                        id,
+                        attempt,
+                        status,
+                        result["retry_after"],
+                        started,
+                        result["refresh_token"],
+                    )
+                    if delay is None:
+                        break
+                    if result["refresh_token"]:
+                        access_token = (
+                            await self._token_manager.force_refreshing_token_async(
+                                id, stale_token=access_token
+                            )
+                        )
+                        continue
+                    await asyncio.sleep(delay)
+
+                return result["response"] if result else {}
+
+            except CircuitOpenError:
+                metrics.increment("circuit_rejections_total")
+                raise
+            except RateLimitedError:
+                metrics.increment("rate_limit_rejections_total")
+                raise
+            except Exception as e:
+                log.error("Erro na requisição %s para %s: %s", method, id, e)
+                raise
+
+    def _record_outcome(self, id: str, status: int) -> None:
+        """Informa ao circuit breaker o resultado da tentativa (0 = erro de conexão)."""
+        if self._circuit_breaker is None:
+            return
+        # 429 indica API saudável limitando a taxa; quem trata é o limitador
+        if status == 0 or status >= 500:
+            self._circuit_breaker.record_failure(id)
+        else:
+            self._circuit_breaker.record_success(id)
+
+    def _check_rate_limit_wait(self, id: str) -> None:
+        """
+        Recusa a requisição se a espera do limitador já excede max_elapsed.
+
+        Um Retry-After longo recebido por outra requisição da loja bloquearia
+        o acquire além do tempo total da política.
+
+        Args:
+            id: Identificador da loja
+        Raises:
+            RateLimitedError: Se a espera exceder max_elapsed
+        """
+        max_elapsed = self._retry_policy.max_elapsed
+        if self._rate_limiter is None or max_elapsed is None:
+            return
+        wait = self._rate_limiter.get_wait(id)
+        if wait > max_elapsed:
+            self._retry_budget.record_give_up("max_elapsed")
+            metrics.increment("retry_give_ups_total", reason="max_elapsed")
+            raise RateLimitedError(id, wait)
+
+    def _next_retry_delay(
+        self,
+        id: str,
+        attempt: int,
+        status: int,
+        retry_after: Optional[float],
+        started: float,
+        refresh: bool = False,
+    ) -> Optional[float]:
+        """
+        Decide se a requisição pode ser tentada de novo e quanto esperar.
+
+        Args:
+            id: Identificador da loja
+            attempt: Número da tentativa que acabou de falhar
+            status: Status HTTP da resposta (0 para erro de conexão)
+            retry_after: Espera pedida pela API em segundos (opcional)
+            started: Início da requisição em time.monotonic()
+            refresh: Se a nova tentativa ocorre após refresh do token
+
+        Returns:
+            Espera em segundos, ou None para desistir
+        """
+        policy = self._retry_policy.for_status(status)
+        if attempt >= policy.max_attempts:
+            self._retry_budget.record_give_up("max_attempts")
+            metrics.increment("retry_give_ups_total", reason="max_attempts")
+            return None
+
+        if refresh:
+            delay = wait = 0.0
+        elif self._rate_limiter is not None and (status == 429 or retry_after is not None):
+            # O limitador já bloqueia a loja pelo tempo pedido pela API: a espera
+            # acontece no acquire, mas conta para o tempo total
+            delay = 0.0
+            wait = max(self._rate_limiter.get_wait(id), retry_after or 0.0)
+        else:
+            delay = wait = policy.delay(attempt, retry_after)
+
+        elapsed = time.monotonic() - started
+        if policy.max_elapsed is not None and elapsed + wait > policy.max_elapsed:
+            self._retry_budget.record_give_up("max_elapsed")
+            metrics.increment("retry_give_ups_total", reason="max_elapsed")
+            return None
+        if not self._retry_budget.try_retry(status, wait):
+            log.warning("Orçamento de novas tentativas esgotado (status %s)", status)
+            metrics.increment("retry_give_ups_total", reason="budget")
+            return None
+        if metrics.enabled:
+            metrics.increment("retries_total", status=str(status))
+        return delay
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas de novas tentativas do cliente.
+
+        Returns:
+            Dicionário com requisições, novas tentativas por status,
+            desistências por motivo, tempo de espera e orçamento disponível
+        """
+        return self._retry_budget.get_stats()
+
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache de respostas de GET.
+
+        Returns:
+            Dicionário com tamanho, acertos, faltas, taxa de acerto,
+            revalidações por 304, remoções e GETs coalescidos, ou vazio se o
+            cliente não usa cache de respostas
+        """
+        if self._response_cache is None:
+            return {}
+        return {
+            **self._response_cache.get_stats(),
+            "coalesced": self._get_flight.get_stats()["coalesced"],
+        }
+
+    def invalidate_response_cache(self, id: Optional[str] = None) -> None:
+        """
+        Descarta respostas de GET em cache.
+
+        Args:
+            id: Identificador da loja. Se None, descarta todas
+        """
+        if self._response_cache is not None:
+            self._response_cache.invalidate(id)
+
+    def get_circuit_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado dos circuitos por loja.
+
+        Returns:
+            Dicionário com requisições recusadas e lojas com falhas recentes,
+            ou vazio se o cliente não usa circuit breaker
+        """
+        if self._circuit_breaker is None:
+            return {}
+        return self._circuit_breaker.get_stats()
+
+    def get_concurrency_stats(self) -> Dict[str, Any]:
+        """
+        Retorna a ocupação atual dos limites de concorrência.
+
+        Returns:
+            Dicionário com requisições em andamento e lojas ativas
+        """
+        return {
+            "in_flight": self._in_flight,
+            "active_tenants": len(self._tenant_usage),
+            "tenants": dict(self._tenant_usage),
+        }
+
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões HTTP."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
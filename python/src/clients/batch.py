@@ -0,0 +1,207 @@
+"""
+Requisições em lote para o Client.
+
+Define a descrição de cada requisição do lote, o resultado entregue ao
+chamador e a fila que distribui as vagas do pool de threads entre as
+lojas em rodízio, para que uma loja com muitas requisições não atrase as
+demais.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+
+class BatchRequest:
+    """Requisição de um lote."""
+
+    __slots__ = ("url", "id", "method", "data", "headers")
+
+    def __init__(
+        self,
+        url: str,
+        id: str,
+        method: str = "GET",
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Descreve a requisição.
+
+        Args:
+            url: URL da requisição
+            id: Identificador da loja
+            method: "GET" ou "POST"
+            data: Corpo do POST (opcional)
+            headers: Headers adicionais (opcional)
+        """
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Método não suportado em lote: {method}")
+
+        self.url = url
+        self.id = id
+        self.method = method
+        self.data = data
+        self.headers = headers
+
+    @classmethod
+    def of(cls, spec: Union["BatchRequest", Tuple[Any, ...]]) -> "BatchRequest":
+        """
+        Normaliza uma requisição do lote.
+
+        Args:
+            spec: BatchRequest ou tupla (url, id[, method[, data[, headers]]])
+        Returns:
+            BatchRequest
+        """
+        return spec if isinstance(spec, cls) else cls(*spec)
+
+    def __repr__(self) -> str:
+        return f"BatchRequest({self.method} {self.url} id={self.id})"
+
+
+class BatchResult:
+    """Resultado de uma requisição do lote."""
+
+    __slots__ = ("index", "request", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        request: BatchRequest,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Inicializa o resultado.
+
+        Args:
+            index: Posição da requisição no lote
+            request: Requisição executada
+            response: Conteúdo da resposta, se a requisição terminou
+            error: Exceção levantada pela requisição, se houve
+        """
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Indica se a requisição terminou sem exceção."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.error is None else f"erro={self.error!r}"
+        return f"BatchResult({self.index}, {self.request!r}, {status})"
+
+
+class FairQueue:
+    """Fila de requisições pendentes com rodízio entre lojas."""
+
+    def __init__(self, max_per_tenant: Optional[int] = None):
+        """
+        Inicializa a fila.
+
+        Args:
+            max_per_tenant: Requisições simultâneas por loja (None = sem limite)
+        """
+        self._max_per_tenant = max_per_tenant
+        self._pending: Dict[str, Deque[Tuple[int, BatchRequest]]] = {}
+        # Lojas com requisições pendentes, na ordem do rodízio
+        self._turns: Deque[str] = deque()
+        self._in_flight: Dict[str, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, index: int, request: BatchRequest) -> None:
+        """
+        Enfileira uma requisição.
+
+        Args:
+            index: Posição da requisição no lote
+            request: Requisição
+        """
+        queue = self._pending.get(request.id)
+        if queue is None:
+            queue = self._pending[request.id] = deque()
+            self._turns.append(request.id)
+        queue.append((index, request))
+        self._size += 1
+
+    def pop(self) -> Optional[Tuple[int, BatchRequest]]:
+        """
+        Retira a próxima requisição, da próxima loja do rodízio com vaga.
+
+        Returns:
+            (posição, requisição), ou None se nenhuma loja pendente tiver vaga
+        """
+        batch = self.pop_batch(1)
+        return batch[0] if batch else None
+
+    def pop_batch(self, max_items: int) -> List[Tuple[int, BatchRequest]]:
+        """
+        Retira a próxima requisição e as seguintes da mesma loja que podem
+        ir junto com ela (mesma URL e headers), até max_items. O lote ocupa
+        uma única vaga da loja.
+
+        Args:
+            max_items: Tamanho máximo do lote
+        Returns:
+            Lista de (posição, requisição), vazia se nenhuma loja pendente
+            tiver vaga
+        """
+        for _ in range(len(self._turns)):
+            id = self._turns.popleft()
+            if (
+                self._max_per_tenant is not None
+                and self._in_flight.get(id, 0) >= self._max_per_tenant
+            ):
+                self._turns.append(id)
+                continue
+
+            queue = self._pending[id]
+            batch = [queue.popleft()]
+            first = batch[0][1]
+            while (
+                queue
+                and len(batch) < max_items
+                and queue[0][1].url == first.url
+                and queue[0][1].headers == first.headers
+            ):
+                batch.append(queue.popleft())
+            if queue:
+                self._turns.append(id)
+            else:
+                del self._pending[id]
+            self._in_flight[id] = self._in_flight.get(id, 0) + 1
+            self._size -= len(batch)
+            return batch
+        return []
+
+    def clear(self) -> List[Tuple[int, BatchRequest]]:
+        """
+        Retira todas as requisições pendentes, inclusive de lojas sem vaga.
+
+        Returns:
+            Lista de (posição, requisição) que ainda não tinham começado
+        """
+        items = [item for queue in self._pending.values() for item in queue]
+        self._pending.clear()
+        self._turns.clear()
+        self._size = 0
+        return items
+
+    def release(self, id: str) -> None:
+        """
+        Libera a vaga de uma requisição concluída.
+
+        Args:
+            id: Identificador da loja
+        """
+        remaining = self._in_flight[id] - 1
+        if remaining:
+            self._in_flight[id] = remaining
+        else:
+            del self._in_flight[id]
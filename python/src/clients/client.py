@@ -5,16 +5,28 @@ Esta é a nova implementação do cliente  que segue os princípios SOLID
 e usa Design Patterns para uma arquitetura mais limpa e testável.
 """
 
-import json
+import itertools
 import time
-from typing import Any, Dict, Optional
-
-import requests
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from src.services.tratamento_de_resposta import tratamento_de_resposta
 
 from ..interfaces.token_manager_interface import ITokenManager
+from ..interfaces.transport_interface import ITransport
+from .batch import BatchRequest, BatchResult, FairQueue
+from ..services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from ..services.rate_limiter import RateLimitedError, RateLimiter
+from ..services.response_cache import ResponseCache
+from ..services.retry_policy import IDEMPOTENT_METHODS, RetryBudget, RetryPolicy
+from ..utils import compression, metrics
+from ..utils.json_backend import dumps
+from ..utils.json_stream import JsonArrayStream
 from ..utils.log import log
+from ..utils.pagination import Pagination
+from ..utils.single_flight import SingleFlight
+from .transport import RequestsTransport
+from .write_queue import WriteQueue
 
 
 class Client:
@@ -34,49 +46,126 @@ class Client:
         token_manager: ITokenManager,
         max_retries: int,
         retry_delay: float,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        transport: Optional[ITransport] = None,
+        request_compression: Optional[str] = None,
+        compression_min_size: int = 1024,
+        accept_encoding: Optional[str] = None,
     ):
         """
         Inicializa o cliente .
 
         Args:
             token_manager: Gerenciador de tokens
-            api_client: Cliente HTTP para requisições
+            max_retries: Número máximo de tentativas para requisições
+            retry_delay: Delay entre tentativas em segundos
+            pool_connections: Quantidade de hosts com pool de conexões mantido
+            pool_maxsize: Conexões mantidas abertas por host
+            pool_block: Se True, aguarda conexão livre em vez de abrir conexões extras
+            keep_alive: Se False, fecha a conexão após cada requisição
+            connect_timeout: Timeout de conexão em segundos
+            read_timeout: Timeout de leitura em segundos
+            rate_limiter: Limitador de taxa por loja (opcional)
+            retry_policy: Política de novas tentativas. Se None, usa backoff
+                exponencial com max_retries tentativas e retry_delay de base
+            retry_budget: Orçamento de novas tentativas do cliente (opcional)
+            circuit_breaker: Circuit breaker por loja (opcional)
+            response_cache: Cache de respostas de GET (opcional)
+            transport: Transporte HTTP. Se None, usa HTTP/1.1 (requests) com o
+                pool configurado por pool_connections, pool_maxsize, pool_block
+                e keep_alive
+            request_compression: Codificação dos corpos de POST: "gzip", "br"
+                (extra "brotli") ou None para enviar sem compressão
+            compression_min_size: Corpos menores que isso, em bytes, não são
+                comprimidos
+            accept_encoding: Valor do header Accept-Encoding. Se None, anuncia
+                as codificações que o transporte decodifica (br só com brotli)
+        Raises:
+            ValueError: Se request_compression for inválida ou indisponível
         """
+        if request_compression is not None:
+            # Valida já na criação: falhar só no primeiro POST seria tarde demais
+            compression.compress(b"", request_compression)
         self._token_manager = token_manager
-        self._max_retries = max_retries
-        self._retry_delay = retry_delay
+        self._timeout = (connect_timeout, read_timeout)
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retries, base_delay=retry_delay
+        )
+        self._retry_budget = retry_budget or RetryBudget()
+        self._circuit_breaker = circuit_breaker
+        self._response_cache = response_cache
+        self._get_flight = SingleFlight()
+        self._pool_maxsize = pool_maxsize
+        self._request_compression = request_compression
+        self._compression_min_size = compression_min_size
+        self._accept_encoding = accept_encoding or compression.accept_encoding()
+        self._transfer_stats = compression.TransferStats()
+        self._transport = transport or RequestsTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
 
     def get(
         self, url: str, id: str, headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Executa requisição GET na API .
+
+        Com cache de respostas, GETs repetidos dentro do TTL não vão à API e
+        GETs idênticos simultâneos compartilham uma única requisição. A
+        resposta em cache é compartilhada e não deve ser alterada.
         """
-        try:
-            access_token = self._token_manager.get_access_token(id)
-
-            headers = {
-                "Accept": "application/json",
-                "Authorization": f"Bearer {access_token}",
-            }
-            for attempt in range(self._max_retries):
-                response = requests.get(url, headers=headers)
-                result = tratamento_de_resposta(response)
-
-                if not result["retry"]:
-                    return result["response"]
-                if not result["refresh_token"]:
-                    time.sleep(self._retry_delay)
-                    continue
-                if result["refresh_token"]:
-                    access_token = self._token_manager.force_refreshing_token(id)
-
-                return result["response"]
-            return result["response"] if result else {}
-
-        except Exception as e:
-            log.error(f"Erro na requisição GET para {id}: {e}")
-            raise
+        headers = {**(headers or {}), "Accept": "application/json"}
+        if self._response_cache is None:
+            return self._request("GET", url, id, headers=headers)
+
+        key = ResponseCache.key(id, url, headers)
+        body, etag = self._response_cache.get(key)
+        if body is not None:
+            metrics.increment("response_cache_hits_total")
+            return body
+        metrics.increment("response_cache_misses_total")
+        return self._get_flight.do(
+            key, lambda: self._fetch_and_cache(key, url, id, headers, etag)
+        )
+
+    def _fetch_and_cache(
+        self,
+        key: str,
+        url: str,
+        id: str,
+        headers: Dict[str, str],
+        etag: Optional[str],
+    ) -> Any:
+        """Executa o GET, revalidando por ETag, e guarda a resposta no cache."""
+        info: Dict[str, Any] = {}
+        request_headers = {**headers, "If-None-Match": etag} if etag else headers
+        body = self._request(
+            "GET", url, id, headers=request_headers, response_info=info
+        )
+        status = info.get("status", 0)
+        if status == 304:
+            cached = self._response_cache.revalidate(key)
+            if cached is not None:
+                return cached
+            # Entrada descartada durante a revalidação: busca o corpo de novo
+            return self._fetch_and_cache(key, url, id, headers, None)
+        if 200 <= status < 300:
+            self._response_cache.put(key, body, info["headers"])
+        return body
 
     def post(
         self,
@@ -87,28 +176,589 @@ class Client:
     ) -> Dict[str, Any]:
         """
         Executa requisição POST na API .
+
+        Com request_compression, corpos a partir de compression_min_size
+        bytes são enviados comprimidos, com o header Content-Encoding.
+        """
+        headers = {
+            **(headers or {}),
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        body = wire_body = dumps(data)
+        if self._request_compression and len(body) >= self._compression_min_size:
+            wire_body = compression.compress(body, self._request_compression)
+            headers["Content-Encoding"] = self._request_compression
+        self._transfer_stats.record_request(len(body), len(wire_body))
+        return self._request("POST", url, id, headers=headers, data=wire_body)
+
+    def map(
+        self,
+        requests_: Iterable[Union[BatchRequest, Tuple[Any, ...]]],
+        max_workers: Optional[int] = None,
+        max_per_tenant: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Executa um lote de requisições em um pool de threads.
+
+        As threads compartilham a sessão (e o pool de conexões), o gerenciador
+        de tokens, o limitador e o circuit breaker do cliente. As vagas são
+        distribuídas entre as lojas em rodízio, então uma loja com muitas
+        requisições não impede o andamento das demais.
+
+        Args:
+            requests_: Requisições do lote, como BatchRequest ou tuplas
+                (url, id[, method[, data[, headers]]])
+            max_workers: Requisições simultâneas (padrão: pool_maxsize, para
+                que cada thread tenha uma conexão do pool)
+            max_per_tenant: Requisições simultâneas por loja (None = sem limite)
+            ordered: Se True, entrega os resultados na ordem do lote; se False,
+                à medida que terminam
+            return_exceptions: Se True, exceções vão em BatchResult.error; se
+                False, a primeira exceção interrompe o lote
+
+        Returns:
+            Iterador de BatchResult
+        """
+        queue = FairQueue(max_per_tenant)
+        for index, spec in enumerate(requests_):
+            queue.push(index, BatchRequest.of(spec))
+
+        workers = max_workers or self._pool_maxsize
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch")
+        running: Dict[Future, Tuple[int, BatchRequest]] = {}
+        finished: Dict[int, BatchResult] = {}
+        next_index = 0
+        try:
+            while queue or running:
+                while len(running) < workers:
+                    item = queue.pop()
+                    if item is None:
+                        break
+                    running[executor.submit(self._execute, item[1])] = item
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, request = running.pop(future)
+                    queue.release(request.id)
+                    error = future.exception()
+                    if error is not None and not return_exceptions:
+                        raise error
+                    result = BatchResult(
+                        index, request, future.result() if error is None else None, error
+                    )
+                    if ordered:
+                        finished[index] = result
+                    else:
+                        yield result
+
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            # Lote interrompido: descarta o que ainda não começou
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def write_queue(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_pending: int = 1000,
+        ordered: bool = False,
+        max_per_tenant: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        bulk_url: str = "{url}/lote",
+        bulk_key: str = "data",
+    ) -> WriteQueue:
+        """
+        Cria uma fila de escrita sobre este cliente.
+
+        Os POSTs submetidos à fila retornam um Future e são enviados em
+        threads que compartilham o transporte, o gerenciador de tokens, o
+        limitador e o circuit breaker do cliente. Feche a fila (ou use-a em
+        um bloco with) antes do cliente, para que nada pendente se perca.
+
+        Args:
+            max_in_flight: Requisições simultâneas (padrão: pool_maxsize, para
+                que cada thread tenha uma conexão do pool)
+            max_pending: Itens enfileirados ou em envio a partir dos quais
+                submit bloqueia
+            ordered: Se True, mantém a ordem de envio dos itens de cada loja
+            max_per_tenant: Requisições simultâneas por loja (None = sem limite)
+            batch_size: Se informado, agrupa até batch_size itens pendentes da
+                mesma loja e URL em um POST ao endpoint de lote
+            bulk_url: URL do endpoint de lote, a partir da URL do item ({url})
+            bulk_key: Chave da lista de itens no corpo do lote e na resposta
+
+        Returns:
+            Fila de escrita
+        """
+        return WriteQueue(
+            self,
+            max_in_flight=max_in_flight or self._pool_maxsize,
+            max_pending=max_pending,
+            ordered=ordered,
+            max_per_tenant=max_per_tenant,
+            batch_size=batch_size,
+            bulk_url=bulk_url,
+            bulk_key=bulk_key,
+        )
+
+    def _execute(self, request: BatchRequest) -> Dict[str, Any]:
+        """Executa uma requisição do lote."""
+        if request.method == "POST":
+            return self.post(request.url, request.data or {}, request.id, request.headers)
+        return self.get(request.url, request.id, request.headers)
+
+    def stream_items(
+        self,
+        url: str,
+        id: str,
+        key: Optional[str] = "data",
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """
+        Percorre os itens de uma resposta grande enquanto o corpo é recebido.
+
+        Os elementos do array em key são decodificados um a um, sem carregar
+        a resposta inteira em memória.
+
+        Args:
+            url: URL da requisição
+            id: Identificador da loja
+            key: Chave do objeto raiz com o array (None se a resposta for o array)
+            headers: Headers adicionais (opcional)
+            chunk_size: Tamanho dos pedaços lidos do corpo, em bytes
+
+        Returns:
+            Iterador dos itens
         """
+        response = self._request(
+            "GET",
+            url,
+            id,
+            headers={**(headers or {}), "Accept": "application/json"},
+            stream=True,
+        )
+        if not self._transport.is_response(response):
+            log.warning("Resposta de erro ao ler itens de %s", id)
+            return
+
+        parser = JsonArrayStream(key)
+        decoder = compression.StreamDecoder(response.headers.get("Content-Encoding"))
+        wire_size = size = 0
         try:
-            access_token = self._token_manager.get_access_token(id)
-
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "Authorization": f"Bearer {access_token}",
-            }
-            payload = json.dumps(data)
-            for attempt in range(self._max_retries):
-                response = requests.post(url, headers=headers, data=payload)
-                result = tratamento_de_resposta(response)
-
-                if result["finished"]:
-                    return result["response"]
-                if result["retry"]:
-                    time.sleep(self._retry_delay)
-                    continue
-                return result["response"]
-            return result["response"] if result else {}
-
-        except Exception as e:
-            log.error(f"Erro na requisição GET para {id}: {e}")
+            for chunk in self._transport.iter_raw(response, chunk_size):
+                wire_size += len(chunk)
+                data = decoder.decompress(chunk)
+                size += len(data)
+                yield from parser.feed(data)
+            data = decoder.flush()
+            size += len(data)
+            yield from parser.feed(data)
+        except Exception:
+            # Corpo interrompido ou corrompido conta como falha da loja
+            self._record_outcome(id, 0)
             raise
+        finally:
+            response.close()
+            self._record_response_size("GET", url, response, wire_size, size)
+        parser.close()
+
+    def iter_pages(
+        self,
+        url: str,
+        id: str,
+        pagination: Optional[Pagination] = None,
+        prefetch: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as páginas de uma listagem sob demanda.
+
+        Só a página atual fica em memória; com prefetch, a próxima página é
+        buscada em segundo plano enquanto a atual é consumida.
+
+        Args:
+            url: URL da listagem, sem os parâmetros de paginação
+            id: Identificador da loja
+            pagination: Regras de paginação (padrão: pagina/limite com 100 itens)
+            prefetch: Se True, busca a próxima página antecipadamente
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador das respostas de cada página
+        Raises:
+            PaginationError: Se uma página vier sem a lista de itens (resposta
+                de erro da API)
+        """
+        pagination = pagination or Pagination()
+        executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="pagination")
+            if prefetch
+            else None
+        )
+        pending: Optional[Future] = None
+        position = pagination.start
+        try:
+            page = self.get(pagination.url(url, position), id, headers)
+            while True:
+                next_position = pagination.next(position, pagination.items(page))
+                if executor is not None and next_position is not None:
+                    pending = executor.submit(
+                        self.get, pagination.url(url, next_position), id, headers
+                    )
+                yield page
+                if next_position is None:
+                    return
+                position = next_position
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    page = self.get(pagination.url(url, position), id, headers)
+        finally:
+            # Iteração interrompida: descarta a página antecipada
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def iter_items(
+        self,
+        url: str,
+        id: str,
+        pagination: Optional[Pagination] = None,
+        prefetch: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Any]:
+        """
+        Percorre os itens de uma listagem, página a página.
+
+        Args:
+            url: URL da listagem, sem os parâmetros de paginação
+            id: Identificador da loja
+            pagination: Regras de paginação (padrão: pagina/limite com 100 itens)
+            prefetch: Se True, busca a próxima página antecipadamente
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador dos itens de todas as páginas
+        Raises:
+            PaginationError: Se uma página vier sem a lista de itens (resposta
+                de erro da API)
+        """
+        pagination = pagination or Pagination()
+        for page in self.iter_pages(url, id, pagination, prefetch, headers):
+            yield from pagination.items(page)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        id: str,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        stream: bool = False,
+        response_info: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Executa a requisição com novas tentativas e refresh de token.
+
+        Em resposta 401 o token é renovado (uma única vez por loja, mesmo com
+        várias requisições concorrentes) e a requisição é repetida. Com
+        circuit breaker, lojas com o circuito aberto falham imediatamente
+        com CircuitOpenError. Com limitador de taxa, lojas cuja espera já
+        excede o max_elapsed da política falham com RateLimitedError.
+
+        Args:
+            method: Método HTTP
+            url: URL da requisição
+            id: Identificador da loja
+            headers: Headers da requisição, sem Authorization
+            data: Corpo já serializado (opcional)
+            stream: Se True, respostas 2xx são retornadas sem ler o corpo
+            response_info: Se informado, recebe status e headers da última resposta
+
+        Returns:
+            Conteúdo da resposta, ou a resposta ainda não lida com stream=True
+        """
+        with metrics.stage("request", id, method=method):
+            try:
+                access_token = self._token_manager.get_access_token(id)
+                result: Dict[str, Any] = {}
+
+                started = time.monotonic()
+                self._retry_budget.record_request()
+                self._check_rate_limit_wait(id)
+
+                for attempt in itertools.count(1):
+                    if self._circuit_breaker is not None:
+                        self._circuit_breaker.before_request(id)
+                    try:
+                        if self._rate_limiter is not None:
+                            waited = self._rate_limiter.acquire(id)
+                            if waited:
+                                metrics.observe("rate_limit_wait_seconds", waited)
+                        with metrics.stage("http", id, method=method):
+                            response = self._transport.request(
+                                method,
+                                url,
+                                headers={
+                                    "Accept-Encoding": self._accept_encoding,
+                                    **headers,
+                                    "Authorization": f"Bearer {access_token}",
+                                },
+                                data=data,
+                                timeout=self._timeout,
+                                stream=stream,
+                            )
+                        result = tratamento_de_resposta(response, stream)
+                        status = response.status_code
+                        if result["response"] is not response:
+                            self._record_response_size(
+                                method,
+                                url,
+                                response,
+                                self._transport.wire_bytes(response),
+                                len(response.content),
+                            )
+                    except self._transport.connection_errors:
+                        self._record_outcome(id, 0)
+                        # Erros de conexão só são repetidos em métodos idempotentes
+                        if (
+                            method not in IDEMPOTENT_METHODS
+                            or not self._retry_policy.retry_connection_errors
+                        ):
+                            raise
+                        delay = self._next_retry_delay(id, attempt, 0, None, started)
+                        if delay is None:
+                            raise
+                        time.sleep(delay)
+                        continue
+                    except BaseException:
+                        # Qualquer outra falha da tentativa (corpo corrompido, URL
+                        # inválida, interrupção) também devolve a vaga do circuito
+                        self._record_outcome(id, 0)
+                        raise
+
+                    self._record_outcome(id, status)
+                    if metrics.enabled:
+                        metrics.increment(
+                            "http_responses_total", method=method, status=str(status)
+                        )
+                    if response_info is not None:
+                        response_info["status"] = status
+                        response_info["headers"] = response.headers
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.observe(
+                            id, status, response.headers, result["retry_after"]
+                        )
+
+                    if not self._retry_policy.should_retry(status, result, method):
+                        return result["response"]
+                    delay = self._next_retry_delay(
+                        id,
+                        attempt,
+                        status,
+                        result["retry_after"],
+                        started,
+                        result["refresh_token"],
+                    )
+                    if delay is None:
+                        break
+                    if result["refresh_token"]:
+                        access_token = self._token_manager.force_refreshing_token(
+                            id, stale_token=access_token
+                        )
+                        continue
+                    time.sleep(delay)
+
+                return result["response"] if result else {}
+
+            except CircuitOpenError:
+                metrics.increment("circuit_rejections_total")
+                raise
+            except RateLimitedError:
+                metrics.increment("rate_limit_rejections_total")
+                raise
+            except Exception as e:
+                log.error("Erro na requisição %s para %s: %s", method, id, e)
+                raise
+
+    def _record_response_size(
+        self, method: str, url: str, response: Any, wire_size: int, size: int
+    ) -> None:
+        """Registra os bytes do corpo recebido: na rede e decodificado."""
+        self._transfer_stats.record_response(wire_size, size)
+        log.debug(
+            "%s %s: %d bytes recebidos (%d decodificados, %s)",
+            method,
+            url,
+            wire_size,
+            size,
+            response.headers.get("Content-Encoding", "identity"),
+        )
+
+    def _record_outcome(self, id: str, status: int) -> None:
+        """Informa ao circuit breaker o resultado da tentativa (0 = erro de conexão)."""
+        if self._circuit_breaker is None:
+            return
+        # 429 indica API saudável limitando a taxa; quem trata é o limitador
+        if status == 0 or status >= 500:
+            self._circuit_breaker.record_failure(id)
+        else:
+            self._circuit_breaker.record_success(id)
+
+    def _check_rate_limit_wait(self, id: str) -> None:
+        """
+        Recusa a requisição se a espera do limitador já excede max_elapsed.
+
+        Um Retry-After longo recebido por outra requisição da loja bloquearia
+        o acquire além do tempo total da política.
+
+        Args:
+            id: Identificador da loja
+        Raises:
+            RateLimitedError: Se a espera exceder max_elapsed
+        """
+        max_elapsed = self._retry_policy.max_elapsed
+        if self._rate_limiter is None or max_elapsed is None:
+            return
+        wait = self._rate_limiter.get_wait(id)
+        if wait > max_elapsed:
+            self._retry_budget.record_give_up("max_elapsed")
+            metrics.increment("retry_give_ups_total", reason="max_elapsed")
+            raise RateLimitedError(id, wait)
+
+    def _next_retry_delay(
+        self,
+        id: str,
+        attempt: int,
+        status: int,
+        retry_after: Optional[float],
+        started: float,
+        refresh: bool = False,
+    ) -> Optional[float]:
+        """
+        Decide se a requisição pode ser tentada de novo e quanto esperar.
+
+        Args:
+            id: Identificador da loja
+            attempt: Número da tentativa que acabou de falhar
+            status: Status HTTP da resposta (0 para erro de conexão)
+            retry_after: Espera pedida pela API em segundos (opcional)
+            started: Início da requisição em time.monotonic()
+            refresh: Se a nova tentativa ocorre após refresh do token
+
+        Returns:
+            Espera em segundos, ou None para desistir
+        """
+        policy = self._retry_policy.for_status(status)
+        if attempt >= policy.max_attempts:
+            self._retry_budget.record_give_up("max_attempts")
+            metrics.increment("retry_give_ups_total", reason="max_attempts")
+            return None
+
+        if refresh:
+            delay = wait = 0.0
+        elif self._rate_limiter is not None and (status == 429 or retry_after is not None):
+            # O limitador já bloqueia a loja pelo tempo pedido pela API: a espera
+            # acontece no acquire, mas conta para o tempo total
+            delay = 0.0
+            wait = max(self._rate_limiter.get_wait(id), retry_after or 0.0)
+        else:
+            delay = wait = policy.delay(attempt, retry_after)
+
+        elapsed = time.monotonic() - started
+        if policy.max_elapsed is not None and elapsed + wait > policy.max_elapsed:
+            self._retry_budget.record_give_up("max_elapsed")
+            metrics.increment("retry_give_ups_total", reason="max_elapsed")
+            return None
+        if not self._retry_budget.try_retry(status, wait):
+            log.warning("Orçamento de novas tentativas esgotado (status %s)", status)
+            metrics.increment("retry_give_ups_total", reason="budget")
+            return None
+        if metrics.enabled:
+            metrics.increment("retries_total", status=str(status))
+        return delay
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas de novas tentativas do cliente.
+
+        Returns:
+            Dicionário com requisições, novas tentativas por status,
+            desistências por motivo, tempo de espera e orçamento disponível
+        """
+        return self._retry_budget.get_stats()
+
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache de respostas de GET.
+
+        Returns:
+            Dicionário com tamanho, acertos, faltas, taxa de acerto,
+            revalidações por 304, remoções e GETs coalescidos, ou vazio se o
+            cliente não usa cache de respostas
+        """
+        if self._response_cache is None:
+            return {}
+        return {
+            **self._response_cache.get_stats(),
+            "coalesced": self._get_flight.get_stats()["coalesced"],
+        }
+
+    def invalidate_response_cache(self, id: Optional[str] = None) -> None:
+        """
+        Descarta respostas de GET em cache.
+
+        Args:
+            id: Identificador da loja. Se None, descarta todas
+        """
+        if self._response_cache is not None:
+            self._response_cache.invalidate(id)
+
+    def get_transfer_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os bytes transferidos, na rede e decodificados.
+
+        Returns:
+            Dicionário com totais de corpos de requisição (request_bytes,
+            request_wire_bytes) e de resposta (response_bytes,
+            response_wire_bytes), com as razões wire/decodificado
+        """
+        return self._transfer_stats.get_stats()
+
+    def get_circuit_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado dos circuitos por loja.
+
+        Returns:
+            Dicionário com requisições recusadas e lojas com falhas recentes,
+            ou vazio se o cliente não usa circuit breaker
+        """
+        if self._circuit_breaker is None:
+            return {}
+        return self._circuit_breaker.get_stats()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas das conexões do transporte.
+
+        Returns:
+            Dicionário com ao menos requests e open_connections; com HTTP/1.1
+            inclui também reuso de conexões e detalhes por host
+        """
+        return self._transport.get_pool_stats()
+
+    def close(self) -> None:
+        """Fecha o transporte HTTP e todas as conexões."""
+        self._transport.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
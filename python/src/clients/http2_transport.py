@@ -0,0 +1,129 @@
+"""
+Transporte HTTP/2 do cliente, sobre httpx.
+
+Várias requisições simultâneas ao mesmo host são multiplexadas em uma
+única conexão, em vez de uma conexão por requisição em andamento. Servidores
+que não negociam HTTP/2 (ALPN) são atendidos em HTTP/1.1.
+
+Requer o extra "http2" (httpx com h2).
+"""
+
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+from ..interfaces.transport_interface import ITransport
+
+
+class Http2Transport(ITransport):
+    """Transporte HTTP/2 multiplexado, com HTTP/1.1 como alternativa."""
+
+    connection_errors = (httpx.TransportError,)
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keep_alive_expiry: float = 5.0,
+        prior_knowledge: bool = False,
+    ):
+        """
+        Inicializa o transporte.
+
+        Args:
+            max_connections: Conexões abertas no pool (com HTTP/2 basta uma por host)
+            max_keepalive_connections: Conexões ociosas mantidas no pool
+            keep_alive_expiry: Tempo em segundos que uma conexão ociosa é mantida
+            prior_knowledge: Se True, usa HTTP/2 sem negociação (h2c), inclusive
+                em URLs http://; sem alternativa para HTTP/1.1
+        """
+        self._transport = httpx.HTTPTransport(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keep_alive_expiry,
+            ),
+        )
+        # Redirecionamentos seguidos como no transporte HTTP/1.1 (requests)
+        self._client = httpx.Client(transport=self._transport, follow_redirects=True)
+        self._timeouts: Dict[Tuple[float, float], httpx.Timeout] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        stream: bool = False,
+    ) -> httpx.Response:
+        """
+        Envia uma requisição, compartilhando a conexão HTTP/2 do host.
+
+        Args:
+            method: Método HTTP
+            url: URL da requisição
+            headers: Headers da requisição
+            data: Corpo da requisição (opcional)
+            timeout: Timeouts de conexão e de leitura em segundos
+            stream: Se True, o corpo não é lido antes de retornar
+
+        Returns:
+            Resposta do httpx
+        """
+        with self._lock:
+            self._requests += 1
+        request = self._client.build_request(
+            method, url, headers=headers, content=data, timeout=self._timeout(timeout)
+        )
+        return self._client.send(request, stream=stream)
+
+    def is_response(self, value: Any) -> bool:
+        """Indica se o valor é uma resposta do httpx."""
+        return isinstance(value, httpx.Response)
+
+    def iter_raw(self, response: httpx.Response, chunk_size: int) -> Iterator[bytes]:
+        """Lê o corpo da resposta como recebido, em pedaços de até chunk_size bytes."""
+        return response.iter_raw(chunk_size)
+
+    def wire_bytes(self, response: httpx.Response) -> int:
+        """Bytes do corpo recebidos pelo httpx, antes da descompressão."""
+        return response.num_bytes_downloaded
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas das conexões.
+
+        Returns:
+            Dicionário com requests, open_connections, http2_connections,
+            idle_connections e requests_per_connection
+        """
+        connections = list(self._transport._pool.connections)
+        open_connections = [c for c in connections if not c.is_closed()]
+        with self._lock:
+            requests_count = self._requests
+        return {
+            "requests": requests_count,
+            "open_connections": len(open_connections),
+            "http2_connections": sum(1 for c in open_connections if "HTTP/2" in c.info()),
+            "idle_connections": sum(1 for c in open_connections if c.is_idle()),
+            "requests_per_connection": (
+                requests_count / len(open_connections) if open_connections else 0.0
+            ),
+        }
+
+    def close(self) -> None:
+        """Fecha o cliente HTTP e todas as conexões."""
+        self._client.close()
+
+    def _timeout(self, timeout: Tuple[float, float]) -> httpx.Timeout:
+        value = self._timeouts.get(timeout)
+        if value is None:
+            connect, read = timeout
+            value = self._timeouts[timeout] = httpx.Timeout(read, connect=connect)
+        return value
@@ -0,0 +1,160 @@
+"""
+Transporte HTTP/1.1 do cliente, sobre requests.
+
+Cada requisição em andamento ocupa uma conexão do pool; é o transporte
+padrão do Client.
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from ..interfaces.transport_interface import ITransport
+from ..utils.compression import StreamDecoder
+
+# Tamanho dos pedaços lidos do corpo de respostas sem stream
+_READ_CHUNK = 65536
+
+
+class RequestsTransport(ITransport):
+    """Transporte HTTP/1.1 com pool de conexões por host."""
+
+    connection_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        """
+        Inicializa o transporte.
+
+        Args:
+            pool_connections: Quantidade de hosts com pool de conexões mantido
+            pool_maxsize: Conexões mantidas abertas por host
+            pool_block: Se True, aguarda conexão livre em vez de abrir conexões extras
+            keep_alive: Se False, fecha a conexão após cada requisição
+        """
+        # Sessão própria com pool de conexões: evita novo handshake TCP+TLS a cada chamada
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Envia uma requisição pela sessão.
+
+        Args:
+            method: Método HTTP
+            url: URL da requisição
+            headers: Headers da requisição
+            data: Corpo da requisição (opcional)
+            timeout: Timeouts de conexão e de leitura em segundos
+            stream: Se True, o corpo não é lido antes de retornar
+
+        Returns:
+            Resposta do requests
+        """
+        response = self._session.request(
+            method, url, headers=headers, data=data, timeout=timeout, stream=True
+        )
+        if not stream:
+            self._read_body(response)
+        return response
+
+    def is_response(self, value: Any) -> bool:
+        """Indica se o valor é uma resposta do requests."""
+        return isinstance(value, requests.Response)
+
+    def iter_raw(self, response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        """Lê o corpo da resposta como recebido, em pedaços de até chunk_size bytes."""
+        try:
+            yield from response.raw.stream(chunk_size, decode_content=False)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except ReadTimeoutError as e:
+            raise requests.ConnectionError(e) from e
+
+    def wire_bytes(self, response: requests.Response) -> int:
+        """Bytes do corpo recebidos da rede, contados ao ler a resposta."""
+        return getattr(response, "_wire_bytes", len(response.content))
+
+    def _read_body(self, response: requests.Response) -> None:
+        # O urllib3 não conta os bytes de respostas chunked: o corpo é lido
+        # sem decodificar, contado e então descomprimido
+        decoder = StreamDecoder(response.headers.get("Content-Encoding"))
+        parts = []
+        wire_bytes = 0
+        for chunk in self.iter_raw(response, _READ_CHUNK):
+            wire_bytes += len(chunk)
+            parts.append(decoder.decompress(chunk))
+        parts.append(decoder.flush())
+        # Mesmo estado que requests deixa após ler Response.content
+        response._content = b"".join(parts)
+        response._content_consumed = True
+        response._wire_bytes = wire_bytes
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas dos pools de conexão.
+
+        Returns:
+            Dicionário com totais e detalhes por host:
+            requests, new_connections, reused_connections, reuse_ratio,
+            idle_connections e in_use_connections
+        """
+        hosts: Dict[str, Dict[str, Any]] = {}
+        pools = self._adapter.poolmanager.pools
+        with pools.lock:
+            items = list(pools._container.items())
+
+        for key, pool in items:
+            requests_count = pool.num_requests
+            new_connections = pool.num_connections
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            # Conexões fora da fila estão emprestadas a uma requisição em andamento
+            in_use = max(pool.pool.maxsize - pool.pool.qsize(), 0)
+            hosts[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = {
+                "requests": requests_count,
+                "new_connections": new_connections,
+                "reused_connections": max(requests_count - new_connections, 0),
+                "idle_connections": idle,
+                "in_use_connections": in_use,
+            }
+
+        total_requests = sum(h["requests"] for h in hosts.values())
+        total_reused = sum(h["reused_connections"] for h in hosts.values())
+        return {
+            "requests": total_requests,
+            "new_connections": sum(h["new_connections"] for h in hosts.values()),
+            "reused_connections": total_reused,
+            "reuse_ratio": total_reused / total_requests if total_requests else 0.0,
+            "open_connections": sum(
+                h["idle_connections"] + h["in_use_connections"] for h in hosts.values()
+            ),
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Fecha a sessão HTTP e todas as conexões do pool."""
+        self._session.close()
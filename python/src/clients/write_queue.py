@@ -0,0 +1,290 @@
+"""
+Fila de escrita do Client.
+
+Recebe os POSTs de cada loja, devolve um Future por item e os envia em
+threads, com um número limitado de requisições simultâneas. Opcionalmente
+mantém a ordem dos itens de cada loja e agrupa os itens pendentes em
+requisições ao endpoint de lote da API.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..utils import metrics
+from .batch import BatchRequest, FairQueue
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+class BulkResponseError(Exception):
+    """Resposta do endpoint de lote sem exatamente um resultado por item."""
+
+    def __init__(self, response: Any, items: int):
+        super().__init__(
+            f"Resposta do lote não traz um resultado para cada um dos {items} itens: "
+            f"{response!r:.200}"
+        )
+        self.response = response
+        self.items = items
+
+
+class WriteQueue:
+    """Fila de POSTs com concorrência limitada, ordem por loja e lotes."""
+
+    def __init__(
+        self,
+        client: "Client",
+        max_in_flight: int = 10,
+        max_pending: int = 1000,
+        ordered: bool = False,
+        max_per_tenant: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        bulk_url: str = "{url}/lote",
+        bulk_key: str = "data",
+    ):
+        """
+        Inicializa a fila e suas threads de envio.
+
+        Args:
+            client: Cliente usado nos POSTs
+            max_in_flight: Requisições simultâneas (uma thread por requisição)
+            max_pending: Itens enfileirados ou em envio a partir dos quais
+                submit bloqueia
+            ordered: Se True, os itens de cada loja são enviados um lote por
+                vez, na ordem em que foram submetidos
+            max_per_tenant: Requisições simultâneas por loja (None = sem
+                limite). Ignorado com ordered, que usa 1
+            batch_size: Se informado, itens pendentes da mesma loja e URL são
+                enviados juntos ao endpoint de lote, até batch_size por
+                requisição. Se None, cada item vai em um POST
+            bulk_url: URL do endpoint de lote, a partir da URL do item ({url})
+            bulk_key: Chave da lista de itens no corpo do lote e na resposta
+        """
+        if max_in_flight < 1 or max_pending < 1:
+            raise ValueError("max_in_flight e max_pending devem ser positivos")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size inválido: {batch_size}")
+
+        self._client = client
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._bulk_url = bulk_url
+        self._bulk_key = bulk_key
+
+        self._queue = FairQueue(1 if ordered else max_per_tenant)
+        self._futures: Dict[int, Future] = {}
+        self._condition = threading.Condition()
+        self._next_index = 0
+        # Itens enfileirados ou em envio: é o que a pressão de volta limita
+        self._pending = 0
+        self._in_flight = 0
+        self._closed = False
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._requests = 0
+        self._blocked = 0
+        self._blocked_seconds = 0.0
+
+        self._threads = [
+            threading.Thread(target=self._run, name=f"write-queue-{n}", daemon=True)
+            for n in range(max_in_flight)
+        ]
+        for thread in self._threads:
+            thread.start()
+        atexit.register(self.close)
+
+    def submit(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        id: str,
+        headers: Optional[Dict[str, str]] = None,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Enfileira um POST.
+
+        Com a fila cheia (max_pending), aguarda até haver espaço.
+
+        Args:
+            url: URL da requisição
+            data: Corpo do POST
+            id: Identificador da loja
+            headers: Headers adicionais (opcional)
+            block: Se False, não aguarda espaço na fila
+            timeout: Espera máxima por espaço na fila, em segundos
+        Returns:
+            Future com o conteúdo da resposta do item (com batch_size, o
+            elemento correspondente da resposta do lote; BulkResponseError se
+            a resposta não trouxer um resultado por item)
+        Raises:
+            queue.Full: Se a fila continuar cheia
+            RuntimeError: Se a fila estiver encerrada
+        """
+        request = BatchRequest(url, id, "POST", data, headers)
+        with self._condition:
+            if self._pending >= self._max_pending and not self._closed:
+                if not block:
+                    raise queue.Full
+                started = time.monotonic()
+                available = self._condition.wait_for(
+                    lambda: self._pending < self._max_pending or self._closed, timeout
+                )
+                waited = time.monotonic() - started
+                self._blocked += 1
+                self._blocked_seconds += waited
+                metrics.observe("write_queue_blocked_seconds", waited)
+                if not available:
+                    raise queue.Full
+            if self._closed:
+                raise RuntimeError("Fila de escrita encerrada")
+
+            future: Future = Future()
+            index = self._next_index
+            self._next_index += 1
+            self._futures[index] = future
+            self._queue.push(index, request)
+            self._pending += 1
+            self._submitted += 1
+            self._condition.notify_all()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o envio de todos os itens já submetidos.
+
+        Args:
+            timeout: Espera máxima em segundos (None = sem limite)
+        Returns:
+            True se não restou item pendente
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, cancel_pending: bool = False) -> None:
+        """
+        Encerra a fila: novos itens são recusados e as threads terminam
+        depois de enviar o que estiver pendente.
+
+        Args:
+            cancel_pending: Se True, cancela os itens que ainda não começaram
+                em vez de enviá-los
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            cancelled = []
+            if cancel_pending:
+                for index, _ in self._queue.clear():
+                    cancelled.append(self._futures.pop(index))
+                self._pending -= len(cancelled)
+                self._cancelled += len(cancelled)
+            self._condition.notify_all()
+        for future in cancelled:
+            future.cancel()
+        for thread in self._threads:
+            thread.join()
+        atexit.unregister(self.close)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas da fila.
+
+        Returns:
+            Dicionário com itens submetidos, concluídos, com erro, cancelados
+            e pendentes, requisições enviadas e em andamento, itens por
+            requisição e esperas por espaço na fila (quantidade e segundos)
+        """
+        with self._condition:
+            sent = self._completed + self._failed
+            return {
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "pending": self._pending,
+                "requests": self._requests,
+                "in_flight": self._in_flight,
+                "items_per_request": sent / self._requests if self._requests else 0.0,
+                "blocked": self._blocked,
+                "blocked_seconds": self._blocked_seconds,
+            }
+
+    def __enter__(self) -> "WriteQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    batch = self._queue.pop_batch(self._batch_size or 1)
+                    # Encerrada, só sai quando não restar item de nenhuma loja
+                    if batch or (self._closed and not self._queue):
+                        break
+                    self._condition.wait()
+                if not batch:
+                    return
+                futures = [self._futures.pop(index) for index, _ in batch]
+                self._in_flight += 1
+
+            items = [
+                (request, future)
+                for (_, request), future in zip(batch, futures, strict=True)
+                if future.set_running_or_notify_cancel()
+            ]
+            failed = self._send(items) if items else 0
+
+            with self._condition:
+                self._queue.release(batch[0][1].id)
+                self._in_flight -= 1
+                self._pending -= len(batch)
+                self._requests += 1 if items else 0
+                self._cancelled += len(batch) - len(items)
+                self._failed += failed
+                self._completed += len(items) - failed
+                self._condition.notify_all()
+
+    def _send(self, items: List[Tuple[BatchRequest, Future]]) -> int:
+        """Envia os itens em uma requisição e resolve os futures; retorna os erros."""
+        first = items[0][0]
+        try:
+            if self._batch_size is None:
+                results = [
+                    self._client.post(first.url, first.data or {}, first.id, first.headers)
+                ]
+            else:
+                response = self._client.post(
+                    self._bulk_url.format(url=first.url),
+                    {self._bulk_key: [request.data for request, _ in items]},
+                    first.id,
+                    first.headers,
+                )
+                results = (
+                    response.get(self._bulk_key) if isinstance(response, dict) else response
+                )
+                if not isinstance(results, list) or len(results) != len(items):
+                    # Sem um resultado por item não há como saber quais foram gravados
+                    raise BulkResponseError(response, len(items))
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            metrics.increment("write_queue_items_total", len(items), status="failed")
+            return len(items)
+
+        for (_, future), result in zip(items, results, strict=True):
+            future.set_result(result)
+        metrics.increment("write_queue_items_total", len(items), status="completed")
+        metrics.observe("write_queue_batch_size", len(items))
+        return 0
@@ -2,13 +2,28 @@
 Factories do pacote Bling.
 
 Este módulo contém as fábricas que implementam o padrão Factory
-para criação de objetos com suas dependências.
+para criação de objetos com suas dependências. As classes são
+importadas sob demanda.
 """
 
-from .factory import BlingFactory
-from .service_factory import ServiceFactory
+from importlib import import_module
+from typing import Any, List
 
-__all__ = [
-    "BlingFactory",
-    "ServiceFactory",
-]
+# Nome exportado -> submódulo que o define
+_EXPORTS = {
+    "Factory": ".factory",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,17 +5,29 @@ Implementa o padrão Factory Method para criação do Ap
 com todas as suas dependências configuradas.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from src.interfaces.checkpoint_repository_interface import ICheckpointRepository
 from src.interfaces.credentials_repository_interface import ICredentialsRepository
 from src.interfaces.encryption_service_interface import IEncryptionService
+from src.interfaces.token_cache_interface import ITokenCache
 from src.repositories.credentials_repository import CredentialsRepository
-from src.services.encryption_service import EncryptionService
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.incremental_sync import IncrementalSync
+from src.services.rate_limiter import RateLimiter
+from src.services.response_cache import ResponseCache
+from src.services.retry_policy import RetryBudget, RetryPolicy
+from src.services.token_cache import TokenCache
 from src.services.token_manager import TokenManager
 
-from ..clients.client import Client
 from ..interfaces.token_manager_interface import ITokenManager
 
+# Clientes e criptografia carregam requests, httpx e cryptography: são
+# importados só quando criados, para manter rápida a importação do pacote
+if TYPE_CHECKING:
+    from ..clients.async_client import AsyncClient
+    from ..clients.client import Client
+
 
 class Factory:
     """Factory para criação do cliente."""
@@ -25,22 +37,82 @@ class Factory:
         self._token_manager: Optional[ITokenManager] = None
         self._credentials_repository: Optional[ICredentialsRepository] = None
         self._encryption_service: Optional[IEncryptionService] = None
+        self._token_cache: Optional[ITokenCache] = None
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self._response_cache: Optional[ResponseCache] = None
+        self._checkpoint_repository: Optional[ICheckpointRepository] = None
 
     def create_client(
         self,
         max_retries: int = 3,
         retry_delay: int = 1,
-    ) -> Client:
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget_ratio: float = 0.2,
+        circuit_failure_threshold: Optional[int] = None,
+        circuit_recovery_timeout: float = 30.0,
+        response_cache_ttl: Optional[float] = None,
+        response_cache_size: int = 1000,
+        http2: bool = False,
+        request_compression: Optional[str] = None,
+        compression_min_size: int = 1024,
+        accept_encoding: Optional[str] = None,
+    ) -> "Client":
         """
         Cria cliente com todas as dependências configuradas.
 
         Args:
             max_retries: Número máximo de tentativas para requisições
             retry_delay: Delay entre tentativas em segundos
+            pool_connections: Quantidade de hosts com pool de conexões mantido
+            pool_maxsize: Conexões mantidas abertas por host
+            pool_block: Se True, aguarda conexão livre quando o pool está cheio
+            keep_alive: Se False, fecha a conexão após cada requisição
+            connect_timeout: Timeout de conexão em segundos
+            read_timeout: Timeout de leitura em segundos
+            rate_limit: Requisições por segundo por loja. Se None, sem limitador
+            rate_limit_burst: Requisições que podem sair de uma vez por loja
+            retry_policy: Política de novas tentativas. Se None, usa backoff
+                exponencial com max_retries tentativas e retry_delay de base
+            retry_budget_ratio: Fração das requisições que pode virar nova tentativa
+            circuit_failure_threshold: Falhas consecutivas que abrem o circuito
+                de uma loja. Se None, sem circuit breaker
+            circuit_recovery_timeout: Tempo em segundos com o circuito aberto
+            response_cache_ttl: Tempo de vida em segundos das respostas de GET
+                em cache. Se None, sem cache de respostas
+            response_cache_size: Número máximo de respostas em cache
+            http2: Se True, usa transporte HTTP/2 (extra "http2"), que multiplexa
+                as requisições simultâneas em uma conexão por host, com até
+                pool_maxsize conexões; servidores sem HTTP/2 são atendidos em
+                HTTP/1.1. Se False, usa HTTP/1.1 com o pool do requests
+            request_compression: Codificação dos corpos de POST: "gzip", "br"
+                (extra "brotli") ou None para enviar sem compressão
+            compression_min_size: Corpos menores que isso, em bytes, não são
+                comprimidos
+            accept_encoding: Valor do header Accept-Encoding. Se None, anuncia
+                as codificações que o transporte decodifica (br só com brotli)
 
         Returns:
             Cliente configurado
         """
+        from ..clients.client import Client
+
+        transport = None
+        if http2:
+            from ..clients.http2_transport import Http2Transport
+
+            transport = Http2Transport(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            )
 
         encryption_service = self.create_encryption_service()
         credentials_repository = self.create_credentials_repository(encryption_service)
@@ -52,17 +124,216 @@ class Factory:
             token_manager=token_manager,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            rate_limiter=(
+                self.create_rate_limiter(rate=rate_limit, burst=rate_limit_burst)
+                if rate_limit is not None
+                else None
+            ),
+            retry_policy=retry_policy,
+            retry_budget=RetryBudget(ratio=retry_budget_ratio),
+            circuit_breaker=(
+                self.create_circuit_breaker(
+                    failure_threshold=circuit_failure_threshold,
+                    recovery_timeout=circuit_recovery_timeout,
+                )
+                if circuit_failure_threshold is not None
+                else None
+            ),
+            response_cache=(
+                self.create_response_cache(
+                    max_size=response_cache_size, ttl=response_cache_ttl
+                )
+                if response_cache_ttl is not None
+                else None
+            ),
+            transport=transport,
+            request_compression=request_compression,
+            compression_min_size=compression_min_size,
+            accept_encoding=accept_encoding,
         )
 
+    def create_async_client(
+        self,
+        max_retries: int = 3,
+        retry_delay: int = 1,
+        max_concurrency: int = 100,
+        max_concurrency_per_tenant: int = 10,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keep_alive_expiry: float = 5.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget_ratio: float = 0.2,
+        circuit_failure_threshold: Optional[int] = None,
+        circuit_recovery_timeout: float = 30.0,
+        response_cache_ttl: Optional[float] = None,
+        response_cache_size: int = 1000,
+    ) -> "AsyncClient":
+        """
+        Cria cliente assíncrono com todas as dependências configuradas.
+
+        Requer o extra "async" (httpx).
+
+        Args:
+            max_retries: Número máximo de tentativas para requisições
+            retry_delay: Delay entre tentativas em segundos
+            max_concurrency: Requisições simultâneas no total
+            max_concurrency_per_tenant: Requisições simultâneas por loja
+            max_connections: Conexões abertas no pool HTTP
+            max_keepalive_connections: Conexões ociosas mantidas no pool
+            keep_alive_expiry: Tempo em segundos que uma conexão ociosa é mantida
+            connect_timeout: Timeout de conexão em segundos
+            read_timeout: Timeout de leitura em segundos
+            rate_limit: Requisições por segundo por loja. Se None, sem limitador
+            rate_limit_burst: Requisições que podem sair de uma vez por loja
+            retry_policy: Política de novas tentativas. Se None, usa backoff
+                exponencial com max_retries tentativas e retry_delay de base
+            retry_budget_ratio: Fração das requisições que pode virar nova tentativa
+            circuit_failure_threshold: Falhas consecutivas que abrem o circuito
+                de uma loja. Se None, sem circuit breaker
+            circuit_recovery_timeout: Tempo em segundos com o circuito aberto
+            response_cache_ttl: Tempo de vida em segundos das respostas de GET
+                em cache. Se None, sem cache de respostas
+            response_cache_size: Número máximo de respostas em cache
+
+        Returns:
+            Cliente assíncrono configurado
+        """
+        from ..clients.async_client import AsyncClient
+
+        encryption_service = self.create_encryption_service()
+        credentials_repository = self.create_credentials_repository(encryption_service)
+
+        token_manager = self.create_token_manager(
+            credentials_repository=credentials_repository,
+        )
+        return AsyncClient(
+            token_manager=token_manager,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            max_concurrency=max_concurrency,
+            max_concurrency_per_tenant=max_concurrency_per_tenant,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keep_alive_expiry=keep_alive_expiry,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            rate_limiter=(
+                self.create_rate_limiter(rate=rate_limit, burst=rate_limit_burst)
+                if rate_limit is not None
+                else None
+            ),
+            retry_policy=retry_policy,
+            retry_budget=RetryBudget(ratio=retry_budget_ratio),
+            circuit_breaker=(
+                self.create_circuit_breaker(
+                    failure_threshold=circuit_failure_threshold,
+                    recovery_timeout=circuit_recovery_timeout,
+                )
+                if circuit_failure_threshold is not None
+                else None
+            ),
+            response_cache=(
+                self.create_response_cache(
+                    max_size=response_cache_size, ttl=response_cache_ttl
+                )
+                if response_cache_ttl is not None
+                else None
+            ),
+        )
+
+    def create_rate_limiter(
+        self, rate: float = 10.0, burst: int = 10, max_tenants: int = 10000
+    ) -> RateLimiter:
+        """
+        Cria limitador de taxa por loja, compartilhado pelos clientes da factory.
+
+        Args:
+            rate: Requisições por segundo permitidas inicialmente por loja
+            burst: Requisições que podem sair de uma vez por loja
+            max_tenants: Número máximo de lojas com estado mantido (LRU)
+
+        Returns:
+            Limitador de taxa
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = RateLimiter(rate=rate, burst=burst, max_tenants=max_tenants)
+        return self._rate_limiter
+
+    def create_circuit_breaker(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ) -> CircuitBreaker:
+        """
+        Cria circuit breaker por loja, compartilhado pelos clientes da factory.
+
+        Args:
+            failure_threshold: Falhas consecutivas que abrem o circuito
+            recovery_timeout: Tempo em segundos com o circuito aberto
+
+        Returns:
+            Circuit breaker
+        """
+        if self._circuit_breaker is None:
+            self._circuit_breaker = CircuitBreaker(
+                failure_threshold=failure_threshold,
+                recovery_timeout=recovery_timeout,
+            )
+        return self._circuit_breaker
+
+    def create_response_cache(
+        self, max_size: int = 1000, ttl: float = 30.0
+    ) -> ResponseCache:
+        """
+        Cria cache de respostas de GET, compartilhado pelos clientes da factory.
+
+        Args:
+            max_size: Número máximo de respostas em cache
+            ttl: Tempo de vida em segundos de cada resposta
+
+        Returns:
+            Cache de respostas
+        """
+        if self._response_cache is None:
+            self._response_cache = ResponseCache(max_size=max_size, ttl=ttl)
+        return self._response_cache
+
     def create_token_manager(
         self,
         credentials_repository: Optional[ICredentialsRepository] = None,
+        proactive_renewal: bool = False,
+        renewal_margin: float = 300.0,
+        renewal_jitter: float = 30.0,
+        token_cache: Optional[ITokenCache] = None,
+        write_behind: bool = False,
+        write_behind_interval: float = 1.0,
+        write_behind_max_pending: int = 500,
     ) -> ITokenManager:
         """
         Cria gerenciador de tokens.
 
+        O gerenciador é único por factory: para configurar a renovação
+        proativa, chame este método antes de create_client.
+
         Args:
             credentials_repository: Repositório de credenciais (opcional)
+            proactive_renewal: Se True, renova tokens em segundo plano antes de expirarem
+            renewal_margin: Antecedência da renovação em segundos
+            renewal_jitter: Variação aleatória máxima da antecedência em segundos
+            token_cache: Cache de tokens (opcional)
+            write_behind: Se True, tokens renovados são salvos em lote
+            write_behind_interval: Intervalo máximo entre gravações em segundos
+            write_behind_max_pending: Lojas pendentes que antecipam a gravação
 
         Returns:
             Gerenciador de tokens
@@ -70,11 +341,92 @@ class Factory:
         if self._token_manager is None:
             if not credentials_repository:
                 credentials_repository = self.create_credentials_repository()
+            if token_cache is None:
+                token_cache = self.create_token_cache()
             self._token_manager = TokenManager(
                 credentials_repository=credentials_repository,
+                proactive_renewal=proactive_renewal,
+                renewal_margin=renewal_margin,
+                renewal_jitter=renewal_jitter,
+                token_cache=token_cache,
+                write_behind=write_behind,
+                write_behind_interval=write_behind_interval,
+                write_behind_max_pending=write_behind_max_pending,
             )
         return self._token_manager
 
+    def create_token_cache(
+        self,
+        max_size: int = 10000,
+        default_ttl: Optional[float] = None,
+        shared: bool = False,
+        shared_path: Optional[str] = None,
+    ) -> ITokenCache:
+        """
+        Cria cache de tokens.
+
+        Args:
+            max_size: Número máximo de lojas mantidas em cache
+            default_ttl: Tempo de vida em segundos das entradas sem validade
+            shared: Se True, usa cache em SQLite compartilhado entre processos
+            shared_path: Arquivo do cache compartilhado (padrão: no diretório
+                de cache do usuário)
+
+        Returns:
+            Cache de tokens
+        """
+        if self._token_cache is None:
+            if shared:
+                from src.services.shared_token_cache import SharedTokenCache
+
+                self._token_cache = SharedTokenCache(
+                    path=shared_path,
+                    max_size=max_size,
+                    default_ttl=default_ttl,
+                )
+            else:
+                self._token_cache = TokenCache(max_size=max_size, default_ttl=default_ttl)
+        return self._token_cache
+
+    def create_incremental_sync(
+        self,
+        client: "Client",
+        checkpoint_path: Optional[str] = None,
+    ) -> IncrementalSync:
+        """
+        Cria sincronização incremental sobre o cliente.
+
+        Args:
+            client: Cliente usado nos GETs
+            checkpoint_path: Arquivo SQLite dos checkpoints (opcional)
+
+        Returns:
+            Sincronização incremental
+        """
+        return IncrementalSync(
+            client=client,
+            checkpoint_repository=self.create_checkpoint_repository(checkpoint_path),
+        )
+
+    def create_checkpoint_repository(
+        self, path: Optional[str] = None
+    ) -> ICheckpointRepository:
+        """
+        Cria repositório de checkpoints da sincronização incremental.
+
+        Args:
+            path: Arquivo SQLite dos checkpoints (padrão: no diretório de
+                cache do usuário)
+
+        Returns:
+            Repositório de checkpoints
+        """
+        if self._checkpoint_repository is None:
+            from src.repositories.checkpoint_repository import CheckpointRepository
+
+            self._checkpoint_repository = CheckpointRepository(path=path)
+        return self._checkpoint_repository
+
     def create_credentials_repository(
         self,
         encryption_service: Optional[IEncryptionService] = None,
@@ -96,18 +448,34 @@ class Factory:
             )
         return self._credentials_repository
 
-    def create_encryption_service(self) -> IEncryptionService:
+    def create_encryption_service(
+        self,
+        cache_size: int = 0,
+        batch_workers: Optional[int] = None,
+        batch_threshold: int = 64,
+        batch_executor: str = "thread",
+    ) -> IEncryptionService:
         """
         Cria serviço de criptografia.
 
         Args:
-            encryption_key: Chave de criptografia (opcional)
+            cache_size: Valores descriptografados mantidos em memória (0 desliga)
+            batch_workers: Workers usados nas operações em lote
+            batch_threshold: Tamanho mínimo do lote para usar o pool de workers
+            batch_executor: "thread" ou "process"
 
         Returns:
             Serviço de criptografia
         """
         if self._encryption_service is None:
-            self._encryption_service = EncryptionService()
+            from src.services.encryption_service import EncryptionService
+
+            self._encryption_service = EncryptionService(
+                cache_size=cache_size,
+                batch_workers=batch_workers,
+                batch_threshold=batch_threshold,
+                batch_executor=batch_executor,
+            )
         return self._encryption_service
 
     def reset(self) -> None:
@@ -115,3 +483,8 @@ class Factory:
         self._token_manager = None
         self._credentials_repository = None
         self._encryption_service = None
+        self._token_cache = None
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._response_cache = None
+        self._checkpoint_repository = None
@@ -2,21 +2,33 @@
 Interfaces do pacote Bling.
 
 Este módulo contém todas as interfaces (contratos) que definem
-os comportamentos esperados dos componentes do sistema.
+os comportamentos esperados dos componentes do sistema. As interfaces
+são importadas sob demanda.
 """
 
-from .api_client_interface import IApiClient
-from .token_manager_interface import ITokenManager
-from .credentials_repository_interface import ICredentialsRepository
-from .encryption_service_interface import IEncryptionService
-from .bigquery_service_interface import IBigQueryService
-from .browser_automation_interface import IBrowserAutomation
-
-__all__ = [
-    "IApiClient",
-    "ITokenManager",
-    "ICredentialsRepository",
-    "IEncryptionService",
-    "IBigQueryService",
-    "IBrowserAutomation",
-]
+from importlib import import_module
+from typing import Any, List
+
+# Nome exportado -> submódulo que o define
+_EXPORTS = {
+    "ICheckpointRepository": ".checkpoint_repository_interface",
+    "ICredentialsRepository": ".credentials_repository_interface",
+    "IEncryptionService": ".encryption_service_interface",
+    "ITokenCache": ".token_cache_interface",
+    "ITokenManager": ".token_manager_interface",
+    "ITransport": ".transport_interface",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
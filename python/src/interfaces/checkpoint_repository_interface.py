@@ -0,0 +1,50 @@
+"""
+Interface para o repositório de checkpoints da sincronização incremental.
+
+Define o contrato para guardar, por loja e recurso, até onde a última
+sincronização chegou (data de alteração ou cursor da API).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ICheckpointRepository(ABC):
+    """Interface para repositório de checkpoints."""
+
+    @abstractmethod
+    def get(self, id: str, resource: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém o checkpoint da loja para o recurso.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso sincronizado
+        Returns:
+            Checkpoint (cursor, position, high_water, items, synced_at), ou
+            None se o recurso nunca foi sincronizado
+        """
+        pass
+
+    @abstractmethod
+    def save(self, id: str, resource: str, checkpoint: Dict[str, Any]) -> None:
+        """
+        Grava o checkpoint da loja para o recurso, de forma durável.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso sincronizado
+            checkpoint: Checkpoint (cursor, position, high_water, items)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, id: str, resource: Optional[str] = None) -> None:
+        """
+        Remove checkpoints da loja; a próxima sincronização será completa.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso. Se None, remove todos os da loja
+        """
+        pass
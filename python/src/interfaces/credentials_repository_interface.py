@@ -5,9 +5,7 @@ Define o contrato para persistência de credenciais.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
-
-import pandas as pd
+from typing import Any, Dict, List
 
 
 class ICredentialsRepository(ABC):
@@ -21,7 +19,7 @@ class ICredentialsRepository(ABC):
         Args:
             id: Identificador da loja
         Returns:
-            DataFrame com as credenciais
+            Dicionário com as credenciais
         """
         pass
 
@@ -35,3 +33,35 @@ class ICredentialsRepository(ABC):
             token: Dados do token (access_token, refresh_token, validade)
         """
         pass
+
+    def get_credentials_many(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtém as credenciais de várias lojas.
+
+        A implementação padrão faz uma consulta por loja; repositórios com
+        acesso em lote devem sobrescrever com uma única consulta.
+
+        Args:
+            ids: Identificadores das lojas
+        Returns:
+            Dicionário id -> credenciais, apenas com as lojas encontradas
+        """
+        credentials = {}
+        for id in ids:
+            cred = self.get_credentials(id)
+            if cred:
+                credentials[id] = cred
+        return credentials
+
+    def save_tokens(self, tokens: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Salva os tokens de várias lojas.
+
+        A implementação padrão faz uma escrita por loja; repositórios com
+        acesso em lote devem sobrescrever com uma única escrita (upsert).
+
+        Args:
+            tokens: Dicionário id -> dados do token (access_token, refresh_token, validade)
+        """
+        for id, token in tokens.items():
+            self.save_token(id, token)
@@ -5,6 +5,7 @@ Define o contrato para criptografia e descriptografia de dados.
 """
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class IEncryptionService(ABC):
@@ -35,3 +36,27 @@ class IEncryptionService(ABC):
             String original
         """
         pass
+
+    def encrypt_many(self, data: List[str]) -> List[bytes]:
+        """
+        Criptografa várias strings.
+
+        Args:
+            data: Strings a serem criptografadas
+
+        Returns:
+            Bytes criptografados, na mesma ordem
+        """
+        return [self.encrypt(item) for item in data]
+
+    def decrypt_many(self, encrypted_data: List[bytes]) -> List[str]:
+        """
+        Descriptografa várias strings criptografadas.
+
+        Args:
+            encrypted_data: Bytes criptografados
+
+        Returns:
+            Strings originais, na mesma ordem
+        """
+        return [self.decrypt(item) for item in encrypted_data]
@@ -0,0 +1,84 @@
+"""
+Interface para cache de tokens.
+
+Define o contrato para armazenamento temporário das credenciais das lojas
+usado pelo gerenciador de tokens.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional
+
+
+class ITokenCache(ABC):
+    """Interface para cache de tokens."""
+
+    @abstractmethod
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém as credenciais em cache da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        pass
+
+    @abstractmethod
+    def peek(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Consulta as credenciais em cache sem afetar estatísticas nem a ordem de uso.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self, id: str, cred: Dict[str, Any], expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Guarda as credenciais da loja.
+
+        Args:
+            id: Identificador da loja
+            cred: Credenciais (access_token, refresh_token, validade)
+            expires_at: Validade da entrada em epoch (segundos), se conhecida
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, id: str) -> None:
+        """
+        Remove as credenciais da loja do cache.
+
+        Args:
+            id: Identificador da loja
+        """
+        pass
+
+    def refresh_lock(self, id: str) -> ContextManager[Any]:
+        """
+        Trava mantida durante o refresh do token da loja.
+
+        Caches compartilhados entre processos devem serializar o refresh para
+        que apenas um processo renove cada loja. A implementação padrão não trava.
+
+        Args:
+            id: Identificador da loja
+        """
+        return nullcontext()
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache.
+
+        Returns:
+            Dicionário com tamanho, acertos, faltas e remoções
+        """
+        pass
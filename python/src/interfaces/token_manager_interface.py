@@ -7,8 +7,6 @@ Define o contrato para serviços que gerenciam tokens de acesso.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
-import pandas as pd
-
 
 class ITokenManager(ABC):
     """Interface para gerenciamento de tokens OAuth."""
@@ -40,13 +38,13 @@ class ITokenManager(ABC):
         pass
 
     @abstractmethod
-    def refresh_token(self, id: str, cred: pd.Series) -> Dict[str, Any]:
+    def refresh_token(self, id: str, cred: Dict[str, Any]) -> Dict[str, Any]:
         """
         Atualiza o token de acesso usando o refresh token.
 
         Args:
             id: Identificador da loja
-            cred: Série de credenciais
+            cred: Credenciais atuais (access_token, refresh_token, validade)
         Returns:
             Novo token de acesso
         Raises:
@@ -55,18 +53,56 @@ class ITokenManager(ABC):
         pass
 
     @abstractmethod
-    def force_refreshing_token(self, id: str) -> str:
+    def force_refreshing_token(self, id: str, stale_token: Optional[str] = None) -> str:
         """
         Força a atualização do token de acesso.
 
         Args:
             id: Identificador da loja
+            stale_token: Token rejeitado pela API. Se o token atual já for
+                outro, ele pode ser devolvido sem novo refresh
 
         Returns:
             Novo token de acesso
         """
         pass
 
+    async def get_access_token_async(self, id: str) -> str:
+        """
+        Versão assíncrona de get_access_token.
+
+        A implementação padrão executa a versão síncrona em uma thread,
+        sem bloquear o event loop.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Token de acesso válido
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.get_access_token, id)
+
+    async def force_refreshing_token_async(
+        self, id: str, stale_token: Optional[str] = None
+    ) -> str:
+        """
+        Versão assíncrona de force_refreshing_token.
+
+        A implementação padrão executa a versão síncrona em uma thread,
+        sem bloquear o event loop.
+
+        Args:
+            id: Identificador da loja
+            stale_token: Token rejeitado pela API
+
+        Returns:
+            Novo token de acesso
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.force_refreshing_token, id, stale_token)
+
     @abstractmethod
     def _obtain_new_token(self, id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,99 @@
+"""
+Interface para o transporte HTTP do cliente.
+
+Define o contrato da camada que envia as requisições do Client, permitindo
+trocar HTTP/1.1 (requests) por HTTP/2 multiplexado sem alterar novas
+tentativas, cache e demais políticas do cliente.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+
+class ITransport(ABC):
+    """Interface para transporte HTTP."""
+
+    # Erros de conexão/timeout que o cliente pode repetir
+    connection_errors: Tuple[Type[BaseException], ...] = ()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        stream: bool = False,
+    ) -> Any:
+        """
+        Envia uma requisição.
+
+        Args:
+            method: Método HTTP
+            url: URL da requisição
+            headers: Headers da requisição
+            data: Corpo da requisição (opcional)
+            timeout: Timeouts de conexão e de leitura em segundos
+            stream: Se True, o corpo não é lido antes de retornar
+
+        Returns:
+            Resposta com status_code, headers, content (já descomprimido)
+            e text
+        """
+        pass
+
+    @abstractmethod
+    def is_response(self, value: Any) -> bool:
+        """
+        Indica se o valor é uma resposta deste transporte.
+
+        Args:
+            value: Valor retornado pelo cliente
+
+        Returns:
+            True se for uma resposta ainda não lida
+        """
+        pass
+
+    @abstractmethod
+    def iter_raw(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        """
+        Lê o corpo de uma resposta obtida com stream=True, sem descomprimir.
+
+        Args:
+            response: Resposta do transporte
+            chunk_size: Tamanho dos pedaços em bytes
+
+        Returns:
+            Iterador dos pedaços do corpo como recebidos da rede
+        """
+        pass
+
+    @abstractmethod
+    def wire_bytes(self, response: Any) -> int:
+        """
+        Bytes recebidos da rede para o corpo de uma resposta já lida.
+
+        Args:
+            response: Resposta obtida com stream=False
+
+        Returns:
+            Tamanho do corpo como transmitido (comprimido, se for o caso)
+        """
+        pass
+
+    @abstractmethod
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas das conexões abertas.
+
+        Returns:
+            Dicionário com ao menos requests e open_connections
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Fecha todas as conexões."""
+        pass
@@ -2,11 +2,28 @@
 Repositórios do pacote Bling.
 
 Este módulo contém as implementações dos repositórios que gerenciam
-a persistência de dados.
+a persistência de dados. As classes são importadas sob demanda.
 """
 
-from .credentials_repository import CredentialsRepository
+from importlib import import_module
+from typing import Any, List
 
-__all__ = [
-    "CredentialsRepository",
-]
+# Nome exportado -> submódulo que o define
+_EXPORTS = {
+    "CheckpointRepository": ".checkpoint_repository",
+    "CredentialsRepository": ".credentials_repository",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
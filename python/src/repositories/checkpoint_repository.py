@@ -0,0 +1,137 @@
+"""
+Repositório de checkpoints implementando ICheckpointRepository.
+
+Guarda os checkpoints da sincronização incremental em um arquivo SQLite
+local. Cada gravação é confirmada antes de retornar, então uma execução
+interrompida retoma do último checkpoint gravado.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from ..interfaces.checkpoint_repository_interface import ICheckpointRepository
+from ..utils.paths import cache_dir
+
+
+def default_path() -> str:
+    """Arquivo padrão dos checkpoints, no diretório de cache do usuário."""
+    return os.path.join(cache_dir(), "sync.sqlite3")
+
+
+class CheckpointRepository(ICheckpointRepository):
+    """Checkpoints por loja e recurso em SQLite."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Inicializa o repositório, criando a tabela se necessário.
+
+        Args:
+            path: Caminho do arquivo SQLite (padrão: default_path()). Deve
+                ficar em disco persistente: sem ele, a próxima sincronização
+                é completa. Caminhos relativos são resolvidos uma vez, aqui,
+                e não mudam se o diretório de trabalho mudar
+        """
+        self._path = os.path.abspath(path or default_path())
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    id TEXT NOT NULL,
+                    resource TEXT NOT NULL,
+                    cursor TEXT,
+                    position TEXT,
+                    high_water TEXT,
+                    items INTEGER NOT NULL DEFAULT 0,
+                    synced_at REAL NOT NULL,
+                    PRIMARY KEY (id, resource)
+                )
+                """
+            )
+
+    def get(self, id: str, resource: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém o checkpoint da loja para o recurso.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso sincronizado
+        Returns:
+            Checkpoint, ou None se o recurso nunca foi sincronizado
+        """
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT cursor, position, high_water, items, synced_at FROM checkpoints "
+                "WHERE id = ? AND resource = ?",
+                (id, resource),
+            ).fetchone()
+        if row is None:
+            return None
+        cursor, position, high_water, items, synced_at = row
+        # Cursores e datas são guardados em JSON para manter o tipo (texto ou número)
+        return {
+            "cursor": json.loads(cursor) if cursor is not None else None,
+            "position": json.loads(position) if position is not None else None,
+            "high_water": json.loads(high_water) if high_water is not None else None,
+            "items": items,
+            "synced_at": synced_at,
+        }
+
+    def save(self, id: str, resource: str, checkpoint: Dict[str, Any]) -> None:
+        """
+        Grava o checkpoint da loja para o recurso.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso sincronizado
+            checkpoint: Checkpoint (cursor, position, high_water, items)
+        """
+        values = [
+            json.dumps(value) if value is not None else None
+            for value in (
+                checkpoint.get("cursor"),
+                checkpoint.get("position"),
+                checkpoint.get("high_water"),
+            )
+        ]
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(id, resource, cursor, position, high_water, items, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (id, resource, *values, checkpoint.get("items", 0), time.time()),
+            )
+
+    def delete(self, id: str, resource: Optional[str] = None) -> None:
+        """
+        Remove checkpoints da loja.
+
+        Args:
+            id: Identificador da loja
+            resource: Nome do recurso. Se None, remove todos os da loja
+        """
+        with self._connection() as conn:
+            if resource is None:
+                conn.execute("DELETE FROM checkpoints WHERE id = ?", (id,))
+            else:
+                conn.execute(
+                    "DELETE FROM checkpoints WHERE id = ? AND resource = ?", (id, resource)
+                )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Conexão da thread atual, em transação confirmada ao final do bloco."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # FULL: um checkpoint confirmado sobrevive a uma queda do sistema
+            conn.execute("PRAGMA synchronous=FULL")
+            self._local.conn = conn
+        with conn:
+            yield conn
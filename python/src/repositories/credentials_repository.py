@@ -4,7 +4,7 @@ Repositório de credenciais implementando ICredentialsRepository.
 Gerencia a persistência de credenciais no BigQuery.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from src.interfaces.encryption_service_interface import IEncryptionService
 
@@ -34,3 +34,12 @@ class CredentialsRepository(ICredentialsRepository):
         "salva o token na tabela, utilizando o service do bd especificado"
         "deve salvar na linha com o id especificado"
         "access_token, refresh_token e validade"
+
+    def get_credentials_many(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        "requisita os dados na tabela em uma única consulta (WHERE id IN UNNEST(@ids))"
+        "deve retornar um dicionário id -> linha, apenas com os ids encontrados"
+        return {}
+
+    def save_tokens(self, tokens: Dict[str, Dict[str, Any]]) -> None:
+        "salva os tokens na tabela em uma única escrita (MERGE por id)"
+        "deve atualizar access_token, refresh_token e validade de cada id"
@@ -2,19 +2,42 @@
 Serviços do pacote Bling.
 
 Este módulo contém as implementações dos serviços que seguem
-as interfaces definidas.
+as interfaces definidas. As classes são importadas sob demanda.
 """
 
-from .http_client import HttpClient
-from .token_manager import TokenManager
-from .encryption_service import EncryptionService
-from .bigquery_service import BigQueryService
-from .browser_automation import BrowserAutomation
-
-__all__ = [
-    "HttpClient",
-    "TokenManager",
-    "EncryptionService",
-    "BigQueryService",
-    "BrowserAutomation",
-]
+from importlib import import_module
+from typing import Any, List
+
+# Nome exportado -> submódulo que o define
+_EXPORTS = {
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitOpenError": ".circuit_breaker",
+    "EncryptionService": ".encryption_service",
+    "IncrementalSync": ".incremental_sync",
+    "RateLimitedError": ".rate_limiter",
+    "RateLimiter": ".rate_limiter",
+    "ResponseCache": ".response_cache",
+    "RetryBudget": ".retry_policy",
+    "RetryPolicy": ".retry_policy",
+    "SharedTokenCache": ".shared_token_cache",
+    "SyncError": ".incremental_sync",
+    "SyncResource": ".incremental_sync",
+    "TenantRunner": ".tenant_runner",
+    "TokenCache": ".token_cache",
+    "TokenManager": ".token_manager",
+    "WorkerContext": ".tenant_runner",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,201 @@
+"""
+Circuit breaker por loja.
+
+Quando a API de uma loja falha repetidamente, o circuito da loja abre e
+as próximas requisições falham imediatamente, sem ocupar workers nem
+conexões. Após o tempo de recuperação, algumas requisições de teste
+(meio-aberto) decidem se o circuito fecha ou volta a abrir.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from ..utils.log import log
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Requisição recusada porque o circuito da loja está aberto."""
+
+    def __init__(self, id: str, retry_in: float):
+        super().__init__(
+            f"Circuito aberto para {id}: novas requisições em {retry_in:.1f}s"
+        )
+        self.id = id
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    """Estado do circuito de uma loja."""
+
+    __slots__ = ("state", "failures", "opened_at", "half_open_calls", "successes")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker (fechado/aberto/meio-aberto) independente por loja."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+    ):
+        """
+        Inicializa o circuit breaker.
+
+        Args:
+            failure_threshold: Falhas consecutivas que abrem o circuito
+            recovery_timeout: Tempo em segundos que o circuito fica aberto
+                antes de permitir requisições de teste
+            half_open_max_calls: Requisições de teste simultâneas no meio-aberto
+            success_threshold: Sucessos no meio-aberto necessários para fechar
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._success_threshold = success_threshold
+        # Apenas lojas com falhas recentes têm entrada; as saudáveis não ocupam memória
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+        self._rejected = 0
+
+    def before_request(self, id: str) -> None:
+        """
+        Autoriza uma tentativa para a loja.
+
+        Args:
+            id: Identificador da loja
+        Raises:
+            CircuitOpenError: Se o circuito estiver aberto
+        """
+        with self._lock:
+            circuit = self._circuits.get(id)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self._recovery_timeout - now
+                if retry_in > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(id, retry_in)
+                circuit.state = HALF_OPEN
+                circuit.half_open_calls = 0
+                circuit.successes = 0
+
+            if circuit.half_open_calls >= self._half_open_max_calls:
+                self._rejected += 1
+                raise CircuitOpenError(id, 0.0)
+            circuit.half_open_calls += 1
+
+    def record_success(self, id: str) -> None:
+        """
+        Registra uma tentativa bem-sucedida da loja.
+
+        Args:
+            id: Identificador da loja
+        """
+        with self._lock:
+            circuit = self._circuits.get(id)
+            if circuit is None:
+                return
+            if circuit.state == HALF_OPEN:
+                circuit.half_open_calls = max(circuit.half_open_calls - 1, 0)
+                circuit.successes += 1
+                if circuit.successes < self._success_threshold:
+                    return
+                log.info("Circuito fechado para %s", id)
+            del self._circuits[id]
+
+    def record_failure(self, id: str) -> None:
+        """
+        Registra uma tentativa com falha da loja.
+
+        Args:
+            id: Identificador da loja
+        """
+        with self._lock:
+            circuit = self._circuits.get(id)
+            if circuit is None:
+                circuit = self._circuits[id] = _Circuit()
+
+            if circuit.state == HALF_OPEN:
+                circuit.half_open_calls = max(circuit.half_open_calls - 1, 0)
+                self._open(id, circuit)
+                return
+
+            circuit.failures += 1
+            if circuit.state == CLOSED and circuit.failures >= self._failure_threshold:
+                self._open(id, circuit)
+
+    def get_state(self, id: str) -> str:
+        """
+        Retorna o estado do circuito da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            "closed", "open" ou "half_open"
+        """
+        with self._lock:
+            circuit = self._circuits.get(id)
+            if circuit is None:
+                return CLOSED
+            if (
+                circuit.state == OPEN
+                and time.monotonic() - circuit.opened_at >= self._recovery_timeout
+            ):
+                return HALF_OPEN
+            return circuit.state
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado de todas as lojas com falhas recentes.
+
+        Returns:
+            Dicionário com requisições recusadas e, por loja, estado, falhas
+            consecutivas e segundos até a próxima requisição de teste
+        """
+        with self._lock:
+            now = time.monotonic()
+            circuits = {
+                id: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "retry_in": (
+                        max(circuit.opened_at + self._recovery_timeout - now, 0.0)
+                        if circuit.state == OPEN
+                        else 0.0
+                    ),
+                }
+                for id, circuit in self._circuits.items()
+            }
+            return {
+                "rejected": self._rejected,
+                "open": sum(1 for c in circuits.values() if c["state"] != CLOSED),
+                "circuits": circuits,
+            }
+
+    def _open(self, id: str, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.half_open_calls = 0
+        circuit.successes = 0
+        log.warning(
+            "Circuito aberto para %s após %s falhas; nova tentativa em %.0fs",
+            id,
+            circuit.failures,
+            self._recovery_timeout,
+        )
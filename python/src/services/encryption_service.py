@@ -4,27 +4,72 @@ Serviço de criptografia implementando IEncryptionService.
 Gerencia a criptografia e descriptografia de dados sensíveis.
 """
 
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from cryptography.fernet import Fernet
 
 from ..interfaces.encryption_service_interface import IEncryptionService
+from ..utils import metrics
 from ..utils.log import log
 
 
+def _encrypt_chunk(key: bytes, chunk: List[str]) -> List[bytes]:
+    # Função de módulo para poder ser enviada a um ProcessPoolExecutor
+    fernet = Fernet(key)
+    return [fernet.encrypt(item.encode()) if item else b"" for item in chunk]
+
+
+def _decrypt_chunk(key: bytes, chunk: List[Any]) -> List[Any]:
+    fernet = Fernet(key)
+    return [fernet.decrypt(item).decode() if item else item for item in chunk]
+
+
 class EncryptionService(IEncryptionService):
     """Serviço de criptografia usando Fernet."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: int = 0,
+        batch_workers: Optional[int] = None,
+        batch_threshold: int = 64,
+        batch_executor: str = "thread",
+    ):
         """
         Inicializa o serviço de criptografia.
 
         Args:
-            encryption_key: Chave de criptografia. Se None, busca em CHAVE_CRIPTOGRAFIA
+            cache_size: Quantidade de valores descriptografados mantidos em
+                memória, indexados pelo hash do texto cifrado. 0 desliga o cache
+            batch_workers: Workers usados por encrypt_many/decrypt_many
+                (padrão do executor se None)
+            batch_threshold: Tamanho mínimo do lote para usar o pool de workers
+            batch_executor: "thread" ou "process"
+
+        A chave de criptografia é lida de CHAVE_CRIPTOGRAFIA.
         """
+        if batch_executor not in ("thread", "process"):
+            raise ValueError(f"batch_executor inválido: {batch_executor}")
+
         self._key = str(os.environ.get("CHAVE_CRIPTOGRAFIA")).encode()
         self._fernet = Fernet(self._key)
 
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        self._batch_workers = batch_workers
+        self._batch_threshold = batch_threshold
+        self._batch_executor = batch_executor
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+
     def encrypt(self, data: str) -> bytes:
         """
         Criptografa uma string.
@@ -39,10 +84,11 @@ class EncryptionService(IEncryptionService):
             if not data:
                 return b""
 
-            return self._fernet.encrypt(data.encode())
+            with metrics.stage("encrypt"):
+                return self._fernet.encrypt(data.encode())
 
         except Exception as e:
-            log.error(f"Erro ao criptografar dados: {e}")
+            log.error("Erro ao criptografar dados: %s", e)
             raise
 
     def decrypt(self, encrypted_data: str) -> str:
@@ -59,8 +105,162 @@ class EncryptionService(IEncryptionService):
             if not encrypted_data:
                 return encrypted_data
 
-            return self._fernet.decrypt(encrypted_data).decode()
+            if not self._cache_size:
+                with metrics.stage("decrypt"):
+                    return self._fernet.decrypt(encrypted_data).decode()
+
+            digest = self._digest(encrypted_data)
+            cached = self._cache_get(digest)
+            if cached is not None:
+                return cached
+
+            with metrics.stage("decrypt"):
+                decrypted = self._fernet.decrypt(encrypted_data).decode()
+            self._cache_put(digest, decrypted)
+            return decrypted
 
         except Exception as e:
-            log.error(f"Erro ao descriptografar dados: {e}")
+            log.error("Erro ao descriptografar dados: %s", e)
             raise
+
+    def encrypt_many(self, data: List[str]) -> List[bytes]:
+        """
+        Criptografa várias strings, em paralelo para lotes grandes.
+
+        Args:
+            data: Strings a serem criptografadas
+
+        Returns:
+            Bytes criptografados, na mesma ordem
+        """
+        try:
+            return self._run_batch(_encrypt_chunk, list(data))
+
+        except Exception as e:
+            log.error("Erro ao criptografar lote de %s itens: %s", len(data), e)
+            raise
+
+    def decrypt_many(self, encrypted_data: List[bytes]) -> List[str]:
+        """
+        Descriptografa várias strings, em paralelo para lotes grandes.
+
+        Valores já presentes no cache não são descriptografados de novo.
+
+        Args:
+            encrypted_data: Bytes criptografados
+
+        Returns:
+            Strings originais, na mesma ordem
+        """
+        try:
+            items = list(encrypted_data)
+            if not self._cache_size:
+                return self._run_batch(_decrypt_chunk, items)
+
+            results: List[Any] = list(items)
+            misses: Dict[bytes, List[int]] = {}
+            for index, item in enumerate(items):
+                if not item:
+                    continue
+                digest = self._digest(item)
+                cached = self._cache_get(digest)
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    misses.setdefault(digest, []).append(index)
+
+            # Textos cifrados repetidos no lote são descriptografados uma vez
+            pending = list(misses.items())
+            decrypted = self._run_batch(
+                _decrypt_chunk, [items[indexes[0]] for _, indexes in pending]
+            )
+            for (digest, indexes), value in zip(pending, decrypted, strict=True):
+                self._cache_put(digest, value)
+                for index in indexes:
+                    results[index] = value
+            return results
+
+        except Exception as e:
+            log.error("Erro ao descriptografar lote de %s itens: %s", len(encrypted_data), e)
+            raise
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache de valores descriptografados.
+
+        Returns:
+            Dicionário com tamanho, limite, acertos, faltas e taxa de acerto
+        """
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "size": len(self._cache),
+                "max_size": self._cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_ratio": self._cache_hits / lookups if lookups else 0.0,
+            }
+
+    def clear_cache(self) -> None:
+        """Descarta os valores descriptografados mantidos em memória."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Encerra o pool de workers dos lotes."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _run_batch(self, fn: Any, items: List[Any]) -> List[Any]:
+        """Executa fn em pedaços do lote, no pool de workers se o lote for grande."""
+        if len(items) < self._batch_threshold:
+            return fn(self._key, items)
+
+        executor = self._get_executor()
+        workers = self._batch_workers or os.cpu_count() or 1
+        size = max(len(items) // workers, 1)
+        chunks = [items[i : i + size] for i in range(0, len(items), size)]
+        results: List[Any] = []
+        for chunk_result in executor.map(fn, [self._key] * len(chunks), chunks):
+            results.extend(chunk_result)
+        return results
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                if self._batch_executor == "process":
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    self._executor = ProcessPoolExecutor(max_workers=self._batch_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._batch_workers,
+                        thread_name_prefix="encryption",
+                    )
+            return self._executor
+
+    def _digest(self, encrypted_data: Any) -> bytes:
+        if isinstance(encrypted_data, str):
+            encrypted_data = encrypted_data.encode()
+        return hashlib.sha256(encrypted_data).digest()
+
+    def _cache_get(self, digest: bytes) -> Optional[str]:
+        with self._cache_lock:
+            value = self._cache.get(digest)
+            if value is None:
+                self._cache_misses += 1
+                metrics.increment("decrypt_cache_misses_total")
+                return None
+            self._cache.move_to_end(digest)
+            self._cache_hits += 1
+        metrics.increment("decrypt_cache_hits_total")
+        return value
+
+    def _cache_put(self, digest: bytes, value: str) -> None:
+        with self._cache_lock:
+            self._cache[digest] = value
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
@@ -0,0 +1,363 @@
+"""
+Sincronização incremental dos recursos da API.
+
+Em vez de buscar a listagem completa a cada execução, busca apenas o que
+mudou desde a última sincronização da loja: por data de alteração (um
+parâmetro como updated_since) ou pelo cursor devolvido pela API. O ponto
+alcançado é gravado no repositório de checkpoints após cada página
+processada, então uma execução interrompida retoma da última página
+concluída e o custo acompanha o volume de alterações, não o tamanho do
+conjunto de dados.
+
+A entrega é "pelo menos uma vez": a página em processamento quando a
+execução cai é entregue de novo, e itens na fronteira da data de
+alteração podem se repetir. O processamento dos itens deve ser idempotente.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..interfaces.checkpoint_repository_interface import ICheckpointRepository
+from ..utils import metrics
+from ..utils.log import log
+from ..utils.pagination import Pagination, PaginationError, with_params
+
+UPDATED_SINCE = "updated_since"
+CURSOR = "cursor"
+
+
+class SyncError(Exception):
+    """Página da sincronização sem a lista de itens (resposta de erro da API)."""
+
+    def __init__(self, id: str, resource: str, page: Any):
+        super().__init__(
+            f"Resposta inesperada ao sincronizar {resource} de {id}: {page!r:.200}"
+        )
+        self.id = id
+        self.resource = resource
+        self.page = page
+
+
+class SyncResource:
+    """Recurso da API sincronizado de forma incremental."""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        mode: str = UPDATED_SINCE,
+        since_param: str = "updated_since",
+        updated_field: str = "updated_at",
+        cursor_param: str = "cursor",
+        next_cursor_key: str = "next_cursor",
+        has_more_key: Optional[str] = None,
+        pagination: Optional[Pagination] = None,
+        overlap: float = 0.0,
+    ):
+        """
+        Descreve o recurso.
+
+        Args:
+            name: Nome do recurso, chave do checkpoint junto com a loja
+            url: URL da listagem, sem parâmetros de paginação
+            mode: "updated_since" para filtrar por data de alteração ou
+                "cursor" para seguir o cursor devolvido pela API
+            since_param: Parâmetro da query com a data da última sincronização
+            updated_field: Campo dos itens com a data de alteração. O maior
+                valor visto vira o checkpoint (datas ISO 8601 ou números)
+            cursor_param: Parâmetro da query com o cursor
+            next_cursor_key: Chave da resposta com o próximo cursor
+            has_more_key: Chave da resposta que indica se há mais páginas
+                (opcional; sem ela, para na página vazia ou sem cursor novo)
+            pagination: Regras de paginação (padrão: pagina/limite com 100
+                itens). No modo cursor, só o tamanho da página e items_key
+                são usados
+            overlap: Segundos subtraídos da data da última sincronização na
+                consulta, para não perder alterações gravadas fora de ordem
+        """
+        if mode not in (UPDATED_SINCE, CURSOR):
+            raise ValueError(f"Modo de sincronização inválido: {mode}")
+
+        self.name = name
+        self.url = url
+        self.mode = mode
+        self.since_param = since_param
+        self.updated_field = updated_field
+        self.cursor_param = cursor_param
+        self.next_cursor_key = next_cursor_key
+        self.has_more_key = has_more_key
+        self.pagination = pagination or Pagination()
+        self.overlap = overlap
+
+    def __repr__(self) -> str:
+        return f"SyncResource({self.name} {self.mode} {self.url})"
+
+
+class IncrementalSync:
+    """Sincroniza recursos da API por loja, retomando do último checkpoint."""
+
+    def __init__(self, client: Any, checkpoint_repository: ICheckpointRepository):
+        """
+        Inicializa a sincronização.
+
+        Args:
+            client: Cliente usado nos GETs (Client)
+            checkpoint_repository: Repositório onde os checkpoints são gravados
+        """
+        self._client = client
+        self._checkpoints = checkpoint_repository
+
+    def iter_pages(
+        self, id: str, resource: SyncResource, headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Percorre as páginas alteradas desde a última sincronização.
+
+        O checkpoint de cada página é gravado quando a próxima é pedida (ou
+        ao fim da iteração): interromper a iteração no meio de uma página faz
+        com que ela seja entregue de novo na próxima execução.
+
+        Args:
+            id: Identificador da loja
+            resource: Recurso sincronizado
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador das listas de itens de cada página
+        Raises:
+            SyncError: Se uma página vier sem a lista de itens
+        """
+        checkpoint = self._checkpoints.get(id, resource.name) or {}
+        if checkpoint.get("position") is not None:
+            log.info(
+                "Retomando sincronização de %s para %s na posição %s",
+                resource.name,
+                id,
+                checkpoint["position"],
+            )
+        if resource.mode == CURSOR:
+            return self._cursor_pages(id, resource, checkpoint, headers)
+        return self._updated_since_pages(id, resource, checkpoint, headers)
+
+    def iter_items(
+        self, id: str, resource: SyncResource, headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[Any]:
+        """
+        Percorre os itens alterados desde a última sincronização.
+
+        Args:
+            id: Identificador da loja
+            resource: Recurso sincronizado
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Iterador dos itens de todas as páginas
+        """
+        for items in self.iter_pages(id, resource, headers):
+            yield from items
+
+    def sync(
+        self,
+        id: str,
+        resource: SyncResource,
+        handler: Callable[[List[Any]], Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sincroniza o recurso, entregando cada página alterada ao handler.
+
+        O checkpoint avança só depois que o handler retorna; se ele levantar
+        exceção, a página é entregue de novo na próxima execução.
+
+        Args:
+            id: Identificador da loja
+            resource: Recurso sincronizado
+            handler: Função chamada com a lista de itens de cada página
+            headers: Headers adicionais (opcional)
+
+        Returns:
+            Dicionário com itens e páginas processados nesta execução e o
+            checkpoint gravado ao final
+        """
+        items_count = pages = 0
+        with metrics.stage("sync", id, resource=resource.name):
+            for items in self.iter_pages(id, resource, headers):
+                handler(items)
+                items_count += len(items)
+                pages += 1
+        log.info(
+            "Sincronização de %s para %s: %d itens em %d páginas",
+            resource.name,
+            id,
+            items_count,
+            pages,
+        )
+        return {
+            "items": items_count,
+            "pages": pages,
+            "checkpoint": self._checkpoints.get(id, resource.name),
+        }
+
+    def get_checkpoint(self, id: str, resource: SyncResource) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o checkpoint gravado da loja para o recurso.
+
+        Args:
+            id: Identificador da loja
+            resource: Recurso sincronizado
+        Returns:
+            Checkpoint, ou None se o recurso nunca foi sincronizado
+        """
+        return self._checkpoints.get(id, resource.name)
+
+    def reset(self, id: str, resource: Optional[SyncResource] = None) -> None:
+        """
+        Descarta checkpoints; a próxima sincronização será completa.
+
+        Args:
+            id: Identificador da loja
+            resource: Recurso. Se None, descarta os de todos os recursos da loja
+        """
+        self._checkpoints.delete(id, resource.name if resource is not None else None)
+
+    def _updated_since_pages(
+        self,
+        id: str,
+        resource: SyncResource,
+        checkpoint: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+    ) -> Iterator[List[Any]]:
+        # Uma execução interrompida repete a mesma consulta (mesmo "since") a
+        # partir da página gravada; o novo "since" só vale ao fim da listagem,
+        # pois as páginas não precisam vir ordenadas por data de alteração
+        pagination = resource.pagination
+        since = checkpoint.get("cursor")
+        high_water = checkpoint.get("high_water")
+        high_water_moment = _moment(high_water)
+        position = checkpoint.get("position")
+        if position is None:
+            position = pagination.start
+        total = checkpoint.get("items", 0)
+
+        url = resource.url
+        if since is not None:
+            url = with_params(url, {resource.since_param: _shift(since, resource.overlap)})
+
+        while True:
+            page = self._client.get(pagination.url(url, position), id, headers)
+            items = _page_items(id, resource, page)
+            yield items
+
+            for item in items:
+                value = item.get(resource.updated_field) if isinstance(item, dict) else None
+                moment = _moment(value)
+                if moment is not None and _later(moment, high_water_moment):
+                    # Grava o valor como veio da API: é ele que vai no próximo "since"
+                    high_water, high_water_moment = value, moment
+            total += len(items)
+            self._record_page(resource, len(items))
+
+            next_position = pagination.next(position, items)
+            if next_position is None:
+                cursor = since if high_water is None else high_water
+                self._checkpoints.save(id, resource.name, {"cursor": cursor, "items": total})
+                return
+            position = next_position
+            self._checkpoints.save(
+                id,
+                resource.name,
+                {"cursor": since, "position": position, "high_water": high_water, "items": total},
+            )
+
+    def _cursor_pages(
+        self,
+        id: str,
+        resource: SyncResource,
+        checkpoint: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+    ) -> Iterator[List[Any]]:
+        pagination = resource.pagination
+        cursor = checkpoint.get("cursor")
+        total = checkpoint.get("items", 0)
+
+        while True:
+            params: Dict[str, Any] = {}
+            if cursor is not None:
+                params[resource.cursor_param] = cursor
+            if pagination.size_param and pagination.page_size:
+                params[pagination.size_param] = pagination.page_size
+            page = self._client.get(with_params(resource.url, params), id, headers)
+            items = _page_items(id, resource, page)
+            yield items
+
+            next_cursor = page.get(resource.next_cursor_key) if isinstance(page, dict) else None
+            done = not items or next_cursor is None or next_cursor == cursor
+            if resource.has_more_key is not None and isinstance(page, dict):
+                done = done or not page.get(resource.has_more_key)
+            if next_cursor is not None:
+                cursor = next_cursor
+            total += len(items)
+            self._record_page(resource, len(items))
+            self._checkpoints.save(id, resource.name, {"cursor": cursor, "items": total})
+            if done:
+                return
+
+    def _record_page(self, resource: SyncResource, items: int) -> None:
+        """Contabiliza uma página processada."""
+        if metrics.enabled:
+            metrics.increment("sync_pages_total", resource=resource.name)
+            metrics.increment("sync_items_total", items, resource=resource.name)
+
+
+def _page_items(id: str, resource: SyncResource, page: Any) -> List[Any]:
+    """Itens da página; respostas de erro não podem parecer uma listagem vazia."""
+    try:
+        return resource.pagination.items(page)
+    except PaginationError:
+        raise SyncError(id, resource.name, page) from None
+
+
+def _moment(value: Any) -> Any:
+    """
+    Data de alteração em forma comparável.
+
+    Números ficam como estão; texto ISO 8601 vira datetime com fuso (sem
+    fuso = UTC), para que "Z" e "+00:00", ou valores com e sem fração de
+    segundo, sejam comparados pelo instante e não como texto.
+
+    Returns:
+        Número ou datetime, ou None se o valor não for uma data reconhecida
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def _later(moment: Any, current: Any) -> bool:
+    """Indica se moment é posterior a current (None = ainda sem valor)."""
+    if current is None:
+        return True
+    try:
+        return moment > current
+    except TypeError:
+        # Número contra data: formatos misturados não avançam o checkpoint
+        return False
+
+
+def _shift(value: Any, seconds: float) -> Any:
+    """Recua a data do checkpoint em seconds (número ou texto ISO 8601)."""
+    if not seconds:
+        return value
+    if isinstance(value, (int, float)):
+        return value - seconds
+    try:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    return (moment - timedelta(seconds=seconds)).isoformat()
@@ -0,0 +1,263 @@
+"""
+Limitador de taxa por loja.
+
+Mantém um token bucket por loja que espaça as requisições antes de
+atingirem o limite da API. A taxa é ajustada a partir das respostas:
+reduzida a cada 429, aumentada aos poucos a cada sucesso, e limitada
+pelos headers de rate limit (Retry-After, X-RateLimit-*, RateLimit-*).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+from ..utils.log import log
+
+# Valores de reset acima disso são epoch absoluto; abaixo, segundos restantes
+_EPOCH_MINIMO = 1_000_000_000
+
+
+class RateLimitedError(Exception):
+    """Requisição recusada porque a espera do limitador excede o tempo total permitido."""
+
+    def __init__(self, id: str, retry_in: float):
+        super().__init__(
+            f"Taxa limitada para {id}: próxima requisição em {retry_in:.1f}s"
+        )
+        self.id = id
+        self.retry_in = retry_in
+
+
+class _Bucket:
+    """Estado do limitador de uma loja."""
+
+    __slots__ = ("rate", "tokens", "updated", "blocked_until", "limit", "remaining")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+        self.blocked_until = 0.0
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+
+
+class RateLimiter:
+    """Token bucket adaptativo por loja, para os clientes síncrono e assíncrono."""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+        max_tenants: int = 10000,
+    ):
+        """
+        Inicializa o limitador.
+
+        Args:
+            rate: Requisições por segundo permitidas inicialmente para cada loja
+            burst: Requisições que podem sair de uma vez com o bucket cheio
+            min_rate: Taxa mínima após reduções por 429
+            max_rate: Taxa máxima após aumentos por sucesso (padrão: rate)
+            decrease_factor: Fator aplicado à taxa a cada 429
+            increase_step: Aumento da taxa, em req/s, a cada resposta de sucesso
+            max_tenants: Número máximo de lojas com estado mantido; as usadas
+                há mais tempo são descartadas (LRU) e recomeçam com a taxa inicial
+        """
+        self._initial_rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._max_rate = max_rate if max_rate is not None else rate
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step
+        self._max_tenants = max_tenants
+        # Ordem = uso mais antigo primeiro
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, id: str) -> float:
+        """
+        Aguarda (bloqueando a thread) a vez da próxima requisição da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Tempo esperado em segundos
+        """
+        wait = self._reserve(id)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, id: str) -> float:
+        """
+        Aguarda (sem bloquear o event loop) a vez da próxima requisição da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Tempo esperado em segundos
+        """
+        import asyncio
+
+        wait = self._reserve(id)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_wait(self, id: str) -> float:
+        """
+        Retorna quanto a próxima requisição da loja esperaria, sem reservá-la.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Espera em segundos
+        """
+        with self._lock:
+            bucket = self._buckets.get(id)
+            if bucket is None:
+                return 0.0
+            now = time.monotonic()
+            self._refill(bucket, now)
+            return self._wait(bucket, now)
+
+    def observe(
+        self,
+        id: str,
+        status: int,
+        headers: Mapping[str, str],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Ajusta o limitador da loja a partir de uma resposta da API.
+
+        Args:
+            id: Identificador da loja
+            status: Status HTTP da resposta
+            headers: Headers da resposta
+            retry_after: Espera pedida pela API em segundos (Retry-After)
+        """
+        limit = _header_int(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+        remaining = _header_int(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(id, now)
+            self._refill(bucket, now)
+
+            if limit is not None:
+                bucket.limit = limit
+            if remaining is not None:
+                bucket.remaining = remaining
+                # Nunca gasta mais do que a API diz restar na janela
+                bucket.tokens = min(bucket.tokens, float(remaining))
+                if remaining == 0 and reset is not None:
+                    delay = reset - time.time() if reset > _EPOCH_MINIMO else reset
+                    bucket.blocked_until = max(bucket.blocked_until, now + max(delay, 0.0))
+
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+
+            if status == 429:
+                bucket.rate = max(self._min_rate, bucket.rate * self._decrease_factor)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                log.warning(
+                    "Limite de requisições atingido para %s: taxa reduzida para %.2f req/s",
+                    id,
+                    bucket.rate,
+                )
+            elif 200 <= status < 300:
+                bucket.rate = min(self._max_rate, bucket.rate + self._increase_step)
+
+    def get_budget(self, id: str) -> Dict[str, Any]:
+        """
+        Retorna o orçamento atual da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Dicionário com tokens disponíveis, taxa atual (req/s), segundos de
+            bloqueio restantes e os últimos limite/restante informados pela API
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(id, now)
+            self._refill(bucket, now)
+            return {
+                "tokens": bucket.tokens,
+                "rate": bucket.rate,
+                "blocked_for": max(bucket.blocked_until - now, 0.0),
+                "limit": bucket.limit,
+                "remaining": bucket.remaining,
+            }
+
+    def get_budgets(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o orçamento atual de todas as lojas conhecidas.
+
+        Returns:
+            Dicionário id -> orçamento (ver get_budget)
+        """
+        with self._lock:
+            ids = list(self._buckets)
+        return {id: self.get_budget(id) for id in ids}
+
+    def _reserve(self, id: str) -> float:
+        """Reserva a vez da próxima requisição e retorna quanto esperar por ela."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(id, now)
+            self._refill(bucket, now)
+            wait = self._wait(bucket, now)
+            bucket.tokens -= 1
+            if bucket.remaining is not None:
+                bucket.remaining = max(bucket.remaining - 1, 0)
+            return wait
+
+    def _bucket(self, id: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(id)
+        if bucket is None:
+            bucket = _Bucket(self._initial_rate, float(self._burst), now)
+            self._buckets[id] = bucket
+            while len(self._buckets) > self._max_tenants:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(id)
+        return bucket
+
+    def _wait(self, bucket: _Bucket, now: float) -> float:
+        wait = max(bucket.blocked_until - now, 0.0)
+        # Saldo negativo representa requisições já reservadas na fila
+        if bucket.tokens < 1:
+            wait += (1 - bucket.tokens) / bucket.rate
+        return wait
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        elapsed = now - bucket.updated
+        bucket.updated = now
+        if elapsed > 0:
+            bucket.tokens = min(float(self._burst), bucket.tokens + elapsed * bucket.rate)
+
+
+def _header_int(headers: Mapping[str, str], *names: str) -> Optional[int]:
+    value = _header_float(headers, *names)
+    return int(value) if value is not None else None
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,183 @@
+"""
+Cache de respostas de GET.
+
+Cache em memória, limitado por tamanho (LRU) e com tempo de vida curto,
+para dados de referência consultados por vários jobs em sequência.
+Entradas vencidas com ETag são mantidas para revalidação com
+If-None-Match: se a API responder 304, a mesma resposta é reaproveitada
+sem trafegar o corpo de novo. Respostas com Cache-Control no-cache ou
+private só são guardadas para revalidação: nunca são servidas sem
+consultar a API.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class _Entry:
+    """Resposta em cache."""
+
+    __slots__ = ("body", "expires_at", "etag", "ttl")
+
+    def __init__(self, body: Any, expires_at: float, etag: Optional[str], ttl: float):
+        self.body = body
+        self.expires_at = expires_at
+        self.etag = etag
+        self.ttl = ttl
+
+
+class ResponseCache:
+    """Cache LRU de respostas de GET com TTL e revalidação por ETag."""
+
+    def __init__(self, max_size: int = 1000, ttl: float = 30.0):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_size: Número máximo de respostas mantidas
+            ttl: Tempo de vida em segundos de cada resposta. Um Cache-Control
+                max-age menor enviado pela API tem precedência
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(id: str, url: str, headers: Optional[Mapping[str, str]] = None) -> str:
+        """
+        Monta a chave de uma requisição.
+
+        Args:
+            id: Identificador da loja
+            url: URL da requisição, com os parâmetros da query
+            headers: Headers da requisição, que podem mudar a resposta
+        Returns:
+            Chave da resposta no cache
+        """
+        extra = "\n".join(f"{k.lower()}:{v}" for k, v in sorted((headers or {}).items()))
+        return f"{id}\n{url}\n{extra}"
+
+    def get(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Consulta a resposta em cache.
+
+        Args:
+            key: Chave da requisição
+        Returns:
+            (resposta, None) se ainda válida; (None, etag) se vencida mas
+            revalidável; (None, None) se ausente
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None, None
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.body, None
+            self._misses += 1
+            if entry.etag is None:
+                del self._entries[key]
+                return None, None
+            return None, entry.etag
+
+    def put(self, key: str, body: Any, headers: Mapping[str, str]) -> None:
+        """
+        Guarda uma resposta 2xx, respeitando Cache-Control e ETag.
+
+        no-store impede a gravação. no-cache e private zeram o tempo de vida:
+        a resposta só é mantida, com o ETag, para revalidação. O cache é
+        compartilhado por todos os jobs do processo, por isso private não é
+        servido direto.
+
+        Args:
+            key: Chave da requisição
+            body: Conteúdo da resposta
+            headers: Headers da resposta
+        """
+        ttl = self._ttl
+        for directive in headers.get("Cache-Control", "").lower().split(","):
+            directive = directive.strip()
+            if directive == "no-store":
+                return
+            if directive in ("no-cache", "private") or directive.startswith(
+                ("no-cache=", "private=")
+            ):
+                ttl = 0.0
+            if directive.startswith("max-age="):
+                try:
+                    ttl = min(ttl, float(directive[8:]))
+                except ValueError:
+                    pass
+        etag = headers.get("ETag")
+        if ttl <= 0 and etag is None:
+            return
+
+        with self._lock:
+            self._entries[key] = _Entry(body, time.monotonic() + ttl, etag, ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revalidate(self, key: str) -> Optional[Any]:
+        """
+        Renova a resposta em cache após um 304 da API.
+
+        Args:
+            key: Chave da requisição
+        Returns:
+            Resposta em cache, ou None se foi descartada nesse meio tempo
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + entry.ttl
+            self._entries.move_to_end(key)
+            self._revalidated += 1
+            return entry.body
+
+    def invalidate(self, id: Optional[str] = None) -> None:
+        """
+        Descarta respostas em cache.
+
+        Args:
+            id: Identificador da loja. Se None, descarta todas
+        """
+        with self._lock:
+            if id is None:
+                self._entries.clear()
+                return
+            prefix = f"{id}\n"
+            keys: List[str] = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache.
+
+        Returns:
+            Dicionário com tamanho, limite, acertos, faltas, taxa de acerto,
+            revalidações por 304 e remoções por LRU
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "revalidated": self._revalidated,
+                "evictions": self._evictions,
+            }
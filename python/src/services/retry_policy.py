@@ -0,0 +1,220 @@
+"""
+Política de novas tentativas dos clientes.
+
+RetryPolicy define quando e quanto esperar para tentar de novo
+(backoff exponencial com full jitter, limite de tentativas e de tempo
+total, políticas por status). RetryBudget limita o volume de novas
+tentativas de um cliente a uma fração das requisições, para que um
+incidente na API não seja amplificado por todos os workers ao mesmo tempo.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Métodos que podem ser repetidos sem risco de aplicar a operação duas vezes
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Status que garantem que a requisição não foi processada: os únicos repetidos
+# em métodos não idempotentes. Um 502/504 de POST pode ter sido aplicado
+RETRYABLE_UNSAFE_STATUSES = frozenset({429, 503})
+
+
+class RetryPolicy:
+    """Regras de novas tentativas com backoff exponencial e full jitter."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        max_elapsed: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_connection_errors: bool = True,
+        status_policies: Optional[Dict[int, "RetryPolicy"]] = None,
+    ):
+        """
+        Inicializa a política.
+
+        Args:
+            max_attempts: Número máximo de tentativas, contando a primeira
+            base_delay: Espera máxima antes da primeira nova tentativa, em segundos
+            max_delay: Teto da espera entre tentativas, em segundos
+            multiplier: Fator de crescimento da espera a cada tentativa
+            max_elapsed: Tempo total máximo, em segundos, gasto com a requisição
+                e suas novas tentativas (None = sem limite)
+            retry_statuses: Status HTTP que geram nova tentativa. O 401 é sempre
+                tentado de novo após o refresh do token
+            retry_connection_errors: Se True, erros de conexão e timeout
+                também geram nova tentativa
+            status_policies: Políticas específicas por status, por exemplo
+                esperas maiores para 503
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_elapsed = max_elapsed
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self._status_policies = dict(status_policies or {})
+
+    def for_status(self, status: int) -> "RetryPolicy":
+        """
+        Retorna a política aplicável ao status.
+
+        Args:
+            status: Status HTTP da resposta (0 para erro de conexão)
+        Returns:
+            Política específica do status, ou esta política
+        """
+        return self._status_policies.get(status, self)
+
+    def should_retry(self, status: int, result: Dict[str, Any], method: str = "GET") -> bool:
+        """
+        Indica se a resposta deve gerar nova tentativa.
+
+        Métodos não idempotentes (POST, PATCH) só são repetidos em 401, 429 e
+        503, respostas em que a API não processou a requisição.
+
+        Args:
+            status: Status HTTP da resposta
+            result: Resultado de tratamento_de_resposta
+            method: Método HTTP da requisição
+        Returns:
+            True se deve tentar de novo
+        """
+        if result["refresh_token"]:
+            return True
+        if method not in IDEMPOTENT_METHODS and status not in RETRYABLE_UNSAFE_STATUSES:
+            return False
+        return status in self.for_status(status).retry_statuses
+
+    def delay(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula a espera antes da nova tentativa.
+
+        Usa o Retry-After da API quando informado; caso contrário, um valor
+        aleatório entre 0 e o backoff exponencial (full jitter), o que evita
+        que vários workers tentem de novo ao mesmo tempo.
+
+        Args:
+            retry_number: Número da nova tentativa (1 para a primeira)
+            retry_after: Espera pedida pela API em segundos (opcional)
+        Returns:
+            Espera em segundos
+        """
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (retry_number - 1))
+        return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """Orçamento de novas tentativas de um cliente, em janela deslizante."""
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+    ):
+        """
+        Inicializa o orçamento.
+
+        Args:
+            ratio: Novas tentativas permitidas por requisição na janela
+            min_retries: Novas tentativas sempre permitidas na janela, para
+                clientes com pouco tráfego
+            window: Tamanho da janela em segundos
+        """
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._window = window
+        # Contadores por segundo: {segundo: [requisições, novas tentativas]}
+        self._buckets: Dict[int, list] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._retries_by_status: Dict[int, int] = {}
+        self._gave_up: Dict[str, int] = {}
+        self._backoff_seconds = 0.0
+
+    def record_request(self) -> None:
+        """Registra uma nova requisição (sem contar novas tentativas)."""
+        with self._lock:
+            self._bucket(time.monotonic())[0] += 1
+            self._requests += 1
+
+    def try_retry(self, status: int, delay: float) -> bool:
+        """
+        Consome uma nova tentativa do orçamento, se houver.
+
+        Args:
+            status: Status HTTP que motivou a nova tentativa (0 para erro de conexão)
+            delay: Espera que antecederá a nova tentativa, em segundos
+        Returns:
+            True se a nova tentativa foi autorizada
+        """
+        with self._lock:
+            now = time.monotonic()
+            requests, retries = self._window_totals(now)
+            if retries >= self._min_retries + self._ratio * requests:
+                self._gave_up["budget"] = self._gave_up.get("budget", 0) + 1
+                return False
+            self._bucket(now)[1] += 1
+            self._retries += 1
+            self._retries_by_status[status] = self._retries_by_status.get(status, 0) + 1
+            self._backoff_seconds += delay
+            return True
+
+    def record_give_up(self, reason: str) -> None:
+        """
+        Registra uma requisição que desistiu de novas tentativas.
+
+        Args:
+            reason: "max_attempts" ou "max_elapsed"
+        """
+        with self._lock:
+            self._gave_up[reason] = self._gave_up.get(reason, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas de novas tentativas.
+
+        Returns:
+            Dicionário com requisições, novas tentativas (total e por status),
+            desistências por motivo, tempo total de espera e o orçamento
+            disponível na janela atual
+        """
+        with self._lock:
+            requests, retries = self._window_totals(time.monotonic())
+            return {
+                "requests": self._requests,
+                "retries": self._retries,
+                "retries_by_status": dict(self._retries_by_status),
+                "gave_up": dict(self._gave_up),
+                "backoff_seconds": self._backoff_seconds,
+                "budget_available": max(
+                    self._min_retries + self._ratio * requests - retries, 0.0
+                ),
+            }
+
+    def _bucket(self, now: float) -> list:
+        second = int(now)
+        bucket = self._buckets.get(second)
+        if bucket is None:
+            bucket = self._buckets[second] = [0, 0]
+        return bucket
+
+    def _window_totals(self, now: float) -> tuple:
+        oldest = int(now - self._window)
+        for second in [s for s in self._buckets if s <= oldest]:
+            del self._buckets[second]
+        requests = sum(bucket[0] for bucket in self._buckets.values())
+        retries = sum(bucket[1] for bucket in self._buckets.values())
+        return requests, retries
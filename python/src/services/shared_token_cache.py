@@ -0,0 +1,249 @@
+"""
+Cache de tokens compartilhado entre processos implementando ITokenCache.
+
+Guarda as credenciais das lojas em um arquivo SQLite local, de modo que
+todos os workers do mesmo nó (gunicorn, celery, ...) reutilizem o mesmo
+conjunto de tokens. O refresh de cada loja é serializado entre processos
+com travas de arquivo.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
+from ..interfaces.token_cache_interface import ITokenCache
+from ..utils.paths import cache_dir, open_private_file, private_dir
+
+
+def default_path() -> str:
+    """Arquivo padrão do cache, no diretório de cache do usuário (0700)."""
+    return os.path.join(cache_dir(), "tokens.sqlite3")
+
+
+class SharedTokenCache(ITokenCache):
+    """Cache de tokens em SQLite compartilhado pelos processos do nó."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size: int = 10000,
+        default_ttl: Optional[float] = None,
+        lock_stripes: int = 256,
+        touch_interval: float = 60.0,
+    ):
+        """
+        Inicializa o cache compartilhado.
+
+        Args:
+            path: Caminho do arquivo SQLite (padrão: default_path()). Criado
+                com permissão 0600; um arquivo existente precisa pertencer ao
+                usuário atual e ter permissão 0600
+            max_size: Número máximo de lojas mantidas em cache
+            default_ttl: Tempo de vida em segundos das entradas sem validade
+            lock_stripes: Quantidade de arquivos de trava usados para o refresh
+            touch_interval: Intervalo mínimo, em segundos, entre atualizações
+                do último uso de uma entrada (evita uma escrita por leitura)
+        Raises:
+            PermissionError: Se o arquivo ou o diretório de travas existirem
+                com outro dono ou permissões abertas
+        """
+        path = path or default_path()
+        self._path = path
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._lock_stripes = lock_stripes
+        self._touch_interval = touch_interval
+        self._lock_dir = f"{path}.locks"
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        # Os tokens ficam descriptografados no arquivo: apenas o dono pode ler.
+        # O SQLite cria os arquivos -wal e -shm com a mesma permissão
+        os.close(open_private_file(path))
+        private_dir(self._lock_dir)
+        with self._connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tokens (
+                    id TEXT PRIMARY KEY,
+                    cred TEXT NOT NULL,
+                    expires_at REAL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS tokens_last_used ON tokens (last_used)"
+            )
+
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém as credenciais em cache da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        cred = self._lookup(id, touch=True)
+        with self._stats_lock:
+            if cred is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return cred
+
+    def peek(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Consulta as credenciais em cache sem afetar estatísticas nem a ordem de uso.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        return self._lookup(id, touch=False)
+
+    def set(
+        self, id: str, cred: Dict[str, Any], expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Guarda as credenciais da loja para todos os processos.
+
+        Args:
+            id: Identificador da loja
+            cred: Credenciais (access_token, refresh_token, validade)
+            expires_at: Validade da entrada em epoch (segundos), se conhecida
+        """
+        now = time.time()
+        if expires_at is None and self._default_ttl is not None:
+            expires_at = now + self._default_ttl
+
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tokens (id, cred, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (id, json.dumps(cred), expires_at, now),
+            )
+            excess = conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+            excess -= self._max_size
+            if excess > 0:
+                expired = conn.execute(
+                    "DELETE FROM tokens WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                ).rowcount
+                evicted = 0
+                if excess > expired:
+                    evicted = conn.execute(
+                        "DELETE FROM tokens WHERE id IN "
+                        "(SELECT id FROM tokens ORDER BY last_used LIMIT ?)",
+                        (excess - expired,),
+                    ).rowcount
+                with self._stats_lock:
+                    self._expirations += expired
+                    self._evictions += evicted
+
+    def delete(self, id: str) -> None:
+        """
+        Remove as credenciais da loja do cache de todos os processos.
+
+        Args:
+            id: Identificador da loja
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM tokens WHERE id = ?", (id,))
+
+    @contextmanager
+    def refresh_lock(self, id: str) -> Iterator[None]:
+        """
+        Trava exclusiva entre processos para o refresh do token da loja.
+
+        Args:
+            id: Identificador da loja
+        """
+        if fcntl is None:
+            yield
+            return
+
+        stripe = int(hashlib.sha1(id.encode()).hexdigest(), 16) % self._lock_stripes
+        # Cada aquisição usa seu próprio descritor: travas flock não são
+        # compartilhadas entre descritores, nem dentro do mesmo processo
+        fd = open_private_file(os.path.join(self._lock_dir, f"{stripe}.lock"))
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache.
+
+        Tamanho é o do arquivo compartilhado; os contadores são deste processo.
+
+        Returns:
+            Dicionário com tamanho, limite, acertos, faltas, taxa de acerto,
+            remoções por LRU e remoções por expiração
+        """
+        with self._connection() as conn:
+            size = conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": size,
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def _lookup(self, id: str, touch: bool) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT cred, expires_at, last_used FROM tokens WHERE id = ?", (id,)
+            ).fetchone()
+            if row is None:
+                return None
+            cred, expires_at, last_used = row
+            if expires_at is not None and now >= expires_at:
+                conn.execute(
+                    "DELETE FROM tokens WHERE id = ? AND expires_at = ?", (id, expires_at)
+                )
+                with self._stats_lock:
+                    self._expirations += 1
+                return None
+            if touch and now - last_used >= self._touch_interval:
+                conn.execute("UPDATE tokens SET last_used = ? WHERE id = ?", (now, id))
+        return json.loads(cred)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Conexão da thread atual, em transação confirmada ao final do bloco."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        with conn:
+            yield conn
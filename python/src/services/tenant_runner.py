@@ -0,0 +1,518 @@
+"""
+Execução de jobs por loja em vários processos.
+
+Um único processo fica limitado pelo GIL ao decodificar JSON e
+descriptografar credenciais. O TenantRunner distribui as lojas entre
+processos worker por hash consistente: a mesma loja vai sempre para o
+mesmo worker, que mantém factory, cliente e tokens próprios entre as
+rodadas. O processo principal supervisiona os workers, reinicia os que
+caem (reenviando as lojas pendentes deles), encerra os que passam do
+tempo máximo de um job e agrega a vazão.
+"""
+
+import atexit
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+from ..utils import metrics
+from ..utils.hash_ring import HashRing
+from ..utils.log import configure_logging, log
+
+if TYPE_CHECKING:
+    from ..clients.client import Client
+    from ..factories.factory import Factory
+
+# Espera máxima por mensagens dos workers antes de verificar se estão vivos
+_POLL_INTERVAL = 0.5
+
+
+class WorkerContext:
+    """Dependências de um processo worker: factory e cliente próprios."""
+
+    def __init__(self, index: int, client_options: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa o contexto.
+
+        Args:
+            index: Número do worker
+            client_options: Argumentos de Factory.create_client (opcional)
+        """
+        from ..factories.factory import Factory
+
+        self.index = index
+        self.factory: "Factory" = Factory()
+        self._client_options = client_options or {}
+        self._client: Optional["Client"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> "Client":
+        """Cliente do worker, criado no primeiro uso."""
+        with self._lock:
+            if self._client is None:
+                self._client = self.factory.create_client(**self._client_options)
+            return self._client
+
+    def close(self) -> None:
+        """Fecha o cliente do worker, se criado."""
+        if self._client is not None:
+            self._client.close()
+
+
+class _Worker:
+    """Estado de um worker no processo principal."""
+
+    __slots__ = (
+        "index",
+        "process",
+        "tasks",
+        "results",
+        "restarts",
+        "expired",
+        "assigned",
+        "running",
+    )
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process: Any = None
+        self.tasks: Any = None
+        # Pipe próprio de cada processo: a queda de um worker não afeta os demais
+        self.results: Any = None
+        self.restarts = 0
+        # Terminado pelo runner por job_timeout: o reinício não conta como queda
+        self.expired = False
+        # Lojas enviadas e ainda sem resultado, na ordem de envio
+        self.assigned: Dict[str, None] = {}
+        # Lojas que o worker informou ter começado, com o instante do início
+        self.running: Dict[str, float] = {}
+
+
+class TenantRunner:
+    """Executa um job por loja em um pool de processos com lojas fixas por worker."""
+
+    def __init__(
+        self,
+        job: Callable[[Any, str], Any],
+        workers: Optional[int] = None,
+        threads: int = 1,
+        client_options: Optional[Dict[str, Any]] = None,
+        context_factory: Optional[Callable[[int], Any]] = None,
+        max_restarts: int = 3,
+        max_attempts: int = 2,
+        job_timeout: Optional[float] = None,
+        report_interval: float = 10.0,
+        replicas: int = 100,
+        start_method: str = "spawn",
+        log_level: Optional[int] = None,
+    ):
+        """
+        Inicializa o runner. Os workers são iniciados no primeiro run.
+
+        Args:
+            job: Função chamada com o contexto do worker e o id da loja. Deve
+                ser importável (definida no nível de um módulo). Pode retornar
+                a quantidade de itens processados (int ou dicionário com
+                "items") para a vazão
+            workers: Quantidade de processos (padrão: número de CPUs)
+            threads: Lojas processadas simultaneamente em cada worker
+            client_options: Argumentos de Factory.create_client do contexto padrão
+            context_factory: Função que cria o contexto de cada worker a partir
+                do número do worker (padrão: WorkerContext). O contexto deve
+                ter close()
+            max_restarts: Reinícios de cada worker por rodada; depois disso, o
+                worker é retirado do anel até a próxima rodada e suas lojas
+                passam aos demais
+            max_attempts: Vezes que uma loja pode estar em andamento quando seu
+                worker cai antes de ser dada como falha
+            job_timeout: Tempo máximo em segundos do job de uma loja (opcional).
+                Passado esse tempo, a loja é dada como falha e o worker é
+                terminado e reiniciado, pois a thread presa não pode ser
+                interrompida
+            report_interval: Intervalo em segundos entre logs de progresso
+            replicas: Pontos de cada worker no anel de hash
+            start_method: Método de criação dos processos ("spawn", "forkserver"
+                ou "fork")
+            log_level: Se informado, configura o logging dos workers nesse nível
+        """
+        if threads < 1:
+            raise ValueError(f"threads inválido: {threads}")
+        if job_timeout is not None and job_timeout <= 0:
+            raise ValueError(f"job_timeout inválido: {job_timeout}")
+
+        count = workers or os.cpu_count() or 1
+        self._job = job
+        self._threads = threads
+        self._context_factory = context_factory or partial(
+            WorkerContext, client_options=client_options
+        )
+        self._max_restarts = max_restarts
+        self._max_attempts = max_attempts
+        self._job_timeout = job_timeout
+        self._report_interval = report_interval
+        self._log_level = log_level
+        self._mp = multiprocessing.get_context(start_method)
+        self._ring = HashRing((str(i) for i in range(count)), replicas)
+        self._workers = [_Worker(i) for i in range(count)]
+        self._started = False
+        self._closed = False
+
+    def worker_for(self, id: str) -> int:
+        """
+        Retorna o worker responsável pela loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Número do worker
+        """
+        return int(self._ring.node_for(id))
+
+    def start(self) -> None:
+        """Inicia os processos worker."""
+        if self._closed:
+            raise RuntimeError("Runner encerrado")
+        if self._started:
+            return
+        for worker in self._workers:
+            self._spawn(worker)
+        self._started = True
+        atexit.register(self.close)
+
+    def run(self, ids: Iterable[str]) -> Dict[str, Any]:
+        """
+        Executa o job para cada loja e aguarda todas terminarem.
+
+        Pode ser chamado várias vezes: os workers continuam vivos entre as
+        rodadas e recebem sempre as mesmas lojas. A cada rodada, os workers
+        retirados voltam ao anel e o limite de reinícios é renovado.
+
+        Args:
+            ids: Identificadores das lojas (repetidos são ignorados)
+
+        Returns:
+            Dicionário com lojas, concluídas, com erro, itens, duração, vazão
+            (tenants_per_second, items_per_second), reinícios, erros por loja
+            e totais por worker
+        """
+        self.start()
+        self._revive()
+        started = time.monotonic()
+        tenants = list(dict.fromkeys(ids))
+        stats: Dict[str, Any] = {
+            "tenants": len(tenants),
+            "completed": 0,
+            "failed": 0,
+            "items": 0,
+            "restarts": 0,
+            "errors": {},
+            "workers": {
+                worker.index: {"tenants": 0, "items": 0, "failed": 0, "busy_seconds": 0.0}
+                for worker in self._workers
+            },
+        }
+        pending: Dict[str, int] = {}
+        for id in tenants:
+            if len(self._ring):
+                pending[id] = self._assign(id)
+            else:
+                self._fail(id, "nenhum worker disponível", stats)
+
+        attempts: Dict[str, int] = {}
+        next_report = started + self._report_interval
+
+        while pending:
+            live = {w.results: w for w in self._workers if w.process is not None}
+            for conn in wait(list(live), timeout=_POLL_INTERVAL):
+                try:
+                    self._handle(conn.recv(), pending, attempts, stats)
+                except (EOFError, OSError):
+                    # Pipe fechado: o processo está terminando; _supervise trata
+                    live[conn].process.join(1.0)
+            self._expire(pending, stats)
+            self._supervise(pending, attempts, stats)
+            if time.monotonic() >= next_report:
+                next_report += self._report_interval
+                self._report(stats, time.monotonic() - started)
+
+        elapsed = time.monotonic() - started
+        stats["seconds"] = elapsed
+        stats["tenants_per_second"] = stats["completed"] / elapsed if elapsed else 0.0
+        stats["items_per_second"] = stats["items"] / elapsed if elapsed else 0.0
+        return stats
+
+    def close(self, timeout: float = 30.0) -> None:
+        """
+        Encerra os workers depois que terminarem as lojas já enviadas.
+
+        Args:
+            timeout: Espera máxima em segundos por worker; depois disso o
+                processo é terminado
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._started:
+            return
+        workers = [worker for worker in self._workers if worker.process is not None]
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.tasks.put(None)
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                log.warning("Worker %s não encerrou a tempo; terminando", worker.index)
+                worker.process.terminate()
+                worker.process.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "TenantRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _revive(self) -> None:
+        """Renova o limite de reinícios e devolve ao anel os workers retirados."""
+        for worker in self._workers:
+            worker.restarts = 0
+            if worker.process is None:
+                log.info("Worker %s volta ao anel", worker.index)
+                self._ring.add(str(worker.index))
+                self._spawn(worker)
+
+    def _spawn(self, worker: _Worker) -> None:
+        """Inicia (ou reinicia) o processo do worker e reenvia suas lojas pendentes."""
+        if worker.tasks is not None:
+            # Fila do processo anterior: pode ter ficado com itens não lidos
+            worker.tasks.cancel_join_thread()
+            worker.tasks.close()
+        if worker.results is not None:
+            worker.results.close()
+        worker.tasks = self._mp.Queue()
+        worker.results, sender = self._mp.Pipe(duplex=False)
+        worker.running.clear()
+        for id in worker.assigned:
+            worker.tasks.put(id)
+        worker.process = self._mp.Process(
+            target=_worker_main,
+            args=(
+                worker.index,
+                worker.tasks,
+                sender,
+                self._job,
+                self._context_factory,
+                self._threads,
+                self._log_level,
+            ),
+            name=f"tenant-worker-{worker.index}",
+        )
+        worker.process.start()
+        # Só o worker escreve no pipe: fechado aqui, a queda dele vira EOF
+        sender.close()
+
+    def _assign(self, id: str) -> int:
+        """Envia a loja ao worker responsável por ela."""
+        index = self.worker_for(id)
+        worker = self._workers[index]
+        worker.assigned[id] = None
+        worker.tasks.put(id)
+        return index
+
+    def _handle(
+        self,
+        message: tuple,
+        pending: Dict[str, int],
+        attempts: Dict[str, int],
+        stats: Dict[str, Any],
+    ) -> None:
+        """Processa uma mensagem de um worker."""
+        kind, index, pid, id, value, seconds = message
+        # Mensagens atrasadas de lojas já resolvidas (ex.: de antes de um reinício)
+        if id is None or id not in pending:
+            return
+        owner = self._workers[pending[id]]
+        if kind == "started":
+            if owner.process is not None and owner.process.pid == pid:
+                attempts[id] = attempts.get(id, 0) + 1
+                owner.running[id] = time.monotonic()
+            return
+
+        del pending[id]
+        owner.assigned.pop(id, None)
+        owner.running.pop(id, None)
+        worker_stats = stats["workers"][index]
+        worker_stats["busy_seconds"] += seconds
+        if kind == "done":
+            stats["completed"] += 1
+            stats["items"] += value
+            worker_stats["tenants"] += 1
+            worker_stats["items"] += value
+            metrics.increment("runner_tenants_total", status="completed")
+        else:
+            self._fail(id, value, stats)
+            worker_stats["failed"] += 1
+
+    def _expire(self, pending: Dict[str, int], stats: Dict[str, Any]) -> None:
+        """Dá como falha as lojas que passaram de job_timeout e termina seus workers."""
+        if self._job_timeout is None:
+            return
+        deadline = time.monotonic() - self._job_timeout
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            expired = [id for id, started in worker.running.items() if started <= deadline]
+            if not expired:
+                continue
+            for id in expired:
+                del pending[id]
+                del worker.running[id]
+                worker.assigned.pop(id, None)
+                self._fail(id, f"tempo máximo de {self._job_timeout}s excedido", stats)
+                stats["workers"][worker.index]["failed"] += 1
+            log.error(
+                "Worker %s (pid %s) com job além do tempo máximo; terminando",
+                worker.index,
+                worker.process.pid,
+            )
+            # Não há como interromper a thread do job: o processo é reiniciado
+            # por _supervise, que reenvia as demais lojas do worker
+            worker.expired = True
+            worker.process.kill()
+            worker.process.join()
+
+    def _supervise(
+        self, pending: Dict[str, int], attempts: Dict[str, int], stats: Dict[str, Any]
+    ) -> None:
+        """Reinicia workers que caíram ou redistribui as lojas dos que esgotaram reinícios."""
+        for worker in self._workers:
+            if worker.process is None or worker.process.is_alive():
+                continue
+            # Mensagens que o worker enviou antes de cair (ex.: loja iniciada)
+            try:
+                while worker.results.poll():
+                    self._handle(worker.results.recv(), pending, attempts, stats)
+            except (EOFError, OSError):
+                pass
+            exitcode = worker.process.exitcode
+            if not worker.expired:
+                log.error(
+                    "Worker %s (pid %s) terminou com código %s",
+                    worker.index,
+                    worker.process.pid,
+                    exitcode,
+                )
+            # A loja em andamento pode ser a causa da queda: repete até max_attempts
+            for id in worker.running:
+                if attempts.get(id, 0) >= self._max_attempts:
+                    del pending[id]
+                    worker.assigned.pop(id, None)
+                    self._fail(id, f"worker {worker.index} caiu (código {exitcode})", stats)
+
+            if worker.expired or worker.restarts < self._max_restarts:
+                if not worker.expired:
+                    worker.restarts += 1
+                worker.expired = False
+                stats["restarts"] += 1
+                metrics.increment("runner_worker_restarts_total")
+                self._spawn(worker)
+                continue
+
+            log.error(
+                "Worker %s excedeu %s reinícios; lojas passam aos demais workers",
+                worker.index,
+                self._max_restarts,
+            )
+            worker.process = None
+            worker.running.clear()
+            worker.results.close()
+            self._ring.remove(str(worker.index))
+            orphans, worker.assigned = list(worker.assigned), {}
+            for id in orphans:
+                if len(self._ring):
+                    pending[id] = self._assign(id)
+                else:
+                    del pending[id]
+                    self._fail(id, "nenhum worker disponível", stats)
+
+    def _fail(self, id: str, error: str, stats: Dict[str, Any]) -> None:
+        """Registra a falha de uma loja."""
+        log.error("Erro no job da loja %s: %s", id, error)
+        stats["failed"] += 1
+        stats["errors"][id] = error
+        metrics.increment("runner_tenants_total", status="failed")
+
+    def _report(self, stats: Dict[str, Any], elapsed: float) -> None:
+        """Registra o progresso agregado da rodada."""
+        log.info(
+            "Progresso: %d/%d lojas (%d com erro), %.1f lojas/s, %.1f itens/s",
+            stats["completed"] + stats["failed"],
+            stats["tenants"],
+            stats["failed"],
+            stats["completed"] / elapsed,
+            stats["items"] / elapsed,
+        )
+
+
+def _worker_main(
+    index: int,
+    tasks: Any,
+    results: Any,
+    job: Callable[[Any, str], Any],
+    context_factory: Callable[[int], Any],
+    threads: int,
+    log_level: Optional[int],
+) -> None:
+    """Laço do processo worker: executa o job para cada loja recebida."""
+    # Ctrl+C chega a todo o grupo de processos; quem encerra os workers é o runner
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if log_level is not None:
+        configure_logging(log_level)
+    pid = os.getpid()
+    context = context_factory(index)
+    slots = threading.Semaphore(threads)
+    send_lock = threading.Lock()
+
+    def send(*message: Any) -> None:
+        # Envio síncrono: "started" chega ao runner mesmo que o job derrube o processo
+        with send_lock:
+            results.send(message)
+
+    def execute(id: str) -> None:
+        send("started", index, pid, id, None, 0.0)
+        started = time.monotonic()
+        try:
+            items = _count_items(job(context, id))
+        except BaseException as e:
+            # Inclui SystemExit do job: sem a resposta, o runner esperaria a loja
+            send("failed", index, pid, id, repr(e), time.monotonic() - started)
+        else:
+            send("done", index, pid, id, items, time.monotonic() - started)
+        finally:
+            slots.release()
+
+    try:
+        with ThreadPoolExecutor(threads, thread_name_prefix=f"worker-{index}") as executor:
+            while True:
+                id = tasks.get()
+                if id is None:
+                    break
+                slots.acquire()
+                executor.submit(execute, id)
+    finally:
+        context.close()
+
+
+def _count_items(result: Any) -> int:
+    """Itens processados informados pelo job (int ou dicionário com "items")."""
+    if isinstance(result, dict):
+        result = result.get("items")
+    return result if isinstance(result, int) and not isinstance(result, bool) else 0
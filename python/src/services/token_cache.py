@@ -0,0 +1,158 @@
+"""
+Cache de tokens implementando ITokenCache.
+
+Cache em memória limitado por tamanho (LRU) e com expiração derivada da
+validade de cada token.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..interfaces.token_cache_interface import ITokenCache
+
+
+class TokenCache(ITokenCache):
+    """Cache LRU de tokens com expiração por validade."""
+
+    def __init__(self, max_size: int = 10000, default_ttl: Optional[float] = None):
+        """
+        Inicializa o cache de tokens.
+
+        Args:
+            max_size: Número máximo de lojas mantidas em cache
+            default_ttl: Tempo de vida em segundos das entradas sem validade
+                conhecida. Se None, essas entradas só saem por LRU
+        """
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        # id -> (credenciais, expiração em epoch ou None); ordem = uso mais antigo primeiro
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém as credenciais em cache da loja.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        with self._lock:
+            cred = self._lookup(id, time.time())
+            if cred is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(id)
+            self._hits += 1
+            return cred
+
+    def peek(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Consulta as credenciais em cache sem afetar estatísticas nem a ordem de uso.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Credenciais em cache, ou None se ausentes ou expiradas
+        """
+        with self._lock:
+            return self._lookup(id, time.time())
+
+    def set(
+        self, id: str, cred: Dict[str, Any], expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Guarda as credenciais da loja, removendo as menos usadas se necessário.
+
+        Args:
+            id: Identificador da loja
+            cred: Credenciais (access_token, refresh_token, validade)
+            expires_at: Validade da entrada em epoch (segundos), se conhecida
+        """
+        now = time.time()
+        if expires_at is None and self._default_ttl is not None:
+            expires_at = now + self._default_ttl
+
+        with self._lock:
+            self._entries[id] = (cred, expires_at)
+            self._entries.move_to_end(id)
+            while len(self._entries) > self._max_size:
+                _, (_, oldest_expires_at) = self._entries.popitem(last=False)
+                if oldest_expires_at is not None and now >= oldest_expires_at:
+                    self._expirations += 1
+                else:
+                    self._evictions += 1
+
+    def delete(self, id: str) -> None:
+        """
+        Remove as credenciais da loja do cache.
+
+        Args:
+            id: Identificador da loja
+        """
+        with self._lock:
+            self._entries.pop(id, None)
+
+    def purge_expired(self) -> int:
+        """
+        Remove todas as entradas expiradas.
+
+        Returns:
+            Quantidade de entradas removidas
+        """
+        with self._lock:
+            return self._purge_expired(time.time())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache.
+
+        Returns:
+            Dicionário com tamanho, limite, acertos, faltas, taxa de acerto,
+            remoções por LRU e remoções por expiração
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, id: str, now: float) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(id)
+        if entry is None:
+            return None
+        cred, expires_at = entry
+        if expires_at is not None and now >= expires_at:
+            del self._entries[id]
+            self._expirations += 1
+            return None
+        return cred
+
+    def _purge_expired(self, now: float) -> int:
+        expired = [
+            id
+            for id, (_, expires_at) in self._entries.items()
+            if expires_at is not None and now >= expires_at
+        ]
+        for id in expired:
+            del self._entries[id]
+        self._expirations += len(expired)
+        return len(expired)
@@ -4,14 +4,21 @@ Gerenciador de tokens implementando ITokenManager.
 Gerencia tokens OAuth com cache e refresh automático.
 """
 
-from datetime import datetime
-from typing import Any, Dict
-
-import pandas as pd
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, Optional
 
 from ..interfaces.credentials_repository_interface import ICredentialsRepository
+from ..interfaces.token_cache_interface import ITokenCache
 from ..interfaces.token_manager_interface import ITokenManager
+from ..utils import metrics
 from ..utils.log import log
+from ..utils.single_flight import SingleFlight
+from ..utils.validade import validade_to_epoch
+from .token_cache import TokenCache
+from .token_renewal_scheduler import TokenRenewalScheduler
+from .token_write_buffer import TokenWriteBuffer
 
 
 class TokenManager(ITokenManager):
@@ -20,15 +27,49 @@ class TokenManager(ITokenManager):
     def __init__(
         self,
         credentials_repository: ICredentialsRepository,
+        proactive_renewal: bool = False,
+        renewal_margin: float = 300.0,
+        renewal_jitter: float = 30.0,
+        token_cache: Optional[ITokenCache] = None,
+        write_behind: bool = False,
+        write_behind_interval: float = 1.0,
+        write_behind_max_pending: int = 500,
     ):
         """
         Inicializa o gerenciador de tokens.
 
         Args:
             credentials_repository: Repositório de credenciais
+            proactive_renewal: Se True, renova tokens em segundo plano antes de expirarem
+            renewal_margin: Antecedência da renovação em segundos
+            renewal_jitter: Variação aleatória máxima da antecedência em segundos
+            token_cache: Cache de tokens. Se None, usa um TokenCache em memória
+            write_behind: Se True, tokens renovados são salvos em lote, fora
+                do caminho da requisição
+            write_behind_interval: Intervalo máximo entre gravações em segundos
+            write_behind_max_pending: Lojas pendentes que antecipam a gravação
         """
         self._credentials_repository = credentials_repository
-        self._token_cache: Dict[str, Dict[str, Any]] = {}
+        self._token_cache = token_cache if token_cache is not None else TokenCache()
+        # Um refresh por loja por vez, compartilhado entre threads e corrotinas
+        self._refresh_flight = SingleFlight()
+        self._async_refresh_flight = SingleFlight()
+        self._stats_lock = threading.Lock()
+        self._stale_refreshes_skipped = 0
+        self._renewal_scheduler: Optional[TokenRenewalScheduler] = None
+        if proactive_renewal:
+            self._renewal_scheduler = TokenRenewalScheduler(
+                renew=self._renew_in_background,
+                margin=renewal_margin,
+                jitter=renewal_jitter,
+            )
+        self._write_buffer: Optional[TokenWriteBuffer] = None
+        if write_behind:
+            self._write_buffer = TokenWriteBuffer(
+                credentials_repository=credentials_repository,
+                flush_interval=write_behind_interval,
+                max_pending=write_behind_max_pending,
+            )
 
     def get_access_token(self, id: str) -> str:
         """
@@ -42,25 +83,66 @@ class TokenManager(ITokenManager):
         """
 
         try:
-            # Verifica cache primeiro, Se não estiver no cache, busca no repositório
-            if id in self._token_cache:
-                cred = self._token_cache[id]
-            else:
-                cred = self._credentials_repository.get_credentials(id)
+            with metrics.stage("token_lookup", id):
+                cred = self._cached_credentials(id)
+                if cred is None:
+                    cred = self._fetch_credentials(id)
+                return cred["access_token"]
 
-            if not self.is_token_valid(cred.get("validade", "")):
-                log.info(f"Token inválido para {id}, atualizando...")
-                cred = self.refresh_token(id, cred)
-                self._credentials_repository.save_token(id, cred)
+        except Exception as e:
+            log.error("Erro ao obter token para %s: %s", id, e)
+            raise
+
+    async def get_access_token_async(self, id: str) -> str:
+        """
+        Versão assíncrona de get_access_token.
+
+        Com o cache em memória, um acerto é respondido no próprio event loop,
+        sem passar pelo executor padrão; só faltas e refreshes (repositório,
+        API de OAuth) são executados em thread.
+
+        Args:
+            id: Identificador da loja
 
-            self._token_cache[id] = cred
+        Returns:
+            Token de acesso válido
+        """
+        import asyncio
 
-            return self._token_cache[id]["access_token"]
+        if not isinstance(self._token_cache, TokenCache):
+            # Outros caches (ex.: SQLite) fazem E/S também nos acertos
+            return await super().get_access_token_async(id)
+        try:
+            with metrics.stage("token_lookup", id):
+                cred = self._cached_credentials(id)
+                if cred is None:
+                    cred = await asyncio.to_thread(self._fetch_credentials, id)
+                return cred["access_token"]
 
         except Exception as e:
-            log.error(f"Erro ao obter token para {id}: {e}")
+            log.error("Erro ao obter token para %s: %s", id, e)
             raise
 
+    def _cached_credentials(self, id: str) -> Optional[Dict[str, Any]]:
+        """Credenciais da loja em cache, ou None."""
+        # O cache guarda a validade já convertida em epoch e descarta tokens
+        # vencidos, então um acerto é válido
+        cred = self._token_cache.get(id)
+        if cred is not None:
+            metrics.increment("token_cache_hits_total")
+        else:
+            metrics.increment("token_cache_misses_total")
+        return cred
+
+    def _fetch_credentials(self, id: str) -> Dict[str, Any]:
+        """Busca as credenciais no repositório e renova o token vencido."""
+        cred = self._load_credentials(id)
+        if self.is_token_invalid(cred.get("validade", "")):
+            log.info("Token inválido para %s, atualizando...", id)
+            return self._refresh_single_flight(id, cred)
+        self._cache_token(id, cred)
+        return cred
+
     def is_token_invalid(self, validade: str) -> bool:
         """
         Verifica se o token da loja é válido.
@@ -75,8 +157,8 @@ class TokenManager(ITokenManager):
             if not validade or validade == "":
                 return False
 
-            expiration = pd.to_datetime(validade)
-            return datetime.now() > expiration
+            expiration = validade_to_epoch(validade)
+            return expiration is not None and time.time() > expiration
 
         except Exception:
             return False
@@ -96,38 +178,281 @@ class TokenManager(ITokenManager):
             return {"access_token": "", "refresh_token": "", "validade": ""}
 
         except Exception as e:
-            log.error(f"Erro ao fazer refresh do token para {id}: {e}")
+            log.error("Erro ao fazer refresh do token para %s: %s", id, e)
             return self._obtain_new_token(id)
 
-    def force_refreshing_token(self, id: str) -> str:
+    def force_refreshing_token(self, id: str, stale_token: Optional[str] = None) -> str:
         """
         Força a atualização do token de acesso.
 
         Args:
             id: Identificador da loja
+            stale_token: Token rejeitado pela API. Se o token atual já for
+                outro, ele é devolvido sem novo refresh
 
         Returns:
             Novo token de acesso
         """
         try:
-            if id in self._token_cache:
-                cred = self._token_cache[id]
-            else:
-                cred = self.get_token_in_repository(id)
+            cred = self._token_cache.peek(id)
+            if cred is None:
+                cred = self._load_credentials(id)
                 cred = {
                     "access_token": cred["access_token"],
                     "refresh_token": cred["refresh_token"],
                     "validade": cred["validade"],
                 }
 
-            cred = self.refresh_token(id, cred)
-            self._credentials_repository.save_token(id, cred)
-            return cred["access_token"]
+            return self._refresh_single_flight(id, cred, stale_token)["access_token"]
 
         except Exception as e:
-            log.error(f"Erro ao forçar refresh do token para {id}: {e}")
+            log.error("Erro ao forçar refresh do token para %s: %s", id, e)
             raise
 
+    async def force_refreshing_token_async(
+        self, id: str, stale_token: Optional[str] = None
+    ) -> str:
+        """
+        Versão assíncrona de force_refreshing_token.
+
+        As corrotinas do mesmo event loop que pedem refresh da mesma loja
+        compartilham uma única execução em thread.
+
+        Args:
+            id: Identificador da loja
+            stale_token: Token rejeitado pela API
+
+        Returns:
+            Novo token de acesso
+        """
+        import asyncio
+
+        return await self._async_refresh_flight.do_async(
+            id,
+            lambda: asyncio.to_thread(self.force_refreshing_token, id, stale_token),
+        )
+
+    def _refresh_single_flight(
+        self,
+        id: str,
+        cred: Dict[str, Any],
+        stale_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Atualiza e persiste o token da loja com no máximo um refresh por vez.
+
+        Chamadas concorrentes para a mesma loja aguardam o refresh em andamento
+        e recebem o mesmo resultado.
+
+        Args:
+            id: Identificador da loja
+            cred: Credenciais atuais
+            stale_token: Token considerado vencido pelo chamador
+
+        Returns:
+            Credenciais atualizadas
+        """
+        stale_token = stale_token if stale_token is not None else cred.get("access_token")
+        return self._refresh_flight.do(id, lambda: self._refresh_and_save(id, cred, stale_token))
+
+    def _refresh_and_save(
+        self,
+        id: str,
+        cred: Dict[str, Any],
+        stale_token: Optional[str],
+        save: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Executa o refresh, salvo se outra chamada já trocou o token vencido.
+
+        O token renovado só entra no cache depois de gravado; com save=False,
+        gravar e colocar em cache fica a cargo do chamador.
+        """
+        # Com cache compartilhado a trava também exclui outros processos
+        with self._token_cache.refresh_lock(id):
+            cached = self._token_cache.peek(id)
+            if (
+                cached is not None
+                and cached.get("access_token") != stale_token
+                and not self.is_token_invalid(cached.get("validade", ""))
+            ):
+                with self._stats_lock:
+                    self._stale_refreshes_skipped += 1
+                return cached
+
+            with metrics.stage("token_refresh", id):
+                cred = self.refresh_token(id, cred)
+            metrics.increment("token_refreshes_total")
+            if save:
+                self._persist_tokens({id: cred})
+                self._cache_token(id, cred)
+            return cred
+
+    def prefetch(self, ids: Iterable[str], chunk_size: int = 500) -> Dict[str, int]:
+        """
+        Aquece o cache com as credenciais de várias lojas.
+
+        Carrega as lojas ausentes do cache em consultas em lote, renova os
+        tokens vencidos e salva os renovados em uma única escrita por lote.
+
+        Args:
+            ids: Identificadores das lojas
+            chunk_size: Quantidade de lojas por consulta ao repositório
+
+        Returns:
+            Dicionário com lojas pedidas, já em cache, carregadas, renovadas
+            e com falha no refresh
+        """
+        ids = list(dict.fromkeys(ids))
+        missing = [id for id in ids if self._token_cache.peek(id) is None]
+        stats = {
+            "requested": len(ids),
+            "cached": len(ids) - len(missing),
+            "loaded": 0,
+            "refreshed": 0,
+            "failed": 0,
+        }
+
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            credentials = self._credentials_repository.get_credentials_many(chunk)
+            if self._write_buffer is not None:
+                # Tokens ainda não gravados são mais novos que os do repositório
+                for id in chunk:
+                    pending = self._write_buffer.get(id)
+                    if pending is not None:
+                        credentials[id] = pending
+            stats["loaded"] += len(credentials)
+
+            refreshed: Dict[str, Dict[str, Any]] = {}
+            for id, cred in credentials.items():
+                if not self.is_token_invalid(cred.get("validade", "")):
+                    self._cache_token(id, cred)
+                    continue
+                try:
+                    refreshed[id] = self._refresh_flight.do(
+                        id,
+                        partial(
+                            self._refresh_and_save,
+                            id,
+                            cred,
+                            cred.get("access_token"),
+                            save=False,
+                        ),
+                    )
+                except Exception as e:
+                    log.error("Erro ao fazer refresh do token para %s: %s", id, e)
+                    stats["failed"] += 1
+
+            if refreshed:
+                self._persist_tokens(refreshed)
+                for id, cred in refreshed.items():
+                    self._cache_token(id, cred)
+                stats["refreshed"] += len(refreshed)
+
+        return stats
+
+    def _load_credentials(self, id: str) -> Dict[str, Any]:
+        """Busca as credenciais da loja, priorizando um token ainda não gravado."""
+        if self._write_buffer is not None:
+            pending = self._write_buffer.get(id)
+            if pending is not None:
+                return pending
+        with metrics.stage("repository_read", id):
+            return self._credentials_repository.get_credentials(id)
+
+    def _persist_tokens(self, tokens: Dict[str, Dict[str, Any]]) -> None:
+        """Salva os tokens no repositório, direto ou pelo buffer write-behind."""
+        if self._write_buffer is not None:
+            self._write_buffer.put_many(tokens)
+            return
+        with metrics.stage("repository_write"):
+            if len(tokens) == 1:
+                [(id, token)] = tokens.items()
+                self._credentials_repository.save_token(id, token)
+            else:
+                self._credentials_repository.save_tokens(tokens)
+
+    def _cache_token(self, id: str, cred: Dict[str, Any]) -> None:
+        """Guarda o token no cache e agenda sua renovação proativa."""
+        expires_at = validade_to_epoch(cred.get("validade", ""))
+        self._token_cache.set(id, cred, expires_at)
+        if self._renewal_scheduler is not None and expires_at is not None:
+            self._renewal_scheduler.schedule(id, expires_at)
+
+    def _renew_in_background(self, id: str) -> bool:
+        """
+        Renova o token da loja a partir do agendador, fora do caminho da requisição.
+
+        Returns:
+            False se a loja saiu do cache e não há token a renovar
+        """
+        cred = self._token_cache.peek(id)
+        if cred is None:
+            return False
+        log.info("Renovando token de %s antes da expiração", id)
+        self._refresh_single_flight(id, cred)
+        return True
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache de tokens.
+
+        Returns:
+            Dicionário com tamanho, acertos, faltas e remoções do cache
+        """
+        return self._token_cache.get_stats()
+
+    def get_renewal_stats(self) -> Dict[str, float]:
+        """
+        Retorna estatísticas da renovação proativa.
+
+        Returns:
+            Dicionário com lojas agendadas, renovações, falhas e segundos até
+            a próxima renovação; vazio se a renovação proativa estiver desligada
+        """
+        if self._renewal_scheduler is None:
+            return {}
+        return self._renewal_scheduler.get_stats()
+
+    def get_write_behind_stats(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas da gravação write-behind.
+
+        Returns:
+            Dicionário com gravações pendentes, tokens gravados, gravações
+            substituídas, lotes e falhas; vazio se o write-behind estiver desligado
+        """
+        if self._write_buffer is None:
+            return {}
+        return self._write_buffer.get_stats()
+
+    def close(self) -> None:
+        """Encerra a renovação proativa e grava os tokens pendentes."""
+        if self._renewal_scheduler is not None:
+            self._renewal_scheduler.stop()
+        if self._write_buffer is not None:
+            self._write_buffer.close()
+
+    def get_refresh_stats(self) -> Dict[str, int]:
+        """
+        Retorna contadores de refresh de tokens.
+
+        Returns:
+            Dicionário com refreshes executados, chamadas coalescidas em um
+            refresh em andamento e refreshes evitados por token já renovado
+        """
+        sync_stats = self._refresh_flight.get_stats()
+        async_stats = self._async_refresh_flight.get_stats()
+        with self._stats_lock:
+            skipped = self._stale_refreshes_skipped
+        return {
+            "refreshes": sync_stats["executions"] - skipped,
+            "coalesced": sync_stats["coalesced"] + async_stats["coalesced"],
+            "skipped_already_refreshed": skipped,
+            "in_flight": sync_stats["in_flight"],
+        }
+
     def _obtain_new_token(self, id: str) -> Dict[str, Any]:
         """
         Obtém novo token através do fluxo OAuth.
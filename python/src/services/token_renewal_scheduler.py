@@ -0,0 +1,187 @@
+"""
+Agendador de renovação proativa de tokens.
+
+Mantém um heap ordenado pelo horário de renovação de cada loja
+(validade - margem - jitter) e executa as renovações em uma thread de
+fundo, fora do caminho das requisições.
+"""
+
+import heapq
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.log import log
+
+
+class TokenRenewalScheduler:
+    """Renova tokens em segundo plano antes de expirarem."""
+
+    def __init__(
+        self,
+        renew: Callable[[str], bool],
+        margin: float = 300.0,
+        jitter: float = 30.0,
+        retry_interval: float = 30.0,
+    ):
+        """
+        Inicializa o agendador.
+
+        Args:
+            renew: Função que renova o token da loja informada. Retorna False
+                se não havia o que renovar (loja removida do cache, por exemplo)
+            margin: Antecedência, em segundos, da renovação em relação à validade
+            jitter: Variação aleatória máxima, em segundos, somada à antecedência
+                para espalhar renovações de tokens com a mesma validade
+            retry_interval: Espera, em segundos, antes de tentar de novo após falha
+        """
+        self._renew = renew
+        self._margin = margin
+        self._jitter = jitter
+        self._retry_interval = retry_interval
+
+        # Entradas (horário, sequência, id); entradas substituídas ficam no heap
+        # e são descartadas ao chegar ao topo (remoção preguiçosa)
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, Tuple[float, int]] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._renewals = 0
+        self._skipped = 0
+        self._failures = 0
+
+    def schedule(self, id: str, expires_at: float) -> None:
+        """
+        Agenda (ou reagenda) a renovação do token da loja.
+
+        Args:
+            id: Identificador da loja
+            expires_at: Validade do token em epoch (segundos)
+        """
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return
+        # Tokens que vivem menos que a margem são renovados na metade da vida,
+        # evitando renovações em sequência
+        advance = min(self._margin + random.uniform(0, self._jitter), remaining / 2)
+        due = expires_at - advance
+        with self._condition:
+            if self._stopped:
+                return
+            self._expires_at[id] = expires_at
+            self._push(id, due)
+            self._ensure_worker()
+
+    def cancel(self, id: str) -> None:
+        """
+        Remove o agendamento da loja.
+
+        Args:
+            id: Identificador da loja
+        """
+        with self._condition:
+            self._due.pop(id, None)
+            self._expires_at.pop(id, None)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Encerra a thread de renovação.
+
+        Args:
+            timeout: Tempo máximo de espera pelo término da thread
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Retorna estatísticas do agendador.
+
+        Returns:
+            Dicionário com lojas agendadas, renovações, agendamentos ignorados
+            (sem token a renovar), falhas e segundos até a próxima renovação
+        """
+        with self._condition:
+            next_due = min((due for due, _ in self._due.values()), default=None)
+            return {
+                "scheduled": len(self._due),
+                "renewals": self._renewals,
+                "skipped": self._skipped,
+                "failures": self._failures,
+                "next_renewal_in": (
+                    max(next_due - time.time(), 0.0) if next_due is not None else -1.0
+                ),
+            }
+
+    def _push(self, id: str, due: float) -> None:
+        self._sequence += 1
+        self._due[id] = (due, self._sequence)
+        heapq.heappush(self._heap, (due, self._sequence, id))
+        self._condition.notify()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="token-renewal", daemon=True
+            )
+            self._thread.start()
+
+    def _next_due(self) -> Optional[Tuple[str, float]]:
+        """
+        Aguarda o próximo agendamento vencido.
+
+        Returns:
+            Loja e validade do token agendado; None quando o agendador para
+        """
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due, sequence, id = self._heap[0]
+                if self._due.get(id) != (due, sequence):
+                    heapq.heappop(self._heap)
+                    continue
+                wait = due - time.time()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+                del self._due[id]
+                # O renew chama schedule com a nova validade; sem renovação, a
+                # loja deixa o agendador
+                return id, self._expires_at.pop(id)
+            return None
+
+    def _run(self) -> None:
+        while True:
+            entry = self._next_due()
+            if entry is None:
+                return
+            id, expires_at = entry
+            try:
+                renewed = self._renew(id)
+                with self._condition:
+                    if renewed:
+                        self._renewals += 1
+                    else:
+                        self._skipped += 1
+            except Exception as e:
+                log.error("Erro na renovação proativa do token para %s: %s", id, e)
+                with self._condition:
+                    self._failures += 1
+                    if (
+                        not self._stopped
+                        and id not in self._due
+                        and time.time() + self._retry_interval < expires_at
+                    ):
+                        self._expires_at[id] = expires_at
+                        self._push(id, time.time() + self._retry_interval)
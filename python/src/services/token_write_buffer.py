@@ -0,0 +1,155 @@
+"""
+Buffer de escrita atrasada (write-behind) para tokens.
+
+Recebe os tokens renovados em memória, mantém apenas o mais recente de
+cada loja e os persiste em lote no repositório, por tempo ou por volume,
+fora do caminho da requisição.
+"""
+
+import atexit
+import threading
+from typing import Any, Dict, Optional
+
+from ..interfaces.credentials_repository_interface import ICredentialsRepository
+from ..utils.log import log
+
+
+class TokenWriteBuffer:
+    """Agrupa e persiste em lote os tokens renovados."""
+
+    def __init__(
+        self,
+        credentials_repository: ICredentialsRepository,
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+    ):
+        """
+        Inicializa o buffer e sua thread de gravação.
+
+        Args:
+            credentials_repository: Repositório onde os tokens são salvos
+            flush_interval: Intervalo máximo, em segundos, entre gravações
+            max_pending: Quantidade de lojas pendentes que antecipa a gravação
+        """
+        self._credentials_repository = credentials_repository
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._condition = threading.Condition()
+        # Serializa as gravações: flush explícito e thread nunca gravam juntos
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._coalesced = 0
+        self._flushes = 0
+        self._failures = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="token-write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, id: str, token: Dict[str, Any]) -> None:
+        """
+        Enfileira o token da loja, substituindo um token ainda pendente.
+
+        Args:
+            id: Identificador da loja
+            token: Dados do token (access_token, refresh_token, validade)
+        """
+        self.put_many({id: token})
+
+    def put_many(self, tokens: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Enfileira os tokens de várias lojas.
+
+        Args:
+            tokens: Dicionário id -> dados do token
+        """
+        with self._condition:
+            if self._closed:
+                # Após o encerramento grava direto para não perder o token
+                self._credentials_repository.save_tokens(tokens)
+                return
+            for id, token in tokens.items():
+                if id in self._pending:
+                    self._coalesced += 1
+                self._pending[id] = token
+            if len(self._pending) >= self._max_pending:
+                self._condition.notify()
+
+    def get(self, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o token ainda não persistido da loja, se houver.
+
+        Args:
+            id: Identificador da loja
+        Returns:
+            Token pendente, ou None
+        """
+        with self._condition:
+            return self._pending.get(id)
+
+    def flush(self) -> None:
+        """Grava imediatamente todos os tokens pendentes."""
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                self._credentials_repository.save_tokens(batch)
+            except Exception as e:
+                log.error("Erro ao gravar %s tokens pendentes: %s", len(batch), e)
+                with self._condition:
+                    self._failures += 1
+                    # Devolve o lote sem sobrescrever tokens mais novos
+                    for id, token in batch.items():
+                        self._pending.setdefault(id, token)
+                raise
+            with self._condition:
+                self._written += len(batch)
+                self._flushes += 1
+
+    def close(self) -> None:
+        """Encerra a thread de gravação e grava o que estiver pendente."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas do buffer.
+
+        Returns:
+            Dicionário com gravações pendentes, tokens gravados, gravações
+            evitadas por substituição, lotes gravados e falhas
+        """
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "written": self._written,
+                "coalesced": self._coalesced,
+                "flushes": self._flushes,
+                "failures": self._failures,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self._max_pending:
+                    self._condition.wait(self._flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # Falha já registrada; o lote volta ao buffer para a próxima rodada
+                pass
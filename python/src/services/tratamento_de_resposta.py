@@ -1,37 +1,61 @@
-import json
-from typing import Any, Dict
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
 
 import requests
 
+from ..utils.json_backend import loads
 from ..utils.log import log
 
 
-def tratamento_de_resposta(resp: requests.Response) -> Dict[str, Any]:
+def tratamento_de_resposta(resp: requests.Response, stream: bool = False) -> Dict[str, Any]:
     """
     Analisa a resposta HTTP e retorna um dicionário de controle:
     {
-        'retry': bool,        # Se deve tentar novamente
-        'finished': bool,     # Se deve encerrar e retornar
-        'response': dict      # O conteúdo da resposta
+        'refresh_token': bool,  # Se deve renovar o token antes de tentar
+        'retry_after': float,   # Espera pedida pela API (Retry-After) ou None
+        'response': dict        # O conteúdo da resposta
     }
-    """
-    try:
-        resp_data = resp.json()
-    except (json.JSONDecodeError, ValueError):
-        resp_data = {"raw_content": resp.text}
 
+    Quais status geram nova tentativa é decidido pela RetryPolicy do
+    cliente (retry_statuses), não por esta função.
+
+    Com stream=True, o corpo de respostas 2xx não é lido: 'response' traz a
+    própria resposta, para leitura incremental por quem fez a requisição.
+    """
     status = resp.status_code
+    retry_after = _retry_after(resp)
+
+    if stream and 200 <= status < 300:
+        resp_data: Any = resp
+    else:
+        try:
+            resp_data = loads(resp.content)
+        except ValueError:
+            resp_data = {"raw_content": resp.text}
 
-    if 200 <= status < 300:
-        return {"retry": False, "refresh_token": False, "response": resp_data}
     if status == 401:
         log.warning("Resposta 401 - Token pode estar expirado")
-        return {"retry": True, "refresh_token": True, "response": resp_data}
-    if status == 429:
-        return {"retry": True, "refresh_token": False, "response": resp_data}
-    if status == 503:
+    elif status == 503:
         log.warning("Resposta 503 - Serviço indisponível")
-        return {"retry": False, "refresh_token": False, "response": resp_data}
 
-    # Outros erros: não tenta novamente, retorna resposta
-    return {"retry": False, "refresh_token": False, "response": resp_data}
+    return {
+        "refresh_token": status == 401,
+        "retry_after": retry_after,
+        "response": resp_data,
+    }
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    """Converte o header Retry-After (segundos ou data HTTP) em segundos."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
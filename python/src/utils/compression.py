@@ -0,0 +1,223 @@
+"""
+Compressão dos corpos das requisições, negociação de Accept-Encoding e
+contagem dos bytes transferidos.
+
+gzip e deflate usam a biblioteca padrão; brotli ("br") requer o extra
+"brotli". As respostas são descomprimidas por StreamDecoder enquanto o
+corpo é lido, o que permite contar os bytes recebidos da rede mesmo em
+respostas chunked: só são anunciadas as codificações que ele decodifica.
+"""
+
+import gzip
+import threading
+import zlib
+from importlib.util import find_spec
+from typing import Any, Dict, Optional, Tuple, Type
+
+from . import metrics
+
+GZIP = "gzip"
+BROTLI = "br"
+
+_brotli_available: Optional[bool] = None
+
+
+def brotli_available() -> bool:
+    """
+    Indica se o brotli está instalado (sem importá-lo).
+
+    Returns:
+        True se o módulo brotli puder ser importado
+    """
+    global _brotli_available
+    if _brotli_available is None:
+        _brotli_available = find_spec("brotli") is not None
+    return _brotli_available
+
+
+def accept_encoding() -> str:
+    """
+    Valor padrão do header Accept-Encoding.
+
+    Returns:
+        Codificações que o transporte decodifica, por ordem de preferência
+    """
+    return "br, gzip, deflate" if brotli_available() else "gzip, deflate"
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Comprime um corpo de requisição.
+
+    Args:
+        data: Corpo original
+        encoding: "gzip" ou "br"
+        level: Nível de compressão (padrão: 6 no gzip, 5 no brotli)
+    Returns:
+        Corpo comprimido, para o header Content-Encoding igual a encoding
+    Raises:
+        ValueError: Se a codificação for desconhecida ou o brotli não estiver instalado
+    """
+    if encoding == GZIP:
+        # mtime fixo: o mesmo corpo gera sempre os mesmos bytes
+        return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == BROTLI:
+        if not brotli_available():
+            raise ValueError("brotli não está instalado (extra 'brotli')")
+        import brotli
+
+        return brotli.compress(data, quality=5 if level is None else level)
+    raise ValueError(f"Codificação inválida: {encoding}")
+
+
+class StreamDecoder:
+    """Descompressão incremental do corpo de uma resposta."""
+
+    def __init__(self, encoding: Optional[str]):
+        """
+        Inicializa o decodificador.
+
+        Args:
+            encoding: Valor do header Content-Encoding. Codificações
+                desconhecidas (ou identity) passam sem alteração
+        """
+        self.encoding = (encoding or "identity").strip().lower()
+        self._decompressor: Any = None
+        self._errors: Tuple[Type[BaseException], ...] = (zlib.error,)
+        self._first = True
+        if self.encoding in (GZIP, "x-gzip"):
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+        elif self.encoding == BROTLI and brotli_available():
+            import brotli
+
+            self._decompressor = brotli.Decompressor()
+            self._errors = (brotli.error,)
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Descomprime o próximo pedaço do corpo.
+
+        Args:
+            data: Bytes recebidos da rede
+        Returns:
+            Bytes decodificados disponíveis até agora
+        Raises:
+            ValueError: Se o corpo não estiver na codificação anunciada
+        """
+        if self._decompressor is None or not data:
+            return data
+        try:
+            if self.encoding == BROTLI:
+                return self._decompressor.process(data)
+            if self.encoding == "deflate":
+                return self._inflate(data)
+            return self._gunzip(data)
+        except self._errors as e:
+            raise ValueError(f"Corpo {self.encoding} inválido: {e}") from e
+
+    def flush(self) -> bytes:
+        """
+        Finaliza a descompressão.
+
+        Returns:
+            Bytes decodificados restantes
+        """
+        if self._decompressor is None or self.encoding == BROTLI:
+            return b""
+        return self._decompressor.flush()
+
+    def _inflate(self, data: bytes) -> bytes:
+        if not self._first:
+            return self._decompressor.decompress(data)
+        self._first = False
+        try:
+            return self._decompressor.decompress(data)
+        except zlib.error:
+            # Servidores que enviam deflate sem o cabeçalho zlib
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(data)
+
+    def _gunzip(self, data: bytes) -> bytes:
+        # Um corpo gzip pode ter vários membros concatenados
+        output = self._decompressor.decompress(data)
+        while self._decompressor.unused_data:
+            data = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            output += self._decompressor.decompress(data)
+        return output
+
+
+class TransferStats:
+    """Bytes transferidos pelo cliente: tamanho na rede e decodificado."""
+
+    def __init__(self) -> None:
+        """Inicializa os contadores."""
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._requests_compressed = 0
+        self._request_bytes = 0
+        self._request_wire_bytes = 0
+        self._responses = 0
+        self._response_bytes = 0
+        self._response_wire_bytes = 0
+
+    def record_request(self, size: int, wire_size: int) -> None:
+        """
+        Registra o corpo de uma requisição.
+
+        Args:
+            size: Tamanho original do corpo em bytes
+            wire_size: Tamanho enviado (comprimido, se for o caso)
+        """
+        with self._lock:
+            self._requests += 1
+            self._requests_compressed += wire_size != size
+            self._request_bytes += size
+            self._request_wire_bytes += wire_size
+        metrics.increment("request_body_bytes_total", size, size="decoded")
+        metrics.increment("request_body_bytes_total", wire_size, size="wire")
+
+    def record_response(self, wire_size: int, size: int) -> None:
+        """
+        Registra o corpo de uma resposta.
+
+        Args:
+            wire_size: Bytes recebidos da rede (comprimidos, se for o caso)
+            size: Tamanho do corpo decodificado
+        """
+        with self._lock:
+            self._responses += 1
+            self._response_bytes += size
+            self._response_wire_bytes += wire_size
+        metrics.increment("response_body_bytes_total", size, size="decoded")
+        metrics.increment("response_body_bytes_total", wire_size, size="wire")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os totais transferidos.
+
+        Returns:
+            Dicionário com requests, requests_compressed, request_bytes,
+            request_wire_bytes, responses, response_bytes, response_wire_bytes
+            e as razões wire/decodificado (request_ratio, response_ratio)
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "requests_compressed": self._requests_compressed,
+                "request_bytes": self._request_bytes,
+                "request_wire_bytes": self._request_wire_bytes,
+                "request_ratio": (
+                    self._request_wire_bytes / self._request_bytes if self._request_bytes else 1.0
+                ),
+                "responses": self._responses,
+                "response_bytes": self._response_bytes,
+                "response_wire_bytes": self._response_wire_bytes,
+                "response_ratio": (
+                    self._response_wire_bytes / self._response_bytes
+                    if self._response_bytes
+                    else 1.0
+                ),
+            }
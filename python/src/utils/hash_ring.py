@@ -0,0 +1,89 @@
+"""
+Hash consistente para distribuir lojas entre workers.
+
+Cada worker ocupa vários pontos (réplicas) em um anel de hashes; a loja
+vai para o primeiro ponto depois do seu hash. A mesma loja cai sempre no
+mesmo worker, em qualquer processo e execução, e adicionar ou remover um
+worker só move as lojas dele.
+"""
+
+import bisect
+import hashlib
+from typing import Dict, Iterable, List
+
+
+def _hash(key: str) -> int:
+    # hash() do Python muda a cada processo (PYTHONHASHSEED): usa blake2b
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Anel de hash consistente."""
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 100):
+        """
+        Inicializa o anel.
+
+        Args:
+            nodes: Nós iniciais
+            replicas: Pontos de cada nó no anel; mais pontos equilibram melhor
+                a distribuição
+        """
+        if replicas < 1:
+            raise ValueError(f"replicas inválido: {replicas}")
+        self._replicas = replicas
+        self._hashes: List[int] = []
+        self._owners: Dict[int, str] = {}
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Nós do anel, em ordem alfabética."""
+        return sorted(set(self._owners.values()))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, node: str) -> None:
+        """
+        Adiciona um nó ao anel.
+
+        Args:
+            node: Nome do nó
+        """
+        for replica in range(self._replicas):
+            point = _hash(f"{node}#{replica}")
+            # Colisões (raríssimas) ficam com o nó já presente
+            if point not in self._owners:
+                self._owners[point] = node
+                bisect.insort(self._hashes, point)
+
+    def remove(self, node: str) -> None:
+        """
+        Remove um nó; suas chaves passam para os nós seguintes do anel.
+
+        Args:
+            node: Nome do nó
+        """
+        for replica in range(self._replicas):
+            point = _hash(f"{node}#{replica}")
+            if self._owners.get(point) == node:
+                del self._owners[point]
+                del self._hashes[bisect.bisect_left(self._hashes, point)]
+
+    def node_for(self, key: str) -> str:
+        """
+        Retorna o nó responsável pela chave.
+
+        Args:
+            key: Chave (identificador da loja)
+        Returns:
+            Nome do nó
+        Raises:
+            LookupError: Se o anel estiver vazio
+        """
+        if not self._hashes:
+            raise LookupError("Anel de hash sem nós")
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[self._hashes[index]]
@@ -0,0 +1,124 @@
+"""
+Backend de JSON usado pelos clientes.
+
+Usa o orjson quando instalado (extra "fast") e o json da biblioteca padrão
+caso contrário. O orjson só é importado no primeiro uso. O backend pode ser
+trocado em tempo de execução com set_json_backend.
+
+Os dois backends aceitam os mesmos objetos: chaves não textuais (ex.: int)
+são convertidas em texto e tipos que o orjson recusa, como subclasses de
+dict e int, são serializados pelo json.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+from .log import log
+
+# Módulo orjson, importado no primeiro uso
+_orjson: Any = None
+# Backend ativo; None até o primeiro uso
+_backend: Optional[str] = None
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Decodifica JSON com o backend ativo.
+
+    Args:
+        data: Documento JSON em bytes ou texto
+    Returns:
+        Objeto Python
+    Raises:
+        ValueError: Se o documento não for JSON válido
+    """
+    if _backend is None:
+        _use(_default_backend())
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializa um objeto em JSON (UTF-8, sem espaços) com o backend ativo.
+
+    Args:
+        obj: Objeto a serializar
+    Returns:
+        Documento JSON em bytes
+    """
+    if _backend is None:
+        _use(_default_backend())
+    return _dumps(obj)
+
+
+def get_json_backend() -> str:
+    """
+    Retorna o backend ativo.
+
+    Returns:
+        "orjson" ou "json"
+    """
+    return _backend or _default_backend()
+
+
+def set_json_backend(name: str) -> None:
+    """
+    Troca o backend de JSON.
+
+    Args:
+        name: "orjson" ou "json"
+    Raises:
+        ValueError: Se o backend for desconhecido ou não estiver instalado
+    """
+    if name == "orjson" and _import_orjson() is None:
+        raise ValueError("orjson não está instalado (extra 'fast')")
+    if name not in ("orjson", "json"):
+        raise ValueError(f"Backend de JSON inválido: {name}")
+    _use(name)
+    log.info("Backend de JSON: %s", name)
+
+
+def _use(name: str) -> None:
+    global _backend, _loads, _dumps
+    if name == "orjson":
+        _loads, _dumps = _orjson.loads, _orjson_dumps
+    else:
+        _loads, _dumps = _std_loads, _std_dumps
+    _backend = name
+
+
+def _default_backend() -> str:
+    return "orjson" if _import_orjson() is not None else "json"
+
+
+def _import_orjson() -> Any:
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            return None
+        _orjson = orjson
+    return _orjson
+
+
+def _std_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def _std_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Subclasses e tipos que o orjson recusa: o json decide se são válidos
+        return _std_dumps(obj)
+
+
+_loads: Callable[[Any], Any] = _std_loads
+_dumps: Callable[[Any], bytes] = _std_dumps
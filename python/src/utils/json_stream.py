@@ -0,0 +1,204 @@
+"""
+Decodificação incremental de listas JSON.
+
+Lê o corpo de uma resposta em pedaços e entrega, um a um, os elementos
+do array de uma chave do objeto raiz (por padrão "data"), sem montar o
+documento inteiro em memória. Os elementos são decodificados pelo
+scanner em C do json padrão, que também delimita cada elemento; apenas
+a busca pelo início do array é feita em Python.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, List, Optional
+
+_SEEK = 0
+_ITEMS = 1
+_DONE = 2
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_COMMA = ord(",")
+_COLON = ord(":")
+_OPEN = frozenset(b"{[")
+_CLOSE = frozenset(b"}]")
+_ARRAY_OPEN = ord("[")
+
+# Próximo caractere relevante fora e dentro de strings; separadores entre elementos
+_STRUCTURE = re.compile(rb'["{}\[\],:]')
+_STRING = re.compile(rb'["\\]')
+_SEPARATORS = re.compile(r"[\s,]*")
+_ITEM_END = frozenset(" \t\r\n,]")
+
+
+class JsonArrayStream:
+    """Parser incremental dos elementos de um array JSON."""
+
+    def __init__(self, key: Optional[str] = "data"):
+        """
+        Inicializa o parser.
+
+        Args:
+            key: Chave do objeto raiz que contém o array. Se None, o próprio
+                documento deve ser o array
+        """
+        self._key = key.encode() if key is not None else None
+        self._buf = bytearray()
+        self._pos = 0
+        self._state = _SEEK
+        self._depth = 0
+        self._in_string = False
+        self._string_start = -1
+        self._last_string: Optional[bytes] = None
+        self._current_key: Optional[bytes] = None
+        # Após a abertura do array, o corpo é mantido como texto
+        self._text = ""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+
+    @property
+    def done(self) -> bool:
+        """Indica se o array (ou o documento, quando sem o array) terminou."""
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Processa mais um pedaço do corpo.
+
+        Args:
+            chunk: Bytes recebidos
+        Returns:
+            Elementos do array completados por este pedaço
+        """
+        if self._state == _DONE or not chunk:
+            return []
+        items: List[Any] = []
+        if self._state == _SEEK:
+            self._buf += chunk
+            self._seek()
+            if self._state == _ITEMS:
+                self._text = self._utf8.decode(bytes(self._buf[self._pos :]))
+                self._buf.clear()
+                self._pos = 0
+        else:
+            self._text += self._utf8.decode(chunk)
+        if self._state == _ITEMS:
+            self._read_items(items)
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Confirma que o corpo terminou com o array completo.
+
+        Raises:
+            ValueError: Se o corpo foi truncado antes do fim do array
+        """
+        if self._state != _DONE:
+            raise ValueError(
+                "JSON incompleto ou inválido: corpo terminou antes do fim do array"
+            )
+
+    def _seek(self) -> None:
+        """Avança até a abertura do array procurado, acompanhando chaves e aninhamento."""
+        buf, pos, n = self._buf, self._pos, len(self._buf)
+        while pos < n:
+            if self._in_string:
+                pos = self._skip_string(pos, n)
+                if self._in_string:
+                    break
+                if self._string_start >= 0:
+                    self._last_string = bytes(buf[self._string_start : pos - 1])
+                    self._string_start = -1
+                continue
+
+            match = _STRUCTURE.search(buf, pos)
+            if match is None:
+                pos = n
+                break
+            pos = match.start()
+            char = buf[pos]
+            pos += 1
+            if char == _QUOTE:
+                self._in_string = True
+                # Apenas strings no primeiro nível do objeto podem ser a chave
+                self._string_start = pos if self._depth == 1 else -1
+            elif char == _COLON and self._depth == 1:
+                self._current_key = self._last_string
+            elif char == _COMMA and self._depth == 1:
+                self._current_key = None
+            elif char in _OPEN:
+                if char == _ARRAY_OPEN and (
+                    (self._key is None and self._depth == 0)
+                    or (self._depth == 1 and self._current_key == self._key)
+                ):
+                    self._state = _ITEMS
+                    break
+                self._depth += 1
+            elif char in _CLOSE:
+                self._depth -= 1
+                if self._depth <= 0:
+                    # Documento terminou sem o array procurado
+                    self._state = _DONE
+                    break
+        self._pos = pos
+
+    def _read_items(self, items: List[Any]) -> None:
+        """Decodifica os elementos completos do array."""
+        text, pos = self._text, self._pos
+        n = len(text)
+        while True:
+            pos = _SEPARATORS.match(text, pos).end()
+            if pos >= n:
+                break
+            if text[pos] == "]":
+                self._state = _DONE
+                pos += 1
+                break
+            try:
+                item, end = self._decoder.raw_decode(text, pos)
+            except ValueError:
+                # Elemento ainda incompleto: aguarda o próximo pedaço
+                break
+            if end >= n or text[end] not in _ITEM_END:
+                # Um número cortado no fim do pedaço ("12" de "12.5") só é
+                # aceito quando o separador seguinte chegar
+                break
+            items.append(item)
+            pos = end
+        self._pos = pos
+
+    def _skip_string(self, pos: int, n: int) -> int:
+        """Avança até depois do fim da string atual ou até onde houver dados."""
+        buf = self._buf
+        while True:
+            match = _STRING.search(buf, pos)
+            if match is None:
+                return n
+            pos = match.start()
+            if buf[pos] == _BACKSLASH:
+                if pos + 1 >= n:
+                    # Escape dividido entre pedaços: aguarda o próximo
+                    return pos
+                pos += 2
+                continue
+            self._in_string = False
+            return pos + 1
+
+    def _compact(self) -> None:
+        """Descarta o que já foi processado, mantendo só o elemento em andamento."""
+        if self._state == _DONE:
+            self._buf.clear()
+            self._text = ""
+            self._pos = 0
+        elif self._state == _ITEMS:
+            self._text = self._text[self._pos :]
+            self._pos = 0
+        else:
+            cut = self._string_start if self._string_start >= 0 else self._pos
+            if cut:
+                del self._buf[:cut]
+                self._pos -= cut
+                if self._string_start >= 0:
+                    self._string_start -= cut
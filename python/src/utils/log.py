@@ -1,7 +1,27 @@
+"""
+Logger do pacote.
+
+O pacote não configura o logging ao ser importado: sem configuração da
+aplicação, as mensagens são descartadas. Scripts e jobs podem chamar
+configure_logging para o formato padrão no stderr.
+"""
+
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def configure_logging(level: int = logging.INFO, format: str = FORMAT) -> None:
+    """
+    Configura o logging raiz com o formato padrão do pacote.
+
+    Não altera uma configuração já existente (mesma regra do basicConfig).
+
+    Args:
+        level: Nível mínimo das mensagens
+        format: Formato das mensagens
+    """
+    logging.basicConfig(level=level, format=format)
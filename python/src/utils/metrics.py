@@ -0,0 +1,112 @@
+"""
+Ganchos de métricas e tracing.
+
+Client, AsyncClient, TokenManager e EncryptionService registram aqui o
+tempo de cada etapa (busca do token, leitura e gravação no repositório,
+descriptografia, HTTP) e contadores (acertos de cache, refreshes, novas
+tentativas). O destino é uma Instrumentation plugável, por exemplo
+PrometheusMetrics ou OpenTelemetryInstrumentation. Sem instrumentação
+configurada, cada ponto de medição custa só a checagem de uma flag.
+"""
+
+from typing import Any, ContextManager, Optional
+
+# Lido a cada ponto de medição; só muda via set_instrumentation
+enabled = False
+
+
+class _NoopStage:
+    """Etapa que não mede nada, reutilizada quando não há instrumentação."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopStage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP = _NoopStage()
+
+
+class Instrumentation:
+    """Destino das métricas e spans. A implementação base descarta tudo."""
+
+    def stage(self, name: str, id: Optional[str] = None, **labels: str) -> ContextManager[Any]:
+        """
+        Mede a duração de uma etapa.
+
+        Args:
+            name: Nome da etapa, por exemplo "http" ou "decrypt"
+            id: Identificador da loja, usado como atributo do span (não
+                vira label de métrica, para não multiplicar as séries)
+            **labels: Labels adicionais da métrica
+        Returns:
+            Context manager que encerra a medição ao sair
+        """
+        return _NOOP
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """
+        Incrementa um contador.
+
+        Args:
+            name: Nome do contador
+            value: Incremento
+            **labels: Labels do contador
+        """
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Registra um valor em um histograma.
+
+        Args:
+            name: Nome do histograma
+            value: Valor observado
+            **labels: Labels do histograma
+        """
+
+
+_instrumentation = Instrumentation()
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """
+    Define o destino das métricas do pacote.
+
+    Args:
+        instrumentation: Instrumentação a usar. Se None, desliga as medições
+    """
+    global _instrumentation, enabled
+    _instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+    enabled = instrumentation is not None
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Retorna o destino atual das métricas.
+
+    Returns:
+        Instrumentação configurada (a base, que descarta tudo, se nenhuma)
+    """
+    return _instrumentation
+
+
+def stage(name: str, id: Optional[str] = None, **labels: str) -> ContextManager[Any]:
+    """Mede uma etapa na instrumentação atual (ver Instrumentation.stage)."""
+    if not enabled:
+        return _NOOP
+    return _instrumentation.stage(name, id, **labels)
+
+
+def increment(name: str, value: float = 1.0, **labels: str) -> None:
+    """Incrementa um contador na instrumentação atual."""
+    if enabled:
+        _instrumentation.increment(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    """Registra um valor de histograma na instrumentação atual."""
+    if enabled:
+        _instrumentation.observe(name, value, **labels)
@@ -0,0 +1,108 @@
+"""
+Instrumentação via OpenTelemetry.
+
+Cada etapa vira um span (com a loja no atributo tenant.id) e uma
+observação no histograma stage_seconds; contadores e histogramas usam o
+meter global. Requer o extra "otel" (opentelemetry-api); a exportação é
+configurada pela aplicação com o SDK do OpenTelemetry.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from opentelemetry import metrics as otel_metrics
+from opentelemetry import trace
+
+from .metrics import Instrumentation
+
+
+class _Stage:
+    """Span e medição de uma etapa."""
+
+    __slots__ = ("_owner", "_name", "_labels", "_span", "_start")
+
+    def __init__(
+        self,
+        owner: "OpenTelemetryInstrumentation",
+        name: str,
+        id: Optional[str],
+        labels: Dict[str, str],
+    ):
+        self._owner = owner
+        self._name = name
+        self._labels = labels
+        attributes: Dict[str, Any] = dict(labels)
+        if id is not None:
+            attributes["tenant.id"] = id
+        self._span = owner._tracer.start_as_current_span(name, attributes=attributes)
+
+    def __enter__(self) -> "_Stage":
+        self._span.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._owner.observe(
+            "stage_seconds", time.perf_counter() - self._start, stage=self._name, **self._labels
+        )
+        self._span.__exit__(*exc_info)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Instrumentação que envia spans e métricas ao OpenTelemetry."""
+
+    def __init__(self, name: str = "pacote_api"):
+        """
+        Inicializa a instrumentação.
+
+        Args:
+            name: Nome do tracer e do meter (escopo de instrumentação)
+        """
+        self._tracer = trace.get_tracer(name)
+        self._meter = otel_metrics.get_meter(name)
+        self._counters: Dict[str, Any] = {}
+        self._histograms: Dict[str, Any] = {}
+
+    def stage(self, name: str, id: Optional[str] = None, **labels: str) -> _Stage:
+        """
+        Abre um span da etapa e mede sua duração.
+
+        Args:
+            name: Nome da etapa (nome do span)
+            id: Identificador da loja (atributo tenant.id do span)
+            **labels: Atributos do span e da métrica
+        Returns:
+            Context manager do span
+        """
+        return _Stage(self, name, id, labels)
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """
+        Incrementa um contador.
+
+        Args:
+            name: Nome do contador
+            value: Incremento
+            **labels: Atributos do contador
+        """
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters.setdefault(name, self._meter.create_counter(name))
+        counter.add(value, labels)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Registra um valor em um histograma.
+
+        Args:
+            name: Nome do histograma
+            value: Valor observado
+            **labels: Atributos do histograma
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            unit = "s" if name.endswith("_seconds") else ""
+            histogram = self._histograms.setdefault(
+                name, self._meter.create_histogram(name, unit=unit)
+            )
+        histogram.record(value, labels)
@@ -0,0 +1,136 @@
+"""
+Regras de paginação das listagens da API.
+
+Descreve como montar a URL de cada página (por número de página ou por
+offset), onde estão os itens na resposta e quando a listagem termina.
+Usado por Client.iter_pages/iter_items e pela versão assíncrona.
+"""
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+PAGE = "page"
+OFFSET = "offset"
+
+
+class PaginationError(Exception):
+    """Página da listagem sem a lista de itens (resposta de erro da API)."""
+
+    def __init__(self, page: Any):
+        super().__init__(f"Resposta inesperada na listagem: {page!r:.200}")
+        self.page = page
+
+
+class Pagination:
+    """Parâmetros de paginação de uma listagem."""
+
+    def __init__(
+        self,
+        page_param: str = "pagina",
+        size_param: Optional[str] = "limite",
+        page_size: Optional[int] = 100,
+        start: int = 1,
+        mode: str = PAGE,
+        items_key: Optional[str] = "data",
+    ):
+        """
+        Inicializa a paginação.
+
+        Args:
+            page_param: Parâmetro da query com o número da página ou o offset
+            size_param: Parâmetro da query com o tamanho da página (None para
+                não enviar)
+            page_size: Itens por página. Uma página menor encerra a listagem;
+                se None, a listagem termina na primeira página vazia
+            start: Primeira página (modo "page") ou primeiro offset (modo "offset")
+            mode: "page" para numeração de páginas ou "offset" para deslocamento
+                em itens
+            items_key: Chave da resposta com a lista de itens (None se a
+                resposta já for a lista)
+        """
+        if mode not in (PAGE, OFFSET):
+            raise ValueError(f"Modo de paginação inválido: {mode}")
+
+        self.page_param = page_param
+        self.size_param = size_param
+        self.page_size = page_size
+        self.start = start
+        self.mode = mode
+        self.items_key = items_key
+
+    def url(self, url: str, position: int) -> str:
+        """
+        Monta a URL de uma página, preservando os demais parâmetros da query.
+
+        Args:
+            url: URL da listagem
+            position: Número da página ou offset
+        Returns:
+            URL da página
+        """
+        params: Dict[str, Any] = {self.page_param: position}
+        if self.size_param and self.page_size:
+            params[self.size_param] = self.page_size
+        return with_params(url, params)
+
+    def items(self, page: Any) -> List[Any]:
+        """
+        Extrai os itens de uma página.
+
+        Args:
+            page: Resposta da API
+        Returns:
+            Itens da página
+        Raises:
+            PaginationError: Se a resposta não trouxer a lista de itens, como
+                as respostas de erro devolvidas pelo cliente
+        """
+        items = page
+        if self.items_key is not None and isinstance(page, dict):
+            items = page.get(self.items_key)
+        if not isinstance(items, list):
+            raise PaginationError(page)
+        return items
+
+    def next(self, position: int, items: List[Any]) -> Optional[int]:
+        """
+        Calcula a posição da próxima página.
+
+        Args:
+            position: Número da página ou offset atual
+            items: Itens da página atual
+        Returns:
+            Próxima posição, ou None se a listagem terminou
+        """
+        if not items or (self.page_size and len(items) < self.page_size):
+            return None
+        if self.mode == OFFSET:
+            return position + len(items)
+        return position + 1
+
+
+def with_params(url: str, params: Dict[str, Any]) -> str:
+    """
+    Substitui ou acrescenta parâmetros na query da URL.
+
+    Os demais parâmetros são mantidos na ordem, inclusive os repetidos
+    (status=a&status=b).
+
+    Args:
+        url: URL original
+        params: Parâmetros a definir; cada um substitui todas as ocorrências
+            do mesmo nome
+    Returns:
+        URL com a query atualizada
+    """
+    parts = urlsplit(url)
+    query = []
+    pending = dict(params)
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key not in params:
+            query.append((key, value))
+        elif key in pending:
+            # Primeira ocorrência mantém a posição; as demais são descartadas
+            query.append((key, pending.pop(key)))
+    query.extend(pending.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
@@ -0,0 +1,89 @@
+"""
+Arquivos locais do pacote.
+
+Os arquivos de estado (cache de tokens, checkpoints) ficam no diretório de
+cache do usuário, nunca no diretório temporário compartilhado: lá qualquer
+usuário do nó poderia criar o arquivo antes, ou um link com o mesmo nome.
+"""
+
+import os
+import stat
+
+_APP_DIR = "pacote-api-oauth"
+
+
+def cache_dir() -> str:
+    """
+    Retorna o diretório de cache do usuário para o pacote, criando-o se preciso.
+
+    Usa $XDG_CACHE_HOME/pacote-api-oauth ou ~/.cache/pacote-api-oauth.
+
+    Returns:
+        Caminho absoluto do diretório, com permissão 0700
+    Raises:
+        PermissionError: Se o diretório pertencer a outro usuário
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return private_dir(os.path.join(os.path.abspath(base), _APP_DIR))
+
+
+def private_dir(path: str) -> str:
+    """
+    Cria o diretório acessível só ao usuário atual, ou valida o existente.
+
+    Args:
+        path: Caminho do diretório
+    Returns:
+        Caminho absoluto do diretório
+    Raises:
+        PermissionError: Se o caminho for um link, não for diretório ou
+            pertencer a outro usuário
+    """
+    path = os.path.abspath(path)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or not _owned(st):
+        raise PermissionError(f"Diretório não pertence ao usuário atual: {path}")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def open_private_file(path: str, flags: int = os.O_RDWR) -> int:
+    """
+    Abre (criando com permissão 0600) um arquivo acessível só ao usuário atual.
+
+    Não segue links simbólicos e recusa arquivos já existentes de outro
+    usuário ou legíveis por outros: O_CREAT não altera a permissão de um
+    arquivo que já existe.
+
+    Args:
+        path: Caminho do arquivo
+        flags: Modo de abertura (os.O_*), sem O_CREAT
+    Returns:
+        Descritor do arquivo aberto
+    Raises:
+        PermissionError: Se o arquivo não for regular, pertencer a outro
+            usuário ou tiver permissão diferente de 0600
+        OSError: Se o caminho for um link simbólico (ELOOP)
+    """
+    fd = os.open(path, flags | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        st = os.fstat(fd)
+        if (
+            not stat.S_ISREG(st.st_mode)
+            or not _owned(st)
+            or (hasattr(os, "getuid") and stat.S_IMODE(st.st_mode) != 0o600)
+        ):
+            raise PermissionError(
+                f"Arquivo deve pertencer ao usuário atual com permissão 0600: {path}"
+            )
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _owned(st: os.stat_result) -> bool:
+    # Windows não tem uid: a proteção fica a cargo das ACLs do perfil do usuário
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
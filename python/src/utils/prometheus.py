@@ -0,0 +1,229 @@
+"""
+Métricas no formato de exposição de texto do Prometheus.
+
+PrometheusMetrics guarda contadores e histogramas em memória e os expõe
+em /metrics por um servidor HTTP próprio, sem dependências externas.
+"""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import Instrumentation
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Histogram:
+    """Contagens por bucket, soma e total de um histograma."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Stage:
+    """Medição de uma etapa, registrada no histograma stage_seconds."""
+
+    __slots__ = ("_metrics", "_labels", "_start")
+
+    def __init__(self, metrics: "PrometheusMetrics", labels: Dict[str, str]):
+        self._metrics = metrics
+        self._labels = labels
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        labels = self._labels
+        if exc_type is not None:
+            labels = {**labels, "error": exc_type.__name__}
+        self._metrics.observe("stage_seconds", time.perf_counter() - self._start, **labels)
+
+
+class PrometheusMetrics(Instrumentation):
+    """Instrumentação que acumula métricas para o Prometheus."""
+
+    def __init__(
+        self,
+        namespace: str = "pacote_api",
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """
+        Inicializa o registro de métricas.
+
+        Args:
+            namespace: Prefixo dos nomes das métricas
+            buckets: Limites superiores dos buckets dos histogramas, em ordem
+        """
+        self._namespace = namespace
+        self._buckets = tuple(buckets)
+        self._counters: Dict[_Key, float] = {}
+        self._histograms: Dict[_Key, _Histogram] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def stage(self, name: str, id: Optional[str] = None, **labels: str) -> _Stage:
+        """
+        Mede a duração de uma etapa no histograma stage_seconds.
+
+        Args:
+            name: Nome da etapa (label stage)
+            id: Identificador da loja (ignorado: alta cardinalidade)
+            **labels: Labels adicionais
+        Returns:
+            Context manager da medição
+        """
+        return _Stage(self, {"stage": name, **labels})
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """
+        Incrementa um contador.
+
+        Args:
+            name: Nome do contador (terminado em _total)
+            value: Incremento
+            **labels: Labels do contador
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Registra um valor em um histograma.
+
+        Args:
+            name: Nome do histograma
+            value: Valor observado
+            **labels: Labels do histograma
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self._buckets))
+            for index, bound in enumerate(self._buckets):
+                if value <= bound:
+                    histogram.counts[index] += 1
+                    break
+            histogram.sum += value
+            histogram.count += 1
+
+    def render(self) -> str:
+        """
+        Gera a exposição de texto (formato 0.0.4) de todas as métricas.
+
+        Returns:
+            Texto no formato do Prometheus
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                (key, (list(h.counts), h.sum, h.count)) for key, h in self._histograms.items()
+            )
+
+        lines: List[str] = []
+        declared = set()
+        for (name, labels), value in counters:
+            full_name = f"{self._namespace}_{name}"
+            if full_name not in declared:
+                declared.add(full_name)
+                lines.append(f"# TYPE {full_name} counter")
+            lines.append(f"{full_name}{_labels(labels)} {_number(value)}")
+
+        for (name, labels), (counts, total, count) in histograms:
+            full_name = f"{self._namespace}_{name}"
+            if full_name not in declared:
+                declared.add(full_name)
+                lines.append(f"# TYPE {full_name} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets, counts, strict=True):
+                cumulative += bucket_count
+                le = labels + (("le", _number(bound)),)
+                lines.append(f"{full_name}_bucket{_labels(le)} {cumulative}")
+            lines.append(f'{full_name}_bucket{_labels(labels + (("le", "+Inf"),))} {count}')
+            lines.append(f"{full_name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{full_name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, addr: str = "127.0.0.1") -> None:
+        """
+        Expõe as métricas em http://addr:port/metrics, em uma thread.
+
+        Args:
+            port: Porta do servidor
+            addr: Endereço de escuta
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((addr, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="prometheus-metrics", daemon=True
+        ).start()
+
+    def close(self) -> None:
+        """Encerra o servidor de métricas, se iniciado."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    value = float(value)
+    # Valores especiais na grafia do formato de exposição; int() falharia neles
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value) if value != int(value) else str(int(value))
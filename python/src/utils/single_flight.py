@@ -0,0 +1,120 @@
+"""
+Coalescência de chamadas concorrentes (single-flight).
+
+Quando várias chamadas pedem o mesmo trabalho para a mesma chave ao mesmo
+tempo, apenas a primeira executa; as demais aguardam e recebem o mesmo
+resultado (ou a mesma exceção).
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+# asyncio só é necessário em do_async, já dentro de um event loop
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Execução em andamento para uma chave."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Executa no máximo uma chamada por chave ao mesmo tempo."""
+
+    def __init__(self) -> None:
+        """Inicializa o controle de chamadas em andamento."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Executa fn uma única vez para as chamadas concorrentes da chave.
+
+        Args:
+            key: Chave que identifica o trabalho
+            fn: Função executada pela primeira chamada
+
+        Returns:
+            Resultado de fn, compartilhado entre todas as chamadas
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Versão asyncio de do: coalesce as corrotinas do mesmo event loop.
+
+        Args:
+            key: Chave que identifica o trabalho
+            fn: Função que cria a corrotina executada pela primeira chamada
+
+        Returns:
+            Resultado da corrotina, compartilhado entre todas as chamadas
+        """
+        import asyncio
+
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(loop_key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[loop_key] = task
+                task.add_done_callback(lambda _: self._discard_task(loop_key))
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        # shield: o cancelamento de um waiter não cancela o trabalho dos demais
+        return await asyncio.shield(task)
+
+    def _discard_task(self, loop_key: Tuple[int, str]) -> None:
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Retorna contadores de execução.
+
+        Returns:
+            Dicionário com execuções reais, chamadas coalescidas e em andamento
+        """
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
@@ -0,0 +1,80 @@
+"""
+Conversão da validade dos tokens para epoch.
+
+Substitui o pandas.to_datetime no caminho das requisições: cobre os
+formatos de validade usados pelas APIs (ISO-8601, com ou sem fuso, data
+com barras e epoch numérico) usando apenas a biblioteca padrão.
+
+As validades já gravadas mantêm o significado que tinham com o pandas:
+datas com barras são lidas com o mês primeiro (05/03/2024 é 3 de maio) e
+só com o dia primeiro quando o primeiro campo passa de 12 (25/03/2024).
+Epochs numéricos em nanossegundos, como os do pandas, também são aceitos.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+# Formatos aceitos além do ISO-8601 (datetime.fromisoformat), na ordem em
+# que o pandas.to_datetime os tentava: mês primeiro, depois dia primeiro
+_FORMATOS = (
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+)
+
+
+def validade_to_epoch(validade: Any) -> Optional[float]:
+    """
+    Converte a validade do token em epoch (segundos).
+
+    Datas sem fuso horário são interpretadas no horário local, como
+    datetime.now(). Números são epoch em segundos, milissegundos,
+    microssegundos ou nanossegundos, conforme a magnitude. Aqui o
+    pandas.to_datetime divergia: lia todo número como nanossegundos, o que
+    dava como vencido qualquer epoch em segundos.
+
+    Args:
+        validade: Validade como string, datetime ou número (epoch)
+    Returns:
+        Epoch em segundos, ou None se vazia ou em formato desconhecido
+    """
+    if not validade:
+        return None
+    if isinstance(validade, str):
+        return _parse_texto(validade)
+    if isinstance(validade, datetime):
+        return validade.timestamp()
+    if isinstance(validade, (int, float)):
+        return _epoch_numerico(float(validade))
+    return _parse_texto(str(validade))
+
+
+@lru_cache(maxsize=4096)
+def _parse_texto(validade: str) -> Optional[float]:
+    # Cache: a mesma validade é consultada a cada uso do token até ser renovada
+    texto = validade.strip()
+    try:
+        return datetime.fromisoformat(texto).timestamp()
+    except ValueError:
+        pass
+    for formato in _FORMATOS:
+        try:
+            return datetime.strptime(texto, formato).timestamp()
+        except ValueError:
+            continue
+    try:
+        return _epoch_numerico(float(texto))
+    except ValueError:
+        return None
+
+
+def _epoch_numerico(valor: float) -> float:
+    # Cada unidade cobre de 1973 a 5138: acima disso, o valor está na unidade menor
+    for divisor in (1e9, 1e6, 1e3):
+        if abs(valor) >= divisor * 1e8:
+            return valor / divisor
+    return valor
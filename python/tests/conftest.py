@@ -0,0 +1,44 @@
+"""
+Fixtures compartilhadas dos testes.
+
+Os testes de cliente usam o servidor simulado dos benchmarks
+(benchmarks/mock_server.py) em uma porta local livre.
+"""
+
+from typing import Iterator, Optional
+
+import pytest
+from mock_server import MockApiServer, MockConfig
+
+
+class FixedTokenManager:
+    """Gerenciador de tokens mínimo: o servidor simulado não valida o token."""
+
+    def __init__(self) -> None:
+        self.refreshes = 0
+
+    def get_access_token(self, id: str) -> str:
+        return "token-teste"
+
+    def force_refreshing_token(self, id: str, stale_token: Optional[str] = None) -> str:
+        self.refreshes += 1
+        return "token-teste"
+
+    async def get_access_token_async(self, id: str) -> str:
+        return self.get_access_token(id)
+
+    async def force_refreshing_token_async(
+        self, id: str, stale_token: Optional[str] = None
+    ) -> str:
+        return self.force_refreshing_token(id, stale_token)
+
+
+@pytest.fixture
+def token_manager() -> FixedTokenManager:
+    return FixedTokenManager()
+
+
+@pytest.fixture
+def server() -> Iterator[MockApiServer]:
+    with MockApiServer(MockConfig(check_tokens=False)) as mock:
+        yield mock
@@ -0,0 +1,84 @@
+"""Testes do AsyncClient."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.clients.async_client import AsyncClient
+from src.services.rate_limiter import RateLimitedError, RateLimiter
+from src.services.retry_policy import RetryPolicy
+
+
+def test_gives_up_when_retry_after_exceeds_max_elapsed(server, token_manager):
+    server.config.p429 = 1.0
+    server.config.retry_after = 3600
+
+    async def run():
+        client = AsyncClient(
+            token_manager,
+            max_retries=3,
+            retry_delay=0,
+            rate_limiter=RateLimiter(),
+            retry_policy=RetryPolicy(max_attempts=3, max_elapsed=60),
+        )
+        async with client:
+            result = await client.get(f"{server.url}/api/itens", "loja")
+            return result, client.get_retry_stats()
+
+    started = time.monotonic()
+    result, stats = asyncio.run(run())
+
+    assert time.monotonic() - started < 5
+    assert result == {"error": {"type": "TOO_MANY_REQUESTS"}}
+    assert stats["gave_up"] == {"max_elapsed": 1}
+
+
+def test_stream_holds_concurrency_slot_until_body_is_read(server, token_manager):
+    async def run():
+        async with AsyncClient(token_manager, max_retries=1, retry_delay=0) as client:
+            items = client.stream_items(f"{server.url}/api/itens?total=3", "loja")
+            first = await items.__anext__()
+            held = client._in_flight
+            rest = [item async for item in items]
+            return first, rest, held, client._in_flight
+
+    first, rest, held, after = asyncio.run(run())
+
+    assert len([first, *rest]) == 3
+    assert held == 1
+    assert after == 0
+
+
+def test_abandoned_stream_releases_concurrency_slot(server, token_manager):
+    async def run():
+        async with AsyncClient(token_manager, max_retries=1, retry_delay=0) as client:
+            items = client.stream_items(f"{server.url}/api/itens?total=3", "loja")
+            await items.__anext__()
+            await items.aclose()
+            return client._in_flight, client._tenant_semaphores
+
+    assert asyncio.run(run()) == (0, {})
+
+
+def test_fails_fast_when_stored_retry_after_exceeds_max_elapsed(server, token_manager):
+    limiter = RateLimiter()
+    limiter.observe("loja", 429, {}, 3600)
+
+    async def run():
+        client = AsyncClient(
+            token_manager,
+            max_retries=3,
+            retry_delay=0,
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(max_attempts=3, max_elapsed=60),
+        )
+        async with client:
+            await client.get(f"{server.url}/api/itens", "loja")
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitedError):
+        asyncio.run(run())
+
+    assert time.monotonic() - started < 5
+    assert server.get_stats()["connections"] == 0
@@ -0,0 +1,127 @@
+"""Testes do Client.map e da FairQueue."""
+
+import random
+import threading
+import time
+
+import pytest
+import requests
+
+from src.clients.batch import BatchRequest, FairQueue
+from src.clients.client import Client
+from src.clients.transport import RequestsTransport
+
+
+def _push(queue, ids):
+    for index, id in enumerate(ids):
+        queue.push(index, BatchRequest(f"http://api/{index}", id))
+
+
+def _drain(queue):
+    order = []
+    while queue:
+        index, request = queue.pop()
+        queue.release(request.id)
+        order.append(request.id)
+    return order
+
+
+def test_fair_queue_alternates_between_tenants():
+    queue = FairQueue()
+    _push(queue, ["a", "a", "a", "a", "b", "c", "b"])
+
+    assert _drain(queue) == ["a", "b", "c", "a", "b", "a", "a"]
+
+
+def test_fair_queue_skips_tenants_without_free_slot():
+    queue = FairQueue(max_per_tenant=1)
+    _push(queue, ["a", "a", "b"])
+
+    first = queue.pop()
+    second = queue.pop()
+
+    assert (first[1].id, second[1].id) == ("a", "b")
+    assert queue.pop() is None
+    queue.release("a")
+    assert queue.pop()[1].id == "a"
+
+
+def test_fair_queue_batches_same_url_of_one_tenant():
+    queue = FairQueue()
+    for index, url in enumerate(["http://api/x", "http://api/x", "http://api/y"]):
+        queue.push(index, BatchRequest(url, "a", "POST", {"n": index}))
+
+    assert [index for index, _ in queue.pop_batch(10)] == [0, 1]
+    assert [index for index, _ in queue.pop_batch(10)] == [2]
+
+
+def test_batch_request_rejects_other_methods():
+    with pytest.raises(ValueError):
+        BatchRequest("http://api/x", "a", "DELETE")
+
+
+class EchoTransport(RequestsTransport):
+    """Transporte que devolve a URL pedida após uma latência aleatória."""
+
+    def __init__(self, latency=0.02):
+        super().__init__()
+        self.latency = latency
+        self.order = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers, data=None, timeout=None, stream=False):
+        with self._lock:
+            self.order.append(url)
+        if "erro" in url:
+            raise ValueError(f"falha simulada em {url}")
+        time.sleep(random.uniform(0, self.latency))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"url": "{url}"}}'.encode()
+        return response
+
+
+def _client(token_manager, transport):
+    return Client(token_manager, max_retries=1, retry_delay=0, transport=transport)
+
+
+def test_map_returns_results_in_request_order(token_manager):
+    urls = [f"http://api/{i}" for i in range(20)]
+    with _client(token_manager, EchoTransport()) as client:
+        results = list(client.map([(url, f"loja-{i % 3}") for i, url in enumerate(urls)]))
+
+    assert [result.index for result in results] == list(range(20))
+    assert [result.response["url"] for result in results] == urls
+    assert all(result.ok for result in results)
+
+
+def test_map_unordered_returns_every_result(token_manager):
+    with _client(token_manager, EchoTransport()) as client:
+        results = list(
+            client.map([(f"http://api/{i}", "loja") for i in range(10)], ordered=False)
+        )
+
+    assert sorted(result.index for result in results) == list(range(10))
+
+
+def test_map_reports_errors_per_request(token_manager):
+    specs = [("http://api/0", "loja"), ("http://api/erro", "loja"), ("http://api/2", "loja")]
+    with _client(token_manager, EchoTransport()) as client:
+        results = list(client.map(specs))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+
+        with pytest.raises(ValueError):
+            list(client.map(specs, return_exceptions=False))
+
+
+def test_map_does_not_let_a_large_tenant_starve_the_others(token_manager):
+    transport = EchoTransport(latency=0)
+    specs = [(f"http://api/grande/{i}", "grande") for i in range(10)]
+    specs.append(("http://api/pequena", "pequena"))
+    with _client(token_manager, transport) as client:
+        list(client.map(specs, max_workers=1))
+
+    # Com uma única vaga, a loja pequena entra no segundo turno do rodízio
+    assert transport.order.index("http://api/pequena") == 1
@@ -0,0 +1,128 @@
+"""Testes do CircuitBreaker e de sua integração com os clientes."""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+from src.clients.async_client import AsyncClient
+from src.clients.client import Client
+from src.clients.transport import RequestsTransport
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def _half_open_breaker():
+    """Circuito da loja aberto e já liberado para uma requisição de teste."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure("loja")
+    return breaker
+
+
+class CorruptOnceTransport(RequestsTransport):
+    """Transporte cujo primeiro corpo lido não pode ser decodificado."""
+
+    def __init__(self):
+        super().__init__()
+        self.corrupt = True
+
+    def _read_body(self, response):
+        if self.corrupt:
+            self.corrupt = False
+            raise ValueError("corpo gzip corrompido")
+        super()._read_body(response)
+
+
+def test_opens_after_threshold_and_rejects():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure("loja")
+    breaker.before_request("loja")
+    breaker.record_failure("loja")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("loja")
+    assert breaker.get_state("loja") == "open"
+    assert breaker.get_stats()["rejected"] == 1
+
+
+def test_half_open_allows_one_probe_and_closes_on_success():
+    breaker = _half_open_breaker()
+    breaker.before_request("loja")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("loja")
+    breaker.record_success("loja")
+    assert breaker.get_state("loja") == "closed"
+
+
+def test_client_releases_probe_slot_when_body_is_corrupt(server, token_manager):
+    breaker = _half_open_breaker()
+    client = Client(
+        token_manager,
+        max_retries=1,
+        retry_delay=0,
+        circuit_breaker=breaker,
+        transport=CorruptOnceTransport(),
+    )
+    with client:
+        with pytest.raises(ValueError):
+            client.get(f"{server.url}/api/itens?total=1", "loja")
+
+        assert client.get(f"{server.url}/api/itens?total=1", "loja")["data"]
+    assert breaker.get_state("loja") == "closed"
+
+
+def test_client_releases_probe_slot_on_invalid_url(server, token_manager):
+    breaker = _half_open_breaker()
+    with Client(token_manager, max_retries=1, retry_delay=0, circuit_breaker=breaker) as client:
+        with pytest.raises(requests.exceptions.InvalidURL):
+            client.get("http://", "loja")
+
+        assert client.get(f"{server.url}/api/itens?total=1", "loja")["data"]
+
+
+def test_client_records_failure_when_stream_is_cut(server, token_manager):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+
+    class CutStreamTransport(RequestsTransport):
+        def iter_raw(self, response, chunk_size):
+            yield b'{"data": [1, '
+            raise requests.exceptions.ChunkedEncodingError("conexão interrompida")
+
+    client = Client(
+        token_manager,
+        max_retries=1,
+        retry_delay=0,
+        circuit_breaker=breaker,
+        transport=CutStreamTransport(),
+    )
+    with client:
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            list(client.stream_items(f"{server.url}/api/itens?total=1", "loja"))
+
+    assert breaker.get_state("loja") == "open"
+
+
+def test_async_client_releases_probe_slot_when_body_is_corrupt(token_manager):
+    breaker = _half_open_breaker()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(
+                200, headers={"Content-Encoding": "gzip"}, content=b"nao e gzip"
+            )
+        return httpx.Response(200, json={"data": [1]})
+
+    async def run():
+        client = AsyncClient(token_manager, max_retries=1, retry_delay=0, circuit_breaker=breaker)
+        await client._http.aclose()
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            with pytest.raises(httpx.DecodingError):
+                await client.get("http://api.teste/itens", "loja")
+            return await client.get("http://api.teste/itens", "loja")
+
+    assert asyncio.run(run()) == {"data": [1]}
+    assert breaker.get_state("loja") == "closed"
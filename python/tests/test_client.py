@@ -0,0 +1,77 @@
+"""Testes do Client."""
+
+import time
+
+import pytest
+
+from src.clients.client import Client
+from src.services.rate_limiter import RateLimitedError, RateLimiter
+from src.services.retry_policy import RetryPolicy
+
+
+def test_reuses_pooled_connection(server, token_manager):
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        for _ in range(5):
+            assert len(client.get(f"{server.url}/api/itens?total=3", "loja")["data"]) == 3
+        stats = client.get_pool_stats()
+
+    assert server.get_stats()["connections"] == 1
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+
+
+def test_without_keep_alive_opens_a_connection_per_request(server, token_manager):
+    with Client(token_manager, max_retries=1, retry_delay=0, keep_alive=False) as client:
+        for _ in range(3):
+            client.get(f"{server.url}/api/itens?total=1", "loja")
+
+    assert server.get_stats()["connections"] == 3
+
+
+def test_close_releases_pool(server, token_manager):
+    client = Client(token_manager, max_retries=1, retry_delay=0)
+    client.get(f"{server.url}/api/itens?total=1", "loja")
+    client.close()
+
+    assert client.get_pool_stats()["open_connections"] == 0
+
+
+def test_gives_up_when_retry_after_exceeds_max_elapsed(server, token_manager):
+    server.config.p429 = 1.0
+    server.config.retry_after = 3600
+    client = Client(
+        token_manager,
+        max_retries=3,
+        retry_delay=0,
+        rate_limiter=RateLimiter(),
+        retry_policy=RetryPolicy(max_attempts=3, max_elapsed=60),
+    )
+    with client:
+        started = time.monotonic()
+        result = client.get(f"{server.url}/api/itens", "loja")
+
+        assert time.monotonic() - started < 5
+        assert result == {"error": {"type": "TOO_MANY_REQUESTS"}}
+        assert client.get_retry_stats()["gave_up"] == {"max_elapsed": 1}
+
+
+def test_fails_fast_when_stored_retry_after_exceeds_max_elapsed(server, token_manager):
+    limiter = RateLimiter()
+    limiter.observe("loja", 429, {}, 3600)
+    client = Client(
+        token_manager,
+        max_retries=3,
+        retry_delay=0,
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(max_attempts=3, max_elapsed=60),
+    )
+    with client:
+        started = time.monotonic()
+        with pytest.raises(RateLimitedError) as exc_info:
+            client.get(f"{server.url}/api/itens", "loja")
+
+        assert time.monotonic() - started < 5
+        assert exc_info.value.retry_in > 60
+        assert client.get_retry_stats()["gave_up"] == {"max_elapsed": 1}
+    assert server.get_stats()["connections"] == 0
@@ -0,0 +1,103 @@
+"""Testes da compressão dos corpos e do transporte HTTP/1.1."""
+
+import gzip
+import zlib
+
+import pytest
+import requests
+from cryptography.fernet import Fernet
+from urllib3.exceptions import ProtocolError
+
+from src.clients.client import Client
+from src.clients.transport import RequestsTransport
+from src.factories.factory import Factory
+from src.utils.compression import StreamDecoder, compress
+
+CORPO = b'{"data": [' + b",".join(b'{"id": %d}' % i for i in range(500)) + b"]}"
+
+
+def _decode(encoding, body, chunk=64):
+    decoder = StreamDecoder(encoding)
+    parts = [decoder.decompress(body[i : i + chunk]) for i in range(0, len(body), chunk)]
+    return b"".join(parts) + decoder.flush()
+
+
+@pytest.mark.parametrize(
+    "encoding, body",
+    [
+        ("gzip", gzip.compress(CORPO)),
+        ("gzip", gzip.compress(CORPO[:100]) + gzip.compress(CORPO[100:])),
+        ("deflate", zlib.compress(CORPO)),
+        ("deflate", zlib.compress(CORPO)[2:-4]),
+        ("identity", CORPO),
+    ],
+)
+def test_stream_decoder_decodes_in_chunks(encoding, body):
+    assert _decode(encoding, body) == CORPO
+
+
+def test_stream_decoder_rejects_corrupt_body():
+    with pytest.raises(ValueError):
+        _decode("gzip", b"nao e gzip")
+
+
+def test_compress_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        compress(CORPO, "zstd")
+    with pytest.raises(ValueError):
+        Client(object(), max_retries=1, retry_delay=0, request_compression="zstd")
+
+
+def test_post_is_compressed_and_counted(server, token_manager):
+    client = Client(
+        token_manager,
+        max_retries=1,
+        retry_delay=0,
+        request_compression="gzip",
+        compression_min_size=0,
+        accept_encoding="identity",
+    )
+    with client:
+        data = {"itens": list(range(1000))}
+        assert client.post(f"{server.url}/api/itens", data, "loja") == {"data": data}
+        stats = client.get_transfer_stats()
+
+    assert stats["requests_compressed"] == 1
+    assert stats["request_wire_bytes"] < stats["request_bytes"]
+
+
+def test_iter_raw_keeps_the_original_error_as_cause():
+    class Raw:
+        def stream(self, chunk_size, decode_content):
+            yield b"{"
+            raise ProtocolError("conexão encerrada")
+
+    response = requests.Response()
+    response.raw = Raw()
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError) as error:
+        list(RequestsTransport().iter_raw(response, 1024))
+    assert isinstance(error.value.__cause__, ProtocolError)
+
+
+@pytest.mark.parametrize("accept_encoding, compressed", [(None, True), ("identity", False)])
+def test_accept_encoding_controls_response_compression(
+    server, token_manager, accept_encoding, compressed
+):
+    server.config.compress_responses = True
+    with Client(
+        token_manager, max_retries=1, retry_delay=0, accept_encoding=accept_encoding
+    ) as client:
+        client.get(f"{server.url}/api/itens?total=200", "loja")
+        stats = client.get_transfer_stats()
+
+    assert (stats["response_wire_bytes"] < stats["response_bytes"]) is compressed
+
+
+def test_factory_passes_accept_encoding_to_client(monkeypatch):
+    monkeypatch.setenv("CHAVE_CRIPTOGRAFIA", Fernet.generate_key().decode())
+    client = Factory().create_client(accept_encoding="identity")
+    try:
+        assert client._accept_encoding == "identity"
+    finally:
+        client.close()
@@ -0,0 +1,72 @@
+"""Testes do EncryptionService."""
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from src.services.encryption_service import EncryptionService
+
+
+@pytest.fixture(autouse=True)
+def chave(monkeypatch):
+    monkeypatch.setenv("CHAVE_CRIPTOGRAFIA", Fernet.generate_key().decode())
+
+
+@pytest.mark.parametrize("batch_threshold", [1000, 2])
+def test_batch_round_trip_keeps_order(batch_threshold):
+    service = EncryptionService(batch_workers=2, batch_threshold=batch_threshold)
+    data = [f"segredo-{i}" for i in range(10)] + [""]
+    try:
+        encrypted = service.encrypt_many(data)
+
+        # Valores vazios passam sem criptografia, nos dois sentidos
+        assert encrypted[-1] == b""
+        assert service.decrypt_many(encrypted) == data[:-1] + [b""]
+        assert [service.decrypt(item) for item in encrypted[:-1]] == data[:-1]
+    finally:
+        service.close()
+
+
+def test_decrypt_cache_hits_skip_decryption():
+    service = EncryptionService(cache_size=10)
+    encrypted = service.encrypt("segredo")
+
+    assert service.decrypt(encrypted) == "segredo"
+    assert service.decrypt(encrypted) == "segredo"
+    stats = service.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_decrypt_many_uses_cache_and_decrypts_repeated_items_once():
+    service = EncryptionService(cache_size=10)
+    a, b = service.encrypt_many(["a", "b"])
+    service.decrypt(a)
+
+    assert service.decrypt_many([a, b, b, b""]) == ["a", "b", "b", b""]
+    stats = service.get_cache_stats()
+    # a veio do cache; b foi descriptografado uma vez e guardado
+    assert (stats["hits"], stats["size"]) == (1, 2)
+    assert service.decrypt_many([b]) == ["b"]
+    assert service.get_cache_stats()["hits"] == 2
+
+
+def test_cache_is_bounded():
+    service = EncryptionService(cache_size=2)
+    encrypted = service.encrypt_many(["a", "b", "c"])
+
+    service.decrypt_many(encrypted)
+
+    assert service.get_cache_stats()["size"] == 2
+    service.clear_cache()
+    assert service.get_cache_stats()["size"] == 0
+
+
+def test_invalid_token_raises():
+    service = EncryptionService(cache_size=10)
+
+    with pytest.raises(InvalidToken):
+        service.decrypt_many([b"nao-criptografado"])
+
+
+def test_invalid_batch_executor():
+    with pytest.raises(ValueError):
+        EncryptionService(batch_executor="gpu")
@@ -0,0 +1,56 @@
+"""Testes do Http2Transport."""
+
+from urllib.parse import quote
+
+import pytest
+from mock_h2_server import MockHttp2Server
+
+from src.clients.client import Client
+from src.clients.http2_transport import Http2Transport
+from src.clients.transport import RequestsTransport
+
+
+@pytest.fixture
+def h2_server():
+    with MockHttp2Server() as server:
+        yield server
+
+
+def _client(token_manager, transport):
+    return Client(token_manager, max_retries=1, retry_delay=0, transport=transport)
+
+
+def test_concurrent_requests_share_one_http2_connection(h2_server, token_manager):
+    transport = Http2Transport(prior_knowledge=True)
+    specs = [(f"{h2_server.url}/api/itens?total=5", f"loja-{i % 4}") for i in range(40)]
+    with _client(token_manager, transport) as client:
+        results = list(client.map(specs, max_workers=8))
+        stats = client.get_pool_stats()
+
+    assert all(result.ok and len(result.response["data"]) == 5 for result in results)
+    assert stats["requests"] == 40
+    assert stats["http2_connections"] == 1
+    assert h2_server.get_stats()["connections"] == 1
+
+
+def test_error_status_is_returned_as_body(h2_server, token_manager):
+    with _client(token_manager, Http2Transport(prior_knowledge=True)) as client:
+        assert client.get(f"{h2_server.url}/api/inexistente", "loja") == {"error": "not found"}
+
+
+def test_stream_items_over_http2(h2_server, token_manager):
+    with _client(token_manager, Http2Transport(prior_knowledge=True)) as client:
+        url = f"{h2_server.url}/api/itens?total=250&limite=250"
+        items = list(client.stream_items(url, "loja"))
+
+    assert len(items) == 250
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Http2Transport])
+def test_follows_redirects_like_the_http1_transport(server, token_manager, transport):
+    url = f"{server.url}/api/redirecionar?para={quote('/api/itens?total=2')}"
+    with _client(token_manager, transport()) as client:
+        result = client.get(url, "loja")
+
+    assert len(result["data"]) == 2
+    assert server.get_stats()["302"] == 1
@@ -0,0 +1,40 @@
+"""
+Orçamento de tempo de importação, medido em interpretadores novos.
+
+Usa os orçamentos de benchmarks/bench_import.py. Em máquinas lentas, a
+variável IMPORT_BUDGET_SCALE multiplica os limites de tempo.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+from bench_import import ORCAMENTOS, RAIZ, medir, proibidos_carregados
+
+SCALE = float(os.environ.get("IMPORT_BUDGET_SCALE", "1.0"))
+
+
+@pytest.mark.parametrize("module", list(ORCAMENTOS))
+def test_import_stays_within_budget(module):
+    budget, forbidden = ORCAMENTOS[module]
+    runs = [medir(module) for _ in range(3)]
+
+    assert proibidos_carregados(runs[0]["modulos"], forbidden) == []
+    assert statistics.median(run["ms"] for run in runs) <= budget * SCALE
+
+
+def test_package_attributes_do_not_load_the_client():
+    code = (
+        "import json, sys; sys.path.insert(0, sys.argv[1]); "
+        "import src, src.factories, src.services; "
+        "src.Factory, src.factories.Factory, src.services.TokenManager; "
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code, str(RAIZ)], capture_output=True, text=True, check=True
+    )
+
+    assert proibidos_carregados(json.loads(output.stdout), ("src.clients", "requests")) == []
@@ -0,0 +1,120 @@
+"""Testes da IncrementalSync e do CheckpointRepository."""
+
+import os
+
+import pytest
+
+from src.clients.client import Client
+from src.factories.factory import Factory
+from src.repositories.checkpoint_repository import CheckpointRepository, default_path
+from src.services.incremental_sync import CURSOR, IncrementalSync, SyncError, SyncResource
+from src.utils.pagination import Pagination
+
+
+class PagesClient:
+    """Cliente falso que devolve as páginas em ordem e grava as URLs pedidas."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.urls = []
+
+    def get(self, url, id, headers=None):
+        self.urls.append(url)
+        return self.pages.pop(0)
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    return CheckpointRepository(str(tmp_path / "checkpoints.sqlite3"))
+
+
+def test_incremental_run_reads_only_changes(server, token_manager, checkpoints):
+    url = f"{server.url}/api/alteracoes?total=250"
+    resource = SyncResource("itens", url, since_param="desde", updated_field="alterado_em")
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        sync = IncrementalSync(client, checkpoints)
+        assert sum(1 for _ in sync.iter_items("loja", resource)) == 250
+
+        server.change([3, 7, 200])
+        changed = [item["id"] for item in sync.iter_items("loja", resource)]
+        assert changed == [3, 7, 200]
+        assert list(sync.iter_items("loja", resource)) == []
+
+
+def test_interrupted_run_resumes_from_saved_page(server, token_manager, checkpoints):
+    url = f"{server.url}/api/alteracoes?total=250"
+    resource = SyncResource("itens", url, since_param="desde", updated_field="alterado_em")
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        sync = IncrementalSync(client, checkpoints)
+        pages = sync.iter_pages("loja", resource)
+        next(pages)
+        next(pages)
+        pages.close()
+
+        resumed = [item["id"] for item in sync.iter_items("loja", resource)]
+
+    assert resumed == list(range(100, 250))
+
+
+@pytest.mark.parametrize(
+    "values, latest",
+    [
+        # Como texto, "Z" vem depois de ".5+00:00"
+        (["2024-05-01T10:00:00.5+00:00", "2024-05-01T10:00:00Z"], "2024-05-01T10:00:00.5+00:00"),
+        # Como texto, 10:30Z vem depois de 08:00-03:00 (11:00 UTC)
+        (["2024-05-01T08:00:00-03:00", "2024-05-01T10:30:00Z"], "2024-05-01T08:00:00-03:00"),
+        ([5, 40, 7], 40),
+    ],
+)
+def test_high_water_compares_instants_not_text(checkpoints, values, latest):
+    client = PagesClient([{"data": [{"id": n, "updated_at": v} for n, v in enumerate(values)]}])
+    sync = IncrementalSync(client, checkpoints)
+    resource = SyncResource("itens", "http://api/itens")
+
+    list(sync.iter_items("loja", resource))
+
+    assert sync.get_checkpoint("loja", resource)["cursor"] == latest
+
+
+def test_query_keeps_repeated_params(checkpoints):
+    client = PagesClient([{"data": []}, {"data": [], "next_cursor": None}])
+    checkpoints.save("loja", "itens", {"cursor": "2024-01-01T00:00:00Z"})
+    checkpoints.save("loja", "pedidos", {"cursor": "abc"})
+    sync = IncrementalSync(client, checkpoints)
+
+    list(sync.iter_items("loja", SyncResource("itens", "http://api/itens?s=a&s=b")))
+    list(sync.iter_items("loja", SyncResource("pedidos", "http://api/p?s=a&s=b", mode=CURSOR)))
+
+    assert client.urls == [
+        "http://api/itens?s=a&s=b&updated_since=2024-01-01T00%3A00%3A00Z&pagina=1&limite=100",
+        "http://api/p?s=a&s=b&cursor=abc&limite=100",
+    ]
+
+
+def test_error_page_raises_and_keeps_checkpoint(checkpoints):
+    client = PagesClient([{"data": [{"id": 1}] * 2}, {"error": {"type": "unavailable"}}])
+    sync = IncrementalSync(client, checkpoints)
+    resource = SyncResource("itens", "http://api/itens", pagination=Pagination(page_size=2))
+
+    with pytest.raises(SyncError):
+        list(sync.iter_items("loja", resource))
+    assert sync.get_checkpoint("loja", resource)["position"] == 2
+
+
+def test_default_checkpoint_path_is_absolute_in_user_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+
+    assert default_path() == str(tmp_path / "cache" / "pacote-api-oauth" / "sync.sqlite3")
+    repository = CheckpointRepository("relativo.sqlite3")
+    os.chdir("/")
+    repository.save("loja", "itens", {"cursor": 1})
+    assert (tmp_path / "relativo.sqlite3").exists()
+
+
+def test_factory_reset_drops_checkpoint_repository(tmp_path):
+    factory = Factory()
+    first = factory.create_checkpoint_repository(str(tmp_path / "a.sqlite3"))
+    factory.reset()
+
+    assert factory.create_checkpoint_repository(str(tmp_path / "b.sqlite3")) is not first
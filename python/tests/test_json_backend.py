@@ -0,0 +1,53 @@
+"""Testes do backend de JSON."""
+
+import json
+
+import pytest
+
+from src.utils import json_backend
+from src.utils.json_backend import dumps, loads, set_json_backend
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(
+            json_backend._import_orjson() is None, reason="orjson não instalado"
+        ),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = json_backend.get_json_backend()
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def test_round_trip(backend):
+    obj = {"nome": "pão", "itens": [1, 2.5, None, True]}
+
+    assert loads(dumps(obj)) == obj
+    assert loads(memoryview(dumps(obj))) == obj
+    assert dumps(obj) == json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def test_accepts_what_the_standard_json_accepts(backend):
+    class Codigo(int):
+        pass
+
+    assert dumps({1: "a", 2: "b"}) == b'{"1":"a","2":"b"}'
+    assert dumps({"n": 2**70}) == b'{"n":1180591620717411303424}'
+    assert dumps({"c": Codigo(7)}) == b'{"c":7}'
+
+
+def test_rejects_unserializable_objects(backend):
+    with pytest.raises(TypeError):
+        dumps({"a": object()})
+
+
+def test_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
@@ -0,0 +1,13 @@
+"""Testes da linha de comando."""
+
+import pytest
+
+from main import main
+
+
+def test_rejects_unknown_log_level(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(["modulo:funcao", "--log-level", "verboso"])
+
+    assert exc_info.value.code == 2
+    assert "--log-level" in capsys.readouterr().err
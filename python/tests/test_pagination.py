@@ -0,0 +1,70 @@
+"""Testes da paginação e dos iteradores de páginas dos clientes."""
+
+import asyncio
+
+import pytest
+
+from src.clients.async_client import AsyncClient
+from src.clients.client import Client
+from src.utils.pagination import OFFSET, Pagination, PaginationError, with_params
+
+
+def test_url_keeps_repeated_params_and_replaces_page():
+    pagination = Pagination(page_size=50)
+
+    url = pagination.url("http://api/itens?status=a&pagina=9&status=b&limite=1", 2)
+
+    assert url == "http://api/itens?status=a&pagina=2&status=b&limite=50"
+
+
+def test_with_params_replaces_every_occurrence_once():
+    url = with_params("http://api/x?a=1&b=2&a=3", {"a": "novo", "c": "4"})
+
+    assert url == "http://api/x?a=novo&b=2&c=4"
+
+
+def test_items_rejects_error_responses():
+    pagination = Pagination()
+
+    assert pagination.items({"data": [1, 2]}) == [1, 2]
+    assert pagination.items({"data": []}) == []
+    with pytest.raises(PaginationError) as error:
+        pagination.items({"error": {"type": "unavailable"}})
+    assert error.value.page == {"error": {"type": "unavailable"}}
+
+
+def test_next_stops_on_short_page_and_advances_offsets():
+    assert Pagination(page_size=2).next(1, [1, 2]) == 2
+    assert Pagination(page_size=2).next(1, [1]) is None
+    assert Pagination(mode=OFFSET, start=0, page_size=2).next(4, [1, 2]) == 6
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_items_reads_every_page(server, token_manager, prefetch):
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        items = list(
+            client.iter_items(
+                f"{server.url}/api/itens?total=250", "loja", prefetch=prefetch
+            )
+        )
+
+    assert [item["id"] for item in items] == list(range(250))
+
+
+def test_iter_items_raises_on_error_page(server, token_manager):
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        items = client.iter_items(f"{server.url}/api/itens?total=250", "loja")
+        assert next(items)["id"] == 0
+        server.config.p503 = 1.0
+
+        with pytest.raises(PaginationError):
+            list(items)
+
+
+def test_async_iter_items_raises_on_error_page(server, token_manager):
+    async def run():
+        async with AsyncClient(token_manager, max_retries=1, retry_delay=0) as client:
+            return [item async for item in client.iter_items(f"{server.url}/nada", "loja")]
+
+    with pytest.raises(PaginationError):
+        asyncio.run(run())
@@ -0,0 +1,79 @@
+"""Testes do PrometheusMetrics."""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.utils.prometheus import PrometheusMetrics
+
+
+def test_renders_counters_with_escaped_labels():
+    metrics = PrometheusMetrics(namespace="teste")
+    metrics.increment("requests_total", status="200")
+    metrics.increment("requests_total", 2, status="200")
+    metrics.increment("requests_total", 0.5, status='5"x\\')
+
+    assert metrics.render() == (
+        "# TYPE teste_requests_total counter\n"
+        'teste_requests_total{status="200"} 3\n'
+        'teste_requests_total{status="5\\"x\\\\"} 0.5\n'
+    )
+
+
+def test_renders_cumulative_histogram_buckets():
+    metrics = PrometheusMetrics(namespace="teste", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        metrics.observe("latency_seconds", value)
+
+    assert metrics.render() == (
+        "# TYPE teste_latency_seconds histogram\n"
+        'teste_latency_seconds_bucket{le="0.1"} 1\n'
+        'teste_latency_seconds_bucket{le="1"} 3\n'
+        'teste_latency_seconds_bucket{le="+Inf"} 4\n'
+        "teste_latency_seconds_sum 4.05\n"
+        "teste_latency_seconds_count 4\n"
+    )
+
+
+def test_stage_records_duration_and_error_label():
+    metrics = PrometheusMetrics(namespace="teste", buckets=(60.0,))
+    with metrics.stage("http", "loja", method="GET"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.stage("http", "loja", method="GET"):
+            raise ValueError()
+
+    text = metrics.render()
+    assert 'teste_stage_seconds_count{method="GET",stage="http"} 1' in text
+    assert 'teste_stage_seconds_count{error="ValueError",method="GET",stage="http"} 1' in text
+    assert "loja" not in text
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(float("inf"), "+Inf"), (float("-inf"), "-Inf"), (float("nan"), "NaN")],
+)
+def test_special_values_use_exposition_spelling(value, expected):
+    metrics = PrometheusMetrics(namespace="teste", buckets=(1.0,))
+    metrics.increment("valor_total", value)
+    metrics.observe("valor", value)
+
+    text = metrics.render()
+    assert f"teste_valor_total {expected}\n" in text
+    assert f"teste_valor_sum {expected}\n" in text
+
+
+def test_serves_metrics_endpoint():
+    metrics = PrometheusMetrics(namespace="teste")
+    metrics.increment("requests_total")
+    metrics.serve(port=0)
+    try:
+        port = metrics._server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert response.read().decode() == metrics.render()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/outro")
+    finally:
+        metrics.close()
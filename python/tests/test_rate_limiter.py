@@ -0,0 +1,34 @@
+"""Testes do RateLimiter."""
+
+from src.services.rate_limiter import RateLimiter
+
+
+def test_keeps_at_most_max_tenants_least_recently_used_out():
+    limiter = RateLimiter(max_tenants=2)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("a")
+    limiter.acquire("c")
+
+    assert set(limiter.get_budgets()) == {"a", "c"}
+
+
+def test_get_wait_reports_retry_after_without_reserving():
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.observe("loja", 429, {}, retry_after=120)
+
+    wait = limiter.get_wait("loja")
+
+    assert 119 < wait <= 121
+    assert limiter.get_wait("loja") <= wait
+    assert limiter.get_wait("outra") == 0.0
+    assert "outra" not in limiter.get_budgets()
+
+
+def test_429_reduces_rate_and_success_recovers_it():
+    limiter = RateLimiter(rate=10, burst=5, increase_step=1)
+    limiter.observe("loja", 429, {})
+    assert limiter.get_budget("loja")["rate"] == 5
+
+    limiter.observe("loja", 200, {})
+    assert limiter.get_budget("loja")["rate"] == 6
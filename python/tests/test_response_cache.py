@@ -0,0 +1,132 @@
+"""Testes do ResponseCache."""
+
+import time
+
+import pytest
+import requests
+
+from src.clients.client import Client
+from src.clients.transport import RequestsTransport
+from src.services.response_cache import ResponseCache
+
+KEY = ResponseCache.key("loja", "http://api/categorias")
+
+
+def test_serves_until_ttl_expires():
+    cache = ResponseCache(ttl=0.05)
+    cache.put(KEY, {"data": [1]}, {})
+
+    assert cache.get(KEY) == ({"data": [1]}, None)
+    time.sleep(0.06)
+    assert cache.get(KEY) == (None, None)
+    assert cache.get_stats()["size"] == 0
+
+
+def test_smaller_max_age_wins():
+    cache = ResponseCache(ttl=60)
+    cache.put(KEY, {"data": [1]}, {"Cache-Control": "public, max-age=0", "ETag": '"v1"'})
+
+    assert cache.get(KEY) == (None, '"v1"')
+
+
+def test_no_store_is_not_kept():
+    cache = ResponseCache()
+    cache.put(KEY, {"data": [1]}, {"Cache-Control": "no-store", "ETag": '"v1"'})
+
+    assert cache.get(KEY) == (None, None)
+
+
+@pytest.mark.parametrize("directive", ["no-cache", "private", "Private, max-age=300"])
+def test_no_cache_and_private_are_kept_only_for_revalidation(directive):
+    cache = ResponseCache(ttl=60)
+    cache.put(KEY, {"data": [1]}, {"Cache-Control": directive, "ETag": '"v1"'})
+
+    assert cache.get(KEY) == (None, '"v1"')
+    assert cache.revalidate(KEY) == {"data": [1]}
+    # Revalidada, continua exigindo nova consulta à API
+    assert cache.get(KEY) == (None, '"v1"')
+
+
+def test_no_cache_without_etag_is_not_kept():
+    cache = ResponseCache(ttl=60)
+    cache.put(KEY, {"data": [1]}, {"Cache-Control": "no-cache"})
+
+    assert cache.get_stats()["size"] == 0
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    for name in ("a", "b"):
+        cache.put(name, name, {})
+    cache.get("a")
+    cache.put("c", "c", {})
+
+    assert cache.get("b") == (None, None)
+    assert cache.get("a") == ("a", None)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_invalidate_by_tenant():
+    cache = ResponseCache()
+    cache.put(ResponseCache.key("a", "http://api/x"), 1, {})
+    cache.put(ResponseCache.key("b", "http://api/x"), 2, {})
+
+    cache.invalidate("a")
+
+    assert cache.get(ResponseCache.key("a", "http://api/x")) == (None, None)
+    assert cache.get(ResponseCache.key("b", "http://api/x")) == (2, None)
+
+
+class EtagTransport(RequestsTransport):
+    """Transporte que responde com ETag e 304 quando o If-None-Match confere."""
+
+    def __init__(self, cache_control):
+        super().__init__()
+        self.cache_control = cache_control
+        self.requests = []
+
+    def request(self, method, url, headers, data=None, timeout=None, stream=False):
+        self.requests.append(headers.get("If-None-Match"))
+        response = requests.Response()
+        response.headers.update({"ETag": '"v1"', "Cache-Control": self.cache_control})
+        if headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = b'{"data": [1, 2]}'
+        return response
+
+
+@pytest.mark.parametrize("cache_control", ["no-cache", "max-age=0"])
+def test_client_revalidates_with_etag(token_manager, cache_control):
+    transport = EtagTransport(cache_control)
+    client = Client(
+        token_manager,
+        max_retries=1,
+        retry_delay=0,
+        transport=transport,
+        response_cache=ResponseCache(ttl=60),
+    )
+    with client:
+        first = client.get("http://api/categorias", "loja")
+        second = client.get("http://api/categorias", "loja")
+
+        assert first == second == {"data": [1, 2]}
+        assert transport.requests == [None, '"v1"']
+        assert client.get_response_cache_stats()["revalidated"] == 1
+
+
+def test_client_serves_fresh_response_without_request(token_manager):
+    transport = EtagTransport("max-age=60")
+    with Client(
+        token_manager,
+        max_retries=1,
+        retry_delay=0,
+        transport=transport,
+        response_cache=ResponseCache(ttl=60),
+    ) as client:
+        client.get("http://api/categorias", "loja")
+        client.get("http://api/categorias", "loja")
+
+    assert transport.requests == [None]
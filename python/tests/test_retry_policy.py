@@ -0,0 +1,99 @@
+"""Testes da RetryPolicy, do RetryBudget e de tratamento_de_resposta."""
+
+import requests
+
+from src.clients.client import Client
+from src.clients.transport import RequestsTransport
+from src.services.retry_policy import RetryBudget, RetryPolicy
+from src.services.tratamento_de_resposta import tratamento_de_resposta
+
+
+def _response(status, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+def test_control_dict_leaves_retry_decision_to_policy():
+    result = tratamento_de_resposta(_response(503, headers={"Retry-After": "2"}))
+
+    assert result == {"refresh_token": False, "retry_after": 2.0, "response": {}}
+    assert RetryPolicy().should_retry(503, result)
+    assert not RetryPolicy(retry_statuses={429}).should_retry(503, result)
+
+
+def test_non_idempotent_methods_only_retried_when_not_processed():
+    result = tratamento_de_resposta(_response(502))
+
+    assert RetryPolicy().should_retry(502, result, "GET")
+    assert RetryPolicy().should_retry(502, result, "PUT")
+    assert not RetryPolicy().should_retry(502, result, "POST")
+    assert not RetryPolicy().should_retry(504, result, "POST")
+    assert RetryPolicy().should_retry(503, result, "POST")
+    assert RetryPolicy().should_retry(429, result, "POST")
+
+
+def test_401_always_retried_after_refresh():
+    result = tratamento_de_resposta(_response(401))
+
+    assert result["refresh_token"]
+    assert RetryPolicy(retry_statuses=()).should_retry(401, result)
+
+
+def test_status_policy_overrides_attempts():
+    policy = RetryPolicy(max_attempts=2, status_policies={503: RetryPolicy(max_attempts=5)})
+
+    assert policy.for_status(503).max_attempts == 5
+    assert policy.for_status(502) is policy
+
+
+def test_delay_uses_retry_after_or_jittered_backoff():
+    policy = RetryPolicy(base_delay=1, max_delay=3, multiplier=2)
+
+    assert policy.delay(1, retry_after=7) == 7
+    assert all(0 <= policy.delay(5) <= 3 for _ in range(100))
+
+
+def test_budget_limits_retries_to_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    for _ in range(4):
+        budget.record_request()
+
+    allowed = sum(budget.try_retry(503, 0.0) for _ in range(10))
+
+    assert allowed == 3
+    assert budget.get_stats()["gave_up"] == {"budget": 7}
+
+
+def test_client_retries_503_up_to_max_attempts(server, token_manager):
+    server.config.p503 = 1.0
+    with Client(token_manager, max_retries=3, retry_delay=0) as client:
+        result = client.get(f"{server.url}/api/itens", "loja")
+
+    assert result == {"error": {"type": "unavailable"}}
+    assert server.get_stats()["503"] == 3
+
+
+class StatusTransport(RequestsTransport):
+    """Transporte que responde sempre com o mesmo status, sem rede."""
+
+    def __init__(self, status):
+        super().__init__()
+        self.status = status
+        self.calls = []
+
+    def request(self, method, url, headers, data=None, timeout=None, stream=False):
+        self.calls.append(method)
+        return _response(self.status, b'{"error": {"type": "gateway"}}')
+
+
+def test_post_is_not_repeated_after_502(token_manager):
+    transport = StatusTransport(502)
+    with Client(token_manager, max_retries=3, retry_delay=0, transport=transport) as client:
+        result = client.post("http://api/pedidos", {"id": 1}, "loja")
+        client.get("http://api/pedidos", "loja")
+
+    assert result == {"error": {"type": "gateway"}}
+    assert transport.calls == ["POST", "GET", "GET", "GET"]
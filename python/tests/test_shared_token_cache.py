@@ -0,0 +1,69 @@
+"""Testes do SharedTokenCache."""
+
+import os
+import stat
+import time
+
+import pytest
+
+from src.services.shared_token_cache import SharedTokenCache, default_path
+
+CRED = {"access_token": "a", "refresh_token": "r", "validade": ""}
+
+
+def _mode(path):
+    return stat.S_IMODE(os.lstat(path).st_mode)
+
+
+def test_default_path_is_private_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    cache = SharedTokenCache()
+    cache.set("loja", CRED, time.time() + 60)
+
+    path = default_path()
+    assert path == str(tmp_path / "cache" / "pacote-api-oauth" / "tokens.sqlite3")
+    assert _mode(os.path.dirname(path)) == 0o700
+    assert _mode(path) == 0o600
+    assert cache.get("loja") == CRED
+
+
+def test_shared_between_instances(tmp_path):
+    path = str(tmp_path / "tokens.sqlite3")
+    SharedTokenCache(path).set("loja", CRED, time.time() + 60)
+
+    assert SharedTokenCache(path).get("loja") == CRED
+
+
+def test_rejects_existing_file_readable_by_others(tmp_path):
+    path = tmp_path / "tokens.sqlite3"
+    path.touch()
+    path.chmod(0o644)
+
+    with pytest.raises(PermissionError):
+        SharedTokenCache(str(path))
+
+
+def test_rejects_symlink(tmp_path):
+    target = tmp_path / "alvo"
+    target.touch()
+    target.chmod(0o600)
+    link = tmp_path / "tokens.sqlite3"
+    link.symlink_to(target)
+
+    with pytest.raises(OSError):
+        SharedTokenCache(str(link))
+
+
+def test_open_lock_dir_is_tightened(tmp_path):
+    path = tmp_path / "tokens.sqlite3"
+    locks = tmp_path / "tokens.sqlite3.locks"
+    locks.mkdir(mode=0o755)
+    locks.chmod(0o755)
+
+    cache = SharedTokenCache(str(path))
+    with cache.refresh_lock("loja"):
+        pass
+
+    assert _mode(locks) == 0o700
+    assert all(_mode(lock) == 0o600 for lock in locks.iterdir())
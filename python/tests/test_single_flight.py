@@ -0,0 +1,101 @@
+"""Testes do SingleFlight."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+THREADS = 16
+
+
+def _concurrently(fn):
+    barrier = threading.Barrier(THREADS)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(call) for _ in range(THREADS)]
+    return futures
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return "resultado"
+
+    futures = _concurrently(lambda: flight.do("loja", work))
+
+    assert [f.result() for f in futures] == ["resultado"] * THREADS
+    assert len(calls) == 1
+    assert flight.get_stats() == {
+        "executions": 1,
+        "coalesced": THREADS - 1,
+        "in_flight": 0,
+    }
+
+
+def test_error_is_shared_and_next_call_runs_again():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise RuntimeError("falha simulada")
+
+    futures = _concurrently(lambda: flight.do("loja", fail))
+
+    assert all(isinstance(f.exception(), RuntimeError) for f in futures)
+    assert flight.get_stats()["executions"] == 1
+    assert flight.do("loja", lambda: "ok") == "ok"
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flight = SingleFlight()
+
+    assert flight.do("a", lambda: flight.do("b", lambda: "b")) == "b"
+    assert flight.get_stats()["coalesced"] == 0
+
+
+def test_async_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "resultado"
+
+    async def run():
+        return await asyncio.gather(*(flight.do_async("loja", work) for _ in range(10)))
+
+    assert asyncio.run(run()) == ["resultado"] * 10
+    assert len(calls) == 1
+    assert flight.get_stats()["in_flight"] == 0
+
+
+def test_cancelled_async_waiter_does_not_cancel_the_others():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "resultado"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do_async("loja", work))
+        second = asyncio.ensure_future(flight.do_async("loja", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "resultado"
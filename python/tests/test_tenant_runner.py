@@ -0,0 +1,104 @@
+"""Testes do TenantRunner."""
+
+import os
+import time
+
+import pytest
+
+from src.services.tenant_runner import TenantRunner
+
+
+class Contexto:
+    """Contexto mínimo do worker, sem factory nem cliente."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def close(self):
+        pass
+
+
+def job(context, id):
+    if id == "sai":
+        raise SystemExit(3)
+    if id == "cai":
+        os._exit(3)
+    if id == "trava":
+        time.sleep(60)
+    return 1
+
+
+def _runner(**options):
+    options.setdefault("workers", 1)
+    return TenantRunner(job, context_factory=Contexto, report_interval=60, **options)
+
+
+def test_system_exit_in_job_is_reported_as_failure():
+    with _runner() as runner:
+        stats = runner.run(["a", "sai", "b"])
+
+    assert stats["completed"] == 2
+    assert stats["failed"] == 1
+    assert "SystemExit" in stats["errors"]["sai"]
+    assert stats["restarts"] == 0
+
+
+def test_tenant_that_kills_its_worker_fails_after_max_attempts():
+    with _runner(max_attempts=2, max_restarts=3) as runner:
+        stats = runner.run(["a", "cai", "b"])
+
+    assert stats["completed"] == 2
+    assert list(stats["errors"]) == ["cai"]
+    assert "caiu" in stats["errors"]["cai"]
+    assert stats["restarts"] == 2
+
+
+def test_job_over_timeout_fails_and_worker_is_restarted():
+    # O reinício por tempo máximo não consome o limite de reinícios
+    with _runner(threads=2, job_timeout=0.5, max_restarts=0) as runner:
+        started = time.monotonic()
+        stats = runner.run(["trava", "a"])
+        assert time.monotonic() - started < 20
+
+        assert stats["completed"] == 1
+        assert "tempo máximo" in stats["errors"]["trava"]
+        assert stats["restarts"] == 1
+        assert runner._workers[0].process.is_alive()
+        # O worker reiniciado atende a rodada seguinte
+        assert runner.run(["b"])["completed"] == 1
+
+
+def test_tenants_fail_cleanly_when_every_worker_is_retired():
+    with _runner(max_restarts=0, max_attempts=2) as runner:
+        stats = runner.run(["cai", "a"])
+
+        assert stats["completed"] == 0
+        assert stats["errors"] == {
+            "cai": "nenhum worker disponível",
+            "a": "nenhum worker disponível",
+        }
+        # O worker retirado volta na rodada seguinte
+        assert runner.run(["b"])["completed"] == 1
+
+
+def test_retired_workers_and_restart_budget_return_each_round():
+    with _runner(workers=2, max_restarts=1, max_attempts=1) as runner:
+        for _ in range(3):
+            stats = runner.run(["cai", "a", "b"])
+
+            assert stats["completed"] == 2
+            assert list(stats["errors"]) == ["cai"]
+            assert stats["restarts"] == 1
+
+
+def test_invalid_job_timeout():
+    with pytest.raises(ValueError):
+        _runner(job_timeout=0)
+
+
+def test_tenant_always_goes_to_the_same_worker():
+    ids = [f"loja-{i}" for i in range(50)]
+    first, second = _runner(workers=4), _runner(workers=4)
+
+    assert [first.worker_for(id) for id in ids] == [second.worker_for(id) for id in ids]
+    assert len({first.worker_for(id) for id in ids}) == 4
@@ -0,0 +1,82 @@
+"""Testes do TokenCache."""
+
+import time
+
+from src.services.token_cache import TokenCache
+
+
+def _cred(token):
+    return {"access_token": token, "refresh_token": "r", "validade": ""}
+
+
+def test_evicts_least_recently_used():
+    cache = TokenCache(max_size=2)
+    cache.set("a", _cred("a"))
+    cache.set("b", _cred("b"))
+    cache.get("a")
+    cache.set("c", _cred("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == _cred("a")
+    assert cache.get("c") == _cred("c")
+    stats = cache.get_stats()
+    assert (stats["size"], stats["evictions"], stats["expirations"]) == (2, 1, 0)
+
+
+def test_peek_does_not_change_lru_order():
+    cache = TokenCache(max_size=2)
+    cache.set("a", _cred("a"))
+    cache.set("b", _cred("b"))
+    cache.peek("a")
+    cache.set("c", _cred("c"))
+
+    assert cache.peek("a") is None
+    assert cache.get_stats()["hits"] == 0
+
+
+def test_entry_expires_at_its_validade():
+    cache = TokenCache()
+    cache.set("a", _cred("a"), time.time() + 0.05)
+    cache.set("b", _cred("b"), time.time() + 60)
+
+    assert cache.get("a") == _cred("a")
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get("b") == _cred("b")
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (2, 1, 1)
+
+
+def test_default_ttl_applies_to_entries_without_validade():
+    cache = TokenCache(default_ttl=0.05)
+    cache.set("a", _cred("a"))
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_without_default_ttl_entries_leave_only_by_lru():
+    cache = TokenCache()
+    cache.set("a", _cred("a"))
+
+    assert cache.purge_expired() == 0
+    assert cache.get("a") == _cred("a")
+
+
+def test_purge_expired_removes_only_expired_entries():
+    cache = TokenCache()
+    cache.set("a", _cred("a"), time.time() - 1)
+    cache.set("b", _cred("b"), time.time() - 1)
+    cache.set("c", _cred("c"), time.time() + 60)
+
+    assert cache.purge_expired() == 2
+    assert len(cache) == 1
+
+
+def test_lru_eviction_of_expired_entry_counts_as_expiration():
+    cache = TokenCache(max_size=1)
+    cache.set("a", _cred("a"), time.time() - 1)
+    cache.set("b", _cred("b"))
+
+    stats = cache.get_stats()
+    assert (stats["evictions"], stats["expirations"]) == (0, 1)
@@ -0,0 +1,176 @@
+"""Testes do TokenManager."""
+
+import asyncio
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.token_manager import TokenManager
+
+VENCIDO = "2000-01-01T00:00:00+00:00"
+VALIDO = "2999-01-01T00:00:00+00:00"
+
+
+class MemoryRepository:
+    """Repositório de credenciais em memória."""
+
+    def __init__(self, credentials, fail_saves=False):
+        self.credentials = credentials
+        self.fail_saves = fail_saves
+        self.saves = []
+
+    def get_credentials(self, id):
+        return dict(self.credentials[id])
+
+    def get_credentials_many(self, ids):
+        return {id: dict(self.credentials[id]) for id in ids if id in self.credentials}
+
+    def save_token(self, id, token):
+        self.save_tokens({id: token})
+
+    def save_tokens(self, tokens):
+        if self.fail_saves:
+            raise OSError("falha simulada na gravação")
+        self.saves.append(dict(tokens))
+        for id, token in tokens.items():
+            self.credentials[id].update(token)
+
+
+def _manager(repository):
+    manager = TokenManager(repository)
+    counter = itertools.count(1)
+    manager.refresh_token = lambda id, cred: {
+        "access_token": f"novo-{id}-{next(counter)}",
+        "refresh_token": "r",
+        "validade": VALIDO,
+    }
+    return manager
+
+
+def test_prefetch_refreshes_expired_tokens_in_one_write():
+    repository = MemoryRepository(
+        {
+            "a": {"access_token": "velho-a", "refresh_token": "r", "validade": VENCIDO},
+            "b": {"access_token": "velho-b", "refresh_token": "r", "validade": VENCIDO},
+            "c": {"access_token": "atual-c", "refresh_token": "r", "validade": VALIDO},
+        }
+    )
+    manager = _manager(repository)
+
+    stats = manager.prefetch(["a", "b", "c"])
+
+    assert stats == {"requested": 3, "cached": 0, "loaded": 3, "refreshed": 2, "failed": 0}
+    assert len(repository.saves) == 1
+    assert set(repository.saves[0]) == {"a", "b"}
+    assert manager.get_access_token("a") == repository.credentials["a"]["access_token"]
+    assert manager.get_access_token("c") == "atual-c"
+
+
+def test_prefetch_does_not_cache_tokens_that_failed_to_persist():
+    repository = MemoryRepository(
+        {"a": {"access_token": "velho-a", "refresh_token": "r", "validade": VENCIDO}},
+        fail_saves=True,
+    )
+    manager = _manager(repository)
+
+    with pytest.raises(OSError):
+        manager.prefetch(["a"])
+
+    assert manager._token_cache.peek("a") is None
+
+
+def test_refresh_failure_on_save_leaves_cache_untouched():
+    repository = MemoryRepository(
+        {"a": {"access_token": "velho-a", "refresh_token": "r", "validade": VENCIDO}},
+        fail_saves=True,
+    )
+    manager = _manager(repository)
+
+    with pytest.raises(OSError):
+        manager.get_access_token("a")
+
+    assert manager._token_cache.peek("a") is None
+
+
+def test_async_cache_hit_is_answered_without_a_thread(monkeypatch):
+    repository = MemoryRepository(
+        {"a": {"access_token": "atual-a", "refresh_token": "r", "validade": VALIDO}}
+    )
+    manager = _manager(repository)
+
+    async def no_thread(*args, **kwargs):
+        raise AssertionError("acerto do cache não deve usar thread")
+
+    async def run():
+        # A falta vai para uma thread; o acerto seguinte fica no event loop
+        first = await manager.get_access_token_async("a")
+        monkeypatch.setattr(asyncio, "to_thread", no_thread)
+        return first, await manager.get_access_token_async("a")
+
+    assert asyncio.run(run()) == ("atual-a", "atual-a")
+    stats = manager.get_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_concurrent_forced_refreshes_run_once():
+    repository = MemoryRepository(
+        {"a": {"access_token": "velho-a", "refresh_token": "r", "validade": VALIDO}}
+    )
+    manager = TokenManager(repository)
+    refreshes = []
+
+    def refresh_token(id, cred):
+        refreshes.append(id)
+        time.sleep(0.1)
+        return {"access_token": "novo-a", "refresh_token": "r", "validade": VALIDO}
+
+    manager.refresh_token = refresh_token
+    barrier = threading.Barrier(16)
+
+    def force():
+        barrier.wait()
+        return manager.force_refreshing_token("a", stale_token="velho-a")
+
+    with ThreadPoolExecutor(16) as executor:
+        tokens = list(executor.map(lambda _: force(), range(16)))
+
+    assert tokens == ["novo-a"] * 16
+    assert refreshes == ["a"]
+    assert len(repository.saves) == 1
+    assert manager.get_refresh_stats()["refreshes"] == 1
+
+
+def test_cached_token_expires_with_its_validade():
+    validade = (datetime.now(timezone.utc) + timedelta(seconds=1)).isoformat()
+    repository = MemoryRepository(
+        {"a": {"access_token": "curto-a", "refresh_token": "r", "validade": validade}}
+    )
+    manager = _manager(repository)
+
+    assert manager.get_access_token("a") == "curto-a"
+    assert manager._token_cache.peek("a") is not None
+    time.sleep(1.1)
+
+    assert manager.get_access_token("a").startswith("novo-a")
+
+
+def test_write_behind_saves_refreshed_token_off_the_request_path():
+    repository = MemoryRepository(
+        {"a": {"access_token": "velho-a", "refresh_token": "r", "validade": VENCIDO}}
+    )
+    manager = TokenManager(repository, write_behind=True, write_behind_interval=60)
+    manager.refresh_token = lambda id, cred: {
+        "access_token": "novo-a",
+        "refresh_token": "r",
+        "validade": VALIDO,
+    }
+
+    assert manager.get_access_token("a") == "novo-a"
+    assert repository.saves == []
+
+    manager.close()
+    assert repository.saves == [{"a": manager.refresh_token("a", {})}]
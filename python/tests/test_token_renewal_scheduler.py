@@ -0,0 +1,77 @@
+"""Testes do TokenRenewalScheduler."""
+
+import threading
+import time
+
+from src.services.token_renewal_scheduler import TokenRenewalScheduler
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condição não atingida"
+        time.sleep(0.01)
+
+
+def test_renews_before_expiry_and_forgets_the_old_validity():
+    renewed = threading.Event()
+
+    def renew(id):
+        renewed.set()
+        return True
+
+    scheduler = TokenRenewalScheduler(renew, margin=0, jitter=0)
+    try:
+        scheduler.schedule("loja", time.time() + 0.1)
+        assert renewed.wait(2)
+        _wait_for(lambda: scheduler.get_stats()["renewals"] == 1)
+        assert scheduler.get_stats()["scheduled"] == 0
+        assert scheduler._expires_at == {}
+    finally:
+        scheduler.stop(1)
+
+
+def test_entry_without_token_is_skipped_not_counted_as_renewal():
+    scheduler = TokenRenewalScheduler(lambda id: False, margin=0, jitter=0)
+    try:
+        scheduler.schedule("loja", time.time() + 0.1)
+        _wait_for(lambda: scheduler.get_stats()["skipped"] == 1)
+        assert scheduler.get_stats()["renewals"] == 0
+        assert scheduler._expires_at == {}
+    finally:
+        scheduler.stop(1)
+
+
+def test_failed_renewal_is_retried_until_it_succeeds():
+    calls = []
+
+    def renew(id):
+        calls.append(id)
+        if len(calls) == 1:
+            raise RuntimeError("falha simulada")
+        return True
+
+    # Renovação na metade da vida (0,2s), nova tentativa bem antes da validade
+    scheduler = TokenRenewalScheduler(renew, margin=1, jitter=0, retry_interval=0.05)
+    try:
+        scheduler.schedule("loja", time.time() + 0.4)
+        _wait_for(lambda: scheduler.get_stats()["renewals"] == 1)
+        assert scheduler.get_stats()["failures"] == 1
+        assert calls == ["loja", "loja"]
+        assert scheduler._expires_at == {}
+    finally:
+        scheduler.stop(1)
+
+
+def test_cancel_removes_schedule():
+    calls = []
+    scheduler = TokenRenewalScheduler(calls.append, margin=0, jitter=0)
+    try:
+        scheduler.schedule("loja", time.time() + 0.1)
+        scheduler.cancel("loja")
+        time.sleep(0.15)
+        assert calls == []
+        assert scheduler.get_stats()["scheduled"] == 0
+        assert scheduler._expires_at == {}
+    finally:
+        scheduler.stop(1)
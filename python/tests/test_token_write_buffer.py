@@ -0,0 +1,104 @@
+"""Testes do TokenWriteBuffer."""
+
+import threading
+import time
+
+import pytest
+
+from src.services.token_write_buffer import TokenWriteBuffer
+
+
+class RecordingRepository:
+    """Repositório que registra cada gravação em lote."""
+
+    def __init__(self, failures=0):
+        self.saves = []
+        self.failures = failures
+        self.saved = threading.Event()
+
+    def save_tokens(self, tokens):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("falha simulada na gravação")
+        self.saves.append(dict(tokens))
+        self.saved.set()
+
+
+def _token(value):
+    return {"access_token": value, "refresh_token": "r", "validade": ""}
+
+
+def test_flushes_when_max_pending_is_reached():
+    repository = RecordingRepository()
+    buffer = TokenWriteBuffer(repository, flush_interval=60, max_pending=3)
+    try:
+        buffer.put("a", _token("a"))
+        buffer.put("b", _token("b"))
+        assert not repository.saved.wait(0.1)
+
+        buffer.put("c", _token("c"))
+        assert repository.saved.wait(2)
+        assert repository.saves == [{"a": _token("a"), "b": _token("b"), "c": _token("c")}]
+    finally:
+        buffer.close()
+
+
+def test_flushes_after_interval():
+    repository = RecordingRepository()
+    buffer = TokenWriteBuffer(repository, flush_interval=0.05, max_pending=100)
+    try:
+        buffer.put("a", _token("a"))
+
+        assert repository.saved.wait(2)
+        assert repository.saves == [{"a": _token("a")}]
+        assert buffer.get("a") is None
+    finally:
+        buffer.close()
+
+
+def test_close_writes_pending_tokens_and_later_puts_go_straight_through():
+    repository = RecordingRepository()
+    buffer = TokenWriteBuffer(repository, flush_interval=60, max_pending=100)
+    buffer.put("a", _token("a"))
+
+    buffer.close()
+    assert repository.saves == [{"a": _token("a")}]
+
+    buffer.put("b", _token("b"))
+    assert repository.saves[-1] == {"b": _token("b")}
+
+
+def test_keeps_only_latest_token_per_store():
+    repository = RecordingRepository()
+    buffer = TokenWriteBuffer(repository, flush_interval=60, max_pending=100)
+    buffer.put("a", _token("a1"))
+    buffer.put("a", _token("a2"))
+
+    assert buffer.get("a") == _token("a2")
+    buffer.close()
+    assert repository.saves == [{"a": _token("a2")}]
+    assert buffer.get_stats()["coalesced"] == 1
+
+
+def test_failed_flush_keeps_batch_without_overwriting_newer_tokens():
+    repository = RecordingRepository(failures=1)
+    buffer = TokenWriteBuffer(repository, flush_interval=60, max_pending=100)
+    buffer.put("a", _token("a1"))
+
+    with pytest.raises(OSError):
+        buffer.flush()
+    buffer.put("a", _token("a2"))
+    buffer.close()
+
+    assert repository.saves == [{"a": _token("a2")}]
+    stats = buffer.get_stats()
+    assert (stats["failures"], stats["written"], stats["pending"]) == (1, 1, 0)
+
+
+def test_close_does_not_wait_for_interval():
+    buffer = TokenWriteBuffer(RecordingRepository(), flush_interval=60)
+    started = time.monotonic()
+
+    buffer.close()
+
+    assert time.monotonic() - started < 2
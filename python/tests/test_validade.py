@@ -0,0 +1,55 @@
+"""Testes da conversão da validade dos tokens."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.validade import validade_to_epoch
+
+# 2024-05-03 10:30:15 UTC
+EPOCH = datetime(2024, 5, 3, 10, 30, 15, tzinfo=timezone.utc).timestamp()
+
+
+def _local(*args):
+    return datetime(*args).timestamp()
+
+
+@pytest.mark.parametrize(
+    "validade, esperado",
+    [
+        ("2024-05-03T10:30:15Z", EPOCH),
+        ("2024-05-03T07:30:15-03:00", EPOCH),
+        ("2024-05-03 10:30:15+00:00", EPOCH),
+        ("2024-05-03T10:30:15", _local(2024, 5, 3, 10, 30, 15)),
+        ("2024-05-03", _local(2024, 5, 3)),
+        # Com barras, mês primeiro como no pandas.to_datetime
+        ("05/03/2024 10:30:15", _local(2024, 5, 3, 10, 30, 15)),
+        ("05/03/2024 10:30", _local(2024, 5, 3, 10, 30)),
+        ("05/03/2024", _local(2024, 5, 3)),
+        # Dia primeiro só quando o primeiro campo não pode ser mês
+        ("25/03/2024 10:30:15", _local(2024, 3, 25, 10, 30, 15)),
+        ("25/03/2024 10:30", _local(2024, 3, 25, 10, 30)),
+        ("25/03/2024", _local(2024, 3, 25)),
+        (" 2024-05-03T10:30:15Z ", EPOCH),
+        (datetime(2024, 5, 3, 10, 30, 15, tzinfo=timezone.utc), EPOCH),
+        (EPOCH, EPOCH),
+        (int(EPOCH), EPOCH),
+        (int(EPOCH * 1e3), EPOCH),
+        (int(EPOCH * 1e6), EPOCH),
+        (int(EPOCH * 1e9), EPOCH),
+        (str(int(EPOCH)), EPOCH),
+        (str(int(EPOCH * 1e3)), EPOCH),
+    ],
+)
+def test_accepted_formats(validade, esperado):
+    assert validade_to_epoch(validade) == pytest.approx(esperado)
+
+
+@pytest.mark.parametrize("validade", ["", None, 0, "   "])
+def test_empty_is_none(validade):
+    assert validade_to_epoch(validade) is None
+
+
+@pytest.mark.parametrize("validade", ["amanhã", "13/13/2024", "2024-02-30", "05/03/24"])
+def test_unknown_format_is_none(validade):
+    assert validade_to_epoch(validade) is None
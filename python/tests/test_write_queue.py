@@ -0,0 +1,101 @@
+"""Testes da WriteQueue."""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from src.clients.client import Client
+from src.clients.write_queue import BulkResponseError, WriteQueue
+
+
+class RecordingClient:
+    """Cliente falso que grava os POSTs e responde com a função informada."""
+
+    def __init__(self, respond=None, gate=None):
+        self.posts = []
+        self._respond = respond or (lambda url, data: {"data": data})
+        self._gate = gate
+
+    def post(self, url, data, id, headers=None):
+        if self._gate is not None:
+            self._gate.wait()
+        self.posts.append((url, id, data))
+        return self._respond(url, data)
+
+
+def test_bulk_results_are_matched_to_items(server, token_manager):
+    with Client(token_manager, max_retries=1, retry_delay=0) as client:
+        with client.write_queue(batch_size=10, ordered=True) as writes:
+            futures = [
+                writes.submit(f"{server.url}/api/itens", {"n": n}, f"loja-{n % 2}")
+                for n in range(30)
+            ]
+            results = [future.result(5) for future in futures]
+            stats = writes.get_stats()
+
+    assert results == [{"data": {"n": n}} for n in range(30)]
+    assert stats["completed"] == 30
+    assert stats["requests"] < 30
+
+
+def test_bulk_response_with_wrong_item_count_fails_the_batch():
+    client = RecordingClient(lambda url, data: {"data": data["data"][:-1]})
+    with WriteQueue(client, max_in_flight=1, batch_size=5) as writes:
+        futures = [writes.submit("http://api/itens", {"n": n}, "loja") for n in range(3)]
+        writes.flush(5)
+        stats = writes.get_stats()
+
+    for future in futures:
+        with pytest.raises(BulkResponseError):
+            future.result(5)
+    assert stats["failed"] == 3
+    assert stats["completed"] == 0
+
+
+def test_bulk_error_response_fails_the_batch():
+    client = RecordingClient(lambda url, data: {"error": {"type": "invalid"}})
+    with WriteQueue(client, batch_size=5) as writes:
+        future = writes.submit("http://api/itens", {"n": 0}, "loja")
+        with pytest.raises(BulkResponseError) as error:
+            future.result(5)
+
+    assert error.value.response == {"error": {"type": "invalid"}}
+
+
+def test_ordered_sends_each_tenant_in_submission_order():
+    client = RecordingClient()
+    with WriteQueue(client, max_in_flight=4, ordered=True) as writes:
+        for n in range(50):
+            writes.submit("http://api/itens", {"n": n}, f"loja-{n % 3}")
+        writes.flush(5)
+
+    for tenant in ("loja-0", "loja-1", "loja-2"):
+        sent = [data["n"] for _, id, data in client.posts if id == tenant]
+        assert sent == sorted(sent)
+
+
+def test_full_queue_rejects_without_blocking_and_close_cancels_pending():
+    gate = threading.Event()
+    client = RecordingClient(gate=gate)
+    writes = WriteQueue(client, max_in_flight=1, max_pending=2)
+    first = writes.submit("http://api/itens", {"n": 0}, "loja")
+    second = writes.submit("http://api/itens", {"n": 1}, "loja")
+    deadline = time.monotonic() + 5
+    while writes.get_stats()["in_flight"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(queue.Full):
+        writes.submit("http://api/itens", {"n": 2}, "loja", block=False)
+
+    closer = threading.Thread(target=writes.close, kwargs={"cancel_pending": True})
+    closer.start()
+    gate.set()
+    closer.join(5)
+
+    assert first.result(5) == {"data": {"n": 0}}
+    assert second.cancelled()
+    assert writes.get_stats()["cancelled"] == 1
+    with pytest.raises(RuntimeError):
+        writes.submit("http://api/itens", {"n": 3}, "loja")